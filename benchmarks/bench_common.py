@@ -0,0 +1,163 @@
+"""
+Shared helpers for the offline benchmarks: a headless app, a throwaway
+library, generated PDFs and the in-process LLM stub server.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import llm_stub_server  # noqa: E402
+
+
+class BenchApp:
+    """Stands in for PaperCLIApp: logs, toasts and a serialized 'UI thread'."""
+
+    def __init__(self, verbose: bool = False):
+        self.verbose = verbose
+        self.logs = []
+        self._ui_lock = threading.RLock()
+
+    def _add_log(self, action: str, details: str):
+        self.logs.append((time.monotonic(), action, details))
+        if self.verbose:
+            print(f"[{action}] {details}")
+
+    def notify(self, message: str, severity: str = "information", **kwargs):
+        if self.verbose or severity == "error":
+            print(f"({severity}) {message}")
+
+    def call_from_thread(self, callback, *args, **kwargs):
+        with self._ui_lock:
+            return callback(*args, **kwargs)
+
+
+def _escape_pdf_text(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def write_text_pdf(path: str, pages):
+    """Write a minimal PDF whose pages contain the given lines of text."""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None]
+    font_id = 3
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    page_ids = []
+    for lines in pages:
+        stream = (
+            "BT /F1 10 Tf 50 750 Td 12 TL "
+            + " ".join(f"({_escape_pdf_text(line)}) '" for line in lines)
+            + " ET"
+        )
+        data = stream.encode("latin-1", "replace")
+        objects.append(
+            b"<< /Length %d >>\nstream\n" % len(data) + data + b"\nendstream"
+        )
+        content_id = len(objects)
+        objects.append(
+            (
+                "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                f"/Resources << /Font << /F1 {font_id} 0 R >> >> "
+                f"/Contents {content_id} 0 R >>"
+            ).encode()
+        )
+        page_ids.append(len(objects))
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    objects[1] = f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>".encode()
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        output += b"%010d 00000 n \n" % offset
+    output += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    with open(path, "wb") as f:
+        f.write(output)
+
+
+def make_sample_pdfs(directory: str, count: int, pages: int = 3):
+    """Generate ``count`` distinct text PDFs and return their paths."""
+    paths = []
+    for i in range(count):
+        lines_per_page = [
+            [f"Sample Paper {i}: Offline Benchmarking, page {page + 1}"]
+            + [
+                f"Section {page + 1}.{line}: recorded responses make LLM pipelines "
+                f"measurable without network access (paper {i})."
+                for line in range(40)
+            ]
+            for page in range(pages)
+        ]
+        path = os.path.join(directory, f"sample_{i:04d}.pdf")
+        write_text_pdf(path, lines_per_page)
+        paths.append(path)
+    return paths
+
+
+def parse_args(description: str, add_arguments=None):
+    """Parse benchmark options plus the stub server options."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        "--base-url",
+        help="use an already running OpenAI-compatible server instead of the in-process stub",
+    )
+    parser.add_argument("--model", default="gpt-4o")
+    parser.add_argument("--verbose", action="store_true")
+    llm_stub_server.add_arguments(parser)
+    if add_arguments:
+        add_arguments(parser)
+    return parser.parse_args()
+
+
+def setup_environment(args):
+    """Start the stub (unless --base-url) and create a throwaway library.
+
+    Returns (app, data_dir, stub config or None). Must run before any request
+    is made, since the shared OpenAI client reads OPENAI_BASE_URL.
+    """
+    config = None
+    if args.base_url:
+        os.environ["OPENAI_BASE_URL"] = args.base_url
+    else:
+        config = llm_stub_server.config_from_args(args)
+        server = llm_stub_server.start_server(config)
+        os.environ["OPENAI_BASE_URL"] = llm_stub_server.base_url(server)
+    os.environ.setdefault("OPENAI_API_KEY", "stub")
+    os.environ["OPENAI_MODEL"] = args.model
+    # Measure the pipeline, not the response cache
+    os.environ["PAPERCLI_LLM_CACHE"] = "false"
+
+    data_dir = tempfile.mkdtemp(prefix="papercli-bench-")
+    os.environ["PAPERCLI_DATA_DIR"] = data_dir
+
+    from ng.db.database import init_database
+
+    init_database(os.path.join(data_dir, "papers.db"))
+    return BenchApp(verbose=args.verbose), data_dir, config
+
+
+def report(label: str, count: int, elapsed: float, config=None, failed: int = 0):
+    """Print throughput and the LLM gateway counters."""
+    from ng.services import llm_gateway
+
+    rate = count / elapsed if elapsed else 0.0
+    print(f"{label}: {count} in {elapsed:.2f}s ({rate:.2f}/s), {failed} failed")
+    stats = llm_gateway.get_gateway().format_stats()
+    if stats:
+        print(stats)
+    if config is not None:
+        print(
+            f"stub: {config.stats['requests']} requests, "
+            f"{config.stats['rate_limited']} rate limited"
+        )
@@ -0,0 +1,172 @@
+"""
+Check PaperCLI's cold-start import cost against a budget.
+
+Imports ng.papercli in fresh interpreters under ``python -X importtime``,
+reports the median cumulative time and the slowest dependencies, and exits
+non-zero when the median exceeds the budget or a dependency that should load
+on first use (openai, playwright, PyPDF2, ...) is imported at startup.
+
+Each run also builds the services and command handlers that
+``PaperCLIApp.on_mount`` creates before the first frame, with a dummy
+OPENAI_API_KEY set, so a dependency loaded by a constructor is caught too.
+
+Usage:
+    python benchmarks/bench_import_time.py --runs 5 --budget-ms 1200
+"""
+
+import argparse
+import os
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must only be imported when the feature using them runs
+DEFERRED_MODULES = (
+    "alembic",
+    "bibtexparser",
+    "bs4",
+    "openai",
+    "playwright",
+    "PyPDF2",
+    "pyperclip",
+    "requests",
+    "rispy",
+    "tiktoken",
+)
+
+_LINE_PATTERN = re.compile(r"import time:\s+\d+\s+\|\s+(\d+)\s+\|\s*(\S+)")
+
+# What PaperCLIApp.on_mount builds before the first frame (the database is
+# created beforehand so the startup schema check takes its fast path)
+_HANDLERS_CODE = """
+import os
+from ng.commands import (
+    CollectionCommandHandler,
+    ExportCommandHandler,
+    PaperCommandHandler,
+    SearchCommandHandler,
+    SystemCommandHandler,
+)
+from ng.db.database import init_database
+from ng.papercli import PaperCLIApp
+from ng.services import (
+    AutoSyncService,
+    BackgroundOperationService,
+    MetadataExtractor,
+    PDFManager,
+    PDFService,
+    SystemService,
+)
+
+db_path = os.path.join(os.environ["PAPERCLI_DATA_DIR"], "papers.db")
+init_database(db_path)
+app = PaperCLIApp(db_path=db_path)
+app.background_service = BackgroundOperationService(app=app)
+app.pdf_manager = PDFManager(app=app)
+app.pdf_service = PDFService(app=app)
+app.metadata_extractor = MetadataExtractor(pdf_manager=app.pdf_manager, app=app)
+app.system_service = SystemService(pdf_manager=app.pdf_manager, app=app)
+app.auto_sync_service = AutoSyncService(app=app)
+for handler in (
+    SystemCommandHandler,
+    SearchCommandHandler,
+    PaperCommandHandler,
+    CollectionCommandHandler,
+    ExportCommandHandler,
+):
+    handler(app)
+"""
+
+
+def _import_once(module: str, env: dict, handlers: bool = False):
+    """Return (cumulative microseconds per imported module, loaded module names)."""
+    code = f"import sys, {module}\n"
+    if handlers:
+        code += _HANDLERS_CODE
+    code += "print(' '.join(sorted(sys.modules)))"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    timings = {}
+    for line in result.stderr.splitlines():
+        match = _LINE_PATTERN.match(line)
+        if match:
+            timings[match.group(2)] = int(match.group(1))
+    return timings, set(result.stdout.split())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--module", default="ng.papercli")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=1200,
+        help="fail if the median cumulative import time exceeds this",
+    )
+    parser.add_argument("--top", type=int, default=10, help="slowest imports to list")
+    parser.add_argument(
+        "--skip-handlers",
+        action="store_true",
+        help="only import the module, without building the command handlers",
+    )
+    args = parser.parse_args()
+
+    data_dir = tempfile.mkdtemp(prefix="papercli-import-")
+    env = {
+        **os.environ,
+        "PYTHONPATH": ROOT,
+        "PAPERCLI_DATA_DIR": data_dir,
+        "OPENAI_API_KEY": "sk-dummy",
+    }
+    handlers = not args.skip_handlers and args.module == "ng.papercli"
+    if handlers:
+        # Create the schema once, outside the measured runs
+        _import_once(args.module, env, handlers=True)
+
+    totals = []
+    slowest = {}
+    loaded = set()
+    for _ in range(max(1, args.runs)):
+        timings, modules = _import_once(args.module, env, handlers=handlers)
+        totals.append(timings[args.module] / 1000)
+        loaded |= modules
+        for name, micros in timings.items():
+            if "." not in name and name != args.module:
+                slowest[name] = max(slowest.get(name, 0), micros)
+
+    median = statistics.median(totals)
+    print(
+        f"import {args.module}: median {median:.0f} ms over {len(totals)} runs "
+        f"(min {min(totals):.0f} ms, budget {args.budget_ms:.0f} ms)"
+    )
+    for name, micros in sorted(slowest.items(), key=lambda item: -item[1])[: args.top]:
+        print(f"  {micros / 1000:8.1f} ms  {name}")
+
+    failures = []
+    if median > args.budget_ms:
+        failures.append(f"median {median:.0f} ms exceeds {args.budget_ms:.0f} ms")
+    eager = sorted(name for name in DEFERRED_MODULES if name in loaded)
+    if eager:
+        failures.append(f"imported at startup: {', '.join(eager)}")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    shutil.rmtree(data_dir, ignore_errors=True)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark bulk PDF import (copy, LLM metadata extraction, database update)
+against the recorded-response LLM stub.
+
+Usage:
+    python benchmarks/bench_pdf_import.py --papers 50 --workers 8 --latency 0.3
+"""
+
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import bench_common
+
+
+def _add_arguments(parser):
+    parser.add_argument("--papers", type=int, default=20)
+    parser.add_argument(
+        "--workers", type=int, default=4, help="PDFs imported concurrently"
+    )
+
+
+def main():
+    args = bench_common.parse_args(__doc__.split("\n\n")[0], _add_arguments)
+    app, data_dir, stub = bench_common.setup_environment(args)
+
+    from ng.services import (
+        AddPaperService,
+        MetadataExtractor,
+        PaperService,
+        PDFManager,
+        SystemService,
+    )
+
+    pdf_manager = PDFManager(app=app)
+    add_paper_service = AddPaperService(
+        PaperService(app=app),
+        MetadataExtractor(pdf_manager, app=app),
+        SystemService(pdf_manager, app=app),
+        app,
+    )
+    pdf_paths = bench_common.make_sample_pdfs(
+        tempfile.mkdtemp(prefix="papercli-bench-pdfs-"), args.papers
+    )
+
+    def import_one(path):
+        added = add_paper_service.add_pdf_paper_async(path)
+        result = add_paper_service.extract_and_update_pdf_metadata(
+            added["paper"].id, path
+        )
+        if not result.get("success"):
+            raise RuntimeError(result.get("error"))
+
+    failed = 0
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as executor:
+        futures = [executor.submit(import_one, path) for path in pdf_paths]
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                failed += 1
+                if args.verbose:
+                    print(f"Import failed: {e}")
+    elapsed = time.monotonic() - started
+
+    bench_common.report("PDF import", args.papers, elapsed, stub, failed)
+    print(f"library: {data_dir}")
+
+
+if __name__ == "__main__":
+    main()
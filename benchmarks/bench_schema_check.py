@@ -0,0 +1,81 @@
+"""
+Measure the startup schema check with and without the fast path.
+
+Each run initialises a throwaway library in a fresh interpreter, so Alembic's
+import cost is counted the way a real launch pays it. "Full" runs clear the
+stored schema fingerprint first, forcing the Alembic upgrade that every launch
+used to perform; "fast" runs hit the single-query check.
+
+Usage:
+    python benchmarks/bench_schema_check.py --runs 5
+"""
+
+import argparse
+import os
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_INIT_CODE = (
+    "import sys; from ng.db.database import init_database; "
+    "m = init_database(sys.argv[1]); "
+    "print(m.schema_check_seconds * 1000, int(m.schema_upgraded))"
+)
+
+
+def _init_once(db_path: str):
+    """Return (schema check milliseconds, whether Alembic ran)."""
+    result = subprocess.run(
+        [sys.executable, "-c", _INIT_CODE, db_path],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": ROOT},
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    elapsed, upgraded = result.stdout.split()[-2:]
+    return float(elapsed), upgraded == "1"
+
+
+def _forget_fingerprint(db_path: str) -> None:
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("PRAGMA user_version = 0")
+    finally:
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    db_path = os.path.join(tempfile.mkdtemp(prefix="papercli-bench-"), "papers.db")
+    _init_once(db_path)  # create the schema
+
+    full, fast = [], []
+    for _ in range(max(1, args.runs)):
+        _forget_fingerprint(db_path)
+        elapsed, upgraded = _init_once(db_path)
+        if not upgraded:
+            raise RuntimeError("expected Alembic to run without a fingerprint")
+        full.append(elapsed)
+
+        elapsed, upgraded = _init_once(db_path)
+        if upgraded:
+            raise RuntimeError("fast schema check did not skip Alembic")
+        fast.append(elapsed)
+
+    full_ms, fast_ms = statistics.median(full), statistics.median(fast)
+    print(f"Alembic upgrade:   median {full_ms:8.1f} ms over {len(full)} runs")
+    print(f"fast schema check: median {fast_ms:8.1f} ms over {len(fast)} runs")
+    print(f"saved per launch:  {full_ms - fast_ms:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Stress UI reads of the library database while a sync-style writer commits.
+
+Reader threads repeatedly load the paper list through PaperService, as the UI
+does after every change, while a writer thread applies batches of updates in
+explicit transactions through a raw connection, as SyncService and auto-sync
+do. Reports read latency, lock errors and completed write batches.
+
+Run it once with the default (WAL) storage profile and once with --no-wal to
+compare against a rollback journal.
+
+Usage:
+    python benchmarks/bench_sqlite_contention.py --papers 500 --seconds 10
+    python benchmarks/bench_sqlite_contention.py --papers 500 --seconds 10 --no-wal
+"""
+
+import argparse
+import os
+import sqlite3
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class _QuietApp:
+    """Minimal stand-in for the Textual app used by services for logging."""
+
+    def _add_log(self, action, details):
+        pass
+
+
+def _populate(paper_service, count: int) -> None:
+    for i in range(count):
+        paper_service.add_paper_from_metadata(
+            {
+                "title": f"Benchmark paper {i}",
+                "year": 2000 + i % 25,
+                "venue_full": "Conference on Benchmarks",
+                "paper_type": "conference",
+            },
+            [f"Author {i}", f"Coauthor {i % 50}"],
+            [f"Collection {i % 10}"],
+        )
+
+
+def _writer(db_path, stop, batch, hold, stats):
+    from ng.db import storage
+
+    conn = storage.connect(db_path)
+    try:
+        while not stop.is_set():
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.execute(
+                    "UPDATE papers SET notes = ? WHERE id IN "
+                    "(SELECT id FROM papers ORDER BY RANDOM() LIMIT ?)",
+                    (f"synced at {time.time()}", batch),
+                )
+                time.sleep(hold)  # Sync work done while holding the write lock
+                conn.commit()
+                stats["writes"] += 1
+            except sqlite3.OperationalError:
+                conn.rollback()
+                stats["write_errors"] += 1
+    finally:
+        conn.close()
+
+
+def _reader(paper_service, stop, latencies, stats):
+    while not stop.is_set():
+        started = time.perf_counter()
+        try:
+            paper_service.get_all_papers()
+        except Exception:
+            stats["read_errors"] += 1
+            continue
+        latencies.append(time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--papers", type=int, default=500)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--readers", type=int, default=2)
+    parser.add_argument("--batch", type=int, default=50, help="papers per write")
+    parser.add_argument(
+        "--hold-ms", type=float, default=20, help="time each write holds the lock"
+    )
+    parser.add_argument(
+        "--no-wal", action="store_true", help="use a rollback journal instead"
+    )
+    args = parser.parse_args()
+
+    if args.no_wal:
+        os.environ["PAPERCLI_SQLITE_WAL"] = "false"
+    data_dir = tempfile.mkdtemp(prefix="papercli-bench-")
+    os.environ["PAPERCLI_DATA_DIR"] = data_dir
+    db_path = os.path.join(data_dir, "papers.db")
+
+    from ng.db.database import init_database
+    from ng.services import PaperService
+
+    init_database(db_path)
+    paper_service = PaperService(app=_QuietApp())
+    _populate(paper_service, args.papers)
+
+    stop = threading.Event()
+    latencies = []
+    stats = {"writes": 0, "write_errors": 0, "read_errors": 0}
+    threads = [
+        threading.Thread(
+            target=_writer,
+            args=(db_path, stop, args.batch, args.hold_ms / 1000, stats),
+        )
+    ]
+    threads += [
+        threading.Thread(target=_reader, args=(paper_service, stop, latencies, stats))
+        for _ in range(args.readers)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(args.seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    journal = "rollback journal" if args.no_wal else "WAL"
+    print(f"{journal}: {args.papers} papers, {args.readers} readers, 1 writer")
+    if latencies:
+        ms = sorted(value * 1000 for value in latencies)
+        print(
+            f"reads:  {len(ms)} list loads, median {statistics.median(ms):.1f} ms, "
+            f"p95 {ms[int(len(ms) * 0.95) - 1]:.1f} ms, max {ms[-1]:.1f} ms, "
+            f"{stats['read_errors']} errors"
+        )
+    else:
+        print(f"reads:  none completed, {stats['read_errors']} errors")
+    print(f"writes: {stats['writes']} batches, {stats['write_errors']} errors")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark multi-paper summary generation (LLMSummaryService: bounded
+concurrency, bulk database save) against the recorded-response LLM stub.
+
+Usage:
+    python benchmarks/bench_summaries.py --papers 50 --concurrency 8 --latency 0.5
+"""
+
+import os
+import tempfile
+import threading
+import time
+
+import bench_common
+
+
+def _add_arguments(parser):
+    parser.add_argument("--papers", type=int, default=20)
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        help="summaries in flight (PAPERCLI_SUMMARY_CONCURRENCY)",
+    )
+
+
+def main():
+    args = bench_common.parse_args(__doc__.split("\n\n")[0], _add_arguments)
+    if args.concurrency:
+        os.environ["PAPERCLI_SUMMARY_CONCURRENCY"] = str(args.concurrency)
+    app, data_dir, stub = bench_common.setup_environment(args)
+
+    from ng.services import (
+        BackgroundOperationService,
+        LLMSummaryService,
+        PaperService,
+    )
+
+    paper_service = PaperService(app=app)
+    pdf_paths = bench_common.make_sample_pdfs(
+        tempfile.mkdtemp(prefix="papercli-bench-pdfs-"), args.papers
+    )
+    for i, path in enumerate(pdf_paths):
+        paper_service.add_paper(
+            {
+                "title": f"Sample Paper {i}: Offline Benchmarking",
+                "paper_type": "conference",
+                "pdf_path": path,
+            }
+        )
+    papers = paper_service.get_all_papers()
+
+    done = threading.Event()
+    outcome = {}
+
+    def on_all_complete(tracking):
+        outcome.update(tracking)
+        done.set()
+
+    summary_service = LLMSummaryService(
+        paper_service, BackgroundOperationService(app), app=app
+    )
+    started = time.monotonic()
+    tracking = summary_service.generate_summaries(
+        papers, on_all_complete=on_all_complete, operation_prefix="bench_summary"
+    )
+    if tracking is None:
+        print("No papers with PDFs to summarize")
+        return
+    done.wait()
+    elapsed = time.monotonic() - started
+
+    bench_common.report(
+        "Summaries", args.papers, elapsed, stub, len(outcome.get("failed", []))
+    )
+    print(f"library: {data_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Check that hot lookups are served by indexes, using EXPLAIN QUERY PLAN.
+
+ORM queries are captured from real service calls against a throwaway library,
+so a change in how a service filters (e.g. wrapping a column in a function)
+is caught. Raw SQL used by SyncService is checked verbatim. Exits non-zero
+if any query scans its table or sorts with a temporary b-tree instead of using
+the expected index.
+
+Usage:
+    python benchmarks/check_query_plans.py
+"""
+
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Raw statements issued by SyncService -> index expected in their plan
+SYNC_QUERIES = [
+    ("SELECT id FROM papers WHERE title = ?", "ix_papers_title"),
+    ("SELECT 1 FROM papers WHERE title = ? LIMIT 1", "ix_papers_title"),
+    ("SELECT uuid FROM papers WHERE title = ?", "ix_papers_title"),
+    ("SELECT id FROM authors WHERE full_name = ?", "ix_authors_full_name"),
+    (
+        "SELECT p.title, p.uuid FROM papers p "
+        "JOIN paper_collections pc ON p.id = pc.paper_id WHERE pc.collection_id = ?",
+        "ix_paper_collections_collection_id",
+    ),
+    (
+        "DELETE FROM paper_collections WHERE collection_id = ?",
+        "ix_paper_collections_collection_id",
+    ),
+]
+
+
+class _QuietApp:
+    """Minimal stand-in for the Textual app used by services for logging."""
+
+    def _add_log(self, action, details):
+        pass
+
+
+@contextmanager
+def _capture(engine):
+    """Collect (statement, parameters) for every query sent to the engine."""
+    from sqlalchemy import event
+
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+
+def _find(statements, marker: str):
+    for statement, parameters in statements:
+        if marker in statement:
+            return statement, parameters
+    raise LookupError(f"no captured statement contains {marker!r}")
+
+
+def _plan(engine, statement: str, parameters) -> list:
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        return [row[-1] for row in rows]
+
+
+def _orm_queries(engine):
+    """Run the services' hot paths and return (label, statement, params, index)."""
+    from ng.services import CollectionService, PaperService
+
+    papers = PaperService(app=_QuietApp())
+    papers.add_paper_from_metadata(
+        {"title": "Seed", "preprint_id": "arXiv 0000.0000", "doi": "10.0/seed"},
+        ["Ada Lovelace", "Alan Turing"],
+        ["Seed collection"],
+    )
+
+    queries = []
+    lookups = [
+        ({"title": "By preprint", "preprint_id": "arXiv 1"}, "papers.preprint_id ="),
+        ({"title": "By DOI", "doi": "10.1/doi"}, "papers.doi ="),
+        ({"title": "By title"}, "papers.title ="),
+    ]
+    for paper_data, marker in lookups:
+        with _capture(engine) as statements:
+            papers.add_paper_from_metadata(paper_data, ["Ada Lovelace"])
+        index = "ix_papers_" + marker.split(".")[1].split()[0]
+        queries.append((f"duplicate check {marker}", *_find(statements, marker), index))
+    queries.append(
+        (
+            "author lookup by full_name",
+            *_find(statements, "authors.full_name ="),
+            "ix_authors_full_name",
+        )
+    )
+
+    with _capture(engine) as statements:
+        papers.get_all_papers()
+    queries.append(
+        (
+            "paper list ORDER BY added_date DESC",
+            *_find(statements, "ORDER BY papers.added_date DESC"),
+            "ix_papers_added_date",
+        )
+    )
+
+    with _capture(engine) as statements:
+        CollectionService(app=_QuietApp()).purge_empty_collections()
+    queries.append(
+        (
+            "empty collection purge",
+            *_find(statements, "paper_collections"),
+            "ix_paper_collections_collection_id",
+        )
+    )
+    return queries
+
+
+def main():
+    data_dir = tempfile.mkdtemp(prefix="papercli-plans-")
+    os.environ["PAPERCLI_DATA_DIR"] = data_dir
+
+    from ng.db.database import init_database
+
+    engine = init_database(os.path.join(data_dir, "papers.db")).engine
+
+    queries = _orm_queries(engine)
+    queries += [(f"sync: {sql}", sql, ("x",), index) for sql, index in SYNC_QUERIES]
+
+    failures = 0
+    for label, statement, parameters, index in queries:
+        plan = _plan(engine, statement, parameters)
+        uses_index = any(index in step for step in plan)
+        sorts = any("TEMP B-TREE FOR ORDER BY" in step for step in plan)
+        ok = uses_index and not sorts
+        failures += not ok
+        print(f"{'ok  ' if ok else 'FAIL'}  {label}")
+        if not ok:
+            for step in plan:
+                print(f"        {step}")
+            print(f"        expected {index}")
+
+    print(f"{len(queries) - failures}/{len(queries)} queries use their index")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+Check how many SQL statements and result rows each paper read path costs.
+
+A throwaway library is filled with papers that each have several authors and
+collections, then every service call that loads papers with their
+relationships is run while statements are captured. Eagerly joining two
+collections multiplies rows (papers x authors x collections) and lazy loads
+issue one query per paper, so each call is held to a budget:
+
+- statements: a fixed number per loaded relationship, independent of the
+  number of papers (plus one per extra batch of ``IN`` parameters);
+- rows: no more than the rows of the papers, their author links, their
+  authors and their collections, i.e. linear in the library size.
+
+Rows are counted by re-running each captured SELECT as ``COUNT(*)``. Exits
+non-zero if any call exceeds its budget.
+
+Usage:
+    python benchmarks/check_sql_budget.py --papers 200 --authors 12 --collections 4
+"""
+
+import argparse
+import math
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Parameters SQLAlchemy puts in one selectin IN (...) query
+SELECTIN_BATCH = 500
+
+
+class _QuietApp:
+    """Minimal stand-in for the Textual app used by services for logging."""
+
+    def _add_log(self, action, details):
+        pass
+
+
+@contextmanager
+def _capture(engine):
+    """Collect (statement, parameters) for every query sent to the engine."""
+    from sqlalchemy import event
+
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+
+def _row_count(engine, statements) -> int:
+    """Return the rows the captured SELECT statements returned."""
+    total = 0
+    with engine.connect() as conn:
+        for statement, parameters in statements:
+            if not statement.lstrip().upper().startswith("SELECT"):
+                continue
+            counted = f"SELECT COUNT(*) FROM ({statement})"
+            total += conn.exec_driver_sql(counted, parameters).scalar()
+    return total
+
+
+def _populate(paper_service, papers: int, authors: int, collections: int) -> None:
+    for i in range(papers):
+        paper_service.add_paper_from_metadata(
+            {
+                "title": f"Budget paper {i}",
+                "year": 2000 + i % 25,
+                "venue_full": "Conference on Budgets",
+                "paper_type": "conference",
+            },
+            [f"Author {(i + j) % (papers + authors)}" for j in range(authors)],
+            [f"Collection {(i + j) % (collections * 3)}" for j in range(collections)],
+        )
+
+
+def _budget(loaded: int, authors: int, collections: int, relations: int):
+    """Return (max statements, max rows) for loading ``loaded`` papers."""
+    batches = max(1, math.ceil(loaded / SELECTIN_BATCH))
+    # Root query(s), then one batch per relationship level per IN batch
+    statements = 3 + relations * batches
+    # Papers, author links, authors (at most one per link) and collections
+    rows = loaded * (1 + 2 * authors + collections) + 3
+    return statements, rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--papers", type=int, default=200)
+    parser.add_argument("--authors", type=int, default=12, help="authors per paper")
+    parser.add_argument(
+        "--collections", type=int, default=4, help="collections per paper"
+    )
+    args = parser.parse_args()
+
+    data_dir = tempfile.mkdtemp(prefix="papercli-budget-")
+    os.environ["PAPERCLI_DATA_DIR"] = data_dir
+
+    from ng.db.database import init_database
+    from ng.services import PaperService, SearchService
+
+    engine = init_database(os.path.join(data_dir, "papers.db")).engine
+    paper_service = PaperService(app=_QuietApp())
+    search_service = SearchService(app=_QuietApp())
+    _populate(paper_service, args.papers, args.authors, args.collections)
+    oldest_id = paper_service.get_all_papers()[-1].id
+
+    # (label, call); every call loads paper_authors -> author and collections
+    calls = [
+        ("get_all_papers", paper_service.get_all_papers),
+        ("get_paper_by_id", lambda: [paper_service.get_paper_by_id(oldest_id)]),
+        ("search_papers title", lambda: search_service.search_papers("Budget")),
+        ("search_papers authors", lambda: search_service.search_papers("Author 1")),
+        (
+            "fuzzy_search_papers",
+            lambda: search_service.fuzzy_search_papers("Budget paper", threshold=0),
+        ),
+        ("filter_papers year", lambda: search_service.filter_papers({"year": 2001})),
+        (
+            "filter_papers collection",
+            lambda: search_service.filter_papers({"collection": "Collection 1"}),
+        ),
+        (
+            "filter_papers author",
+            lambda: search_service.filter_papers({"author": "Author 1"}),
+        ),
+        (
+            "add_paper_from_metadata",
+            lambda: [
+                paper_service.add_paper_from_metadata(
+                    {"title": "Budget paper added"},
+                    [f"Author {j}" for j in range(args.authors)],
+                    [f"Collection {j}" for j in range(args.collections)],
+                )
+            ],
+        ),
+    ]
+
+    print(
+        f"{args.papers} papers, {args.authors} authors and "
+        f"{args.collections} collections each"
+    )
+    failures = 0
+    for label, call in calls:
+        with _capture(engine) as statements:
+            loaded = call()
+        queries = [s for s in statements if s[0].lstrip().upper().startswith("SELECT")]
+        rows = _row_count(engine, queries)
+        max_statements, max_rows = _budget(
+            len(loaded), args.authors, args.collections, relations=3
+        )
+        if label == "add_paper_from_metadata":
+            # Up to three duplicate checks, one lookup per author, a lookup
+            # and membership check per collection, then the paper refresh
+            # and its collections before the relationships are reloaded
+            writes = 3 + args.authors + 2 * args.collections + 2
+            max_statements += writes
+            max_rows += writes + args.collections
+        ok = len(queries) <= max_statements and rows <= max_rows
+        failures += not ok
+        print(
+            f"{'ok  ' if ok else 'FAIL'}  {label}: {len(loaded)} papers, "
+            f"{len(queries)}/{max_statements} selects, {rows}/{max_rows} rows"
+        )
+
+    print(f"{len(calls) - failures}/{len(calls)} calls within budget")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,409 @@
+"""
+OpenAI-compatible stand-in server that replays recorded responses.
+
+Serves /v1/chat/completions (plain and streaming, including the final usage
+chunk requested with ``stream_options``), /v1/responses (streaming events) and
+/v1/models with the Python standard library only, so metadata extraction,
+summaries and chat can be exercised and benchmarked offline.
+
+Responses come from a JSON recordings file: a list of
+``{"match": "...", "content": "..."}`` rules, where the first rule whose
+``match`` substring occurs in the request messages wins (an empty ``match``
+is the fallback). ``{n}`` in ``content`` is replaced by a per-server request
+counter, so recorded metadata can yield distinct titles.
+
+Usage:
+    python benchmarks/llm_stub_server.py --port 8765 --latency 0.2
+    export OPENAI_BASE_URL=http://127.0.0.1:8765/v1 OPENAI_API_KEY=stub
+"""
+
+import argparse
+import itertools
+import json
+import os
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_RECORDINGS = os.path.join(os.path.dirname(__file__), "recordings.json")
+
+
+class StubConfig:
+    """Replay rules plus the latency and error behavior of the stub server."""
+
+    def __init__(
+        self,
+        recordings,
+        latency: float = 0.0,
+        chunk_delay: float = 0.0,
+        chunk_chars: int = 16,
+        rate_limit_every: int = 0,
+        rate_limit_rate: float = 0.0,
+        retry_after: float = 0.0,
+    ):
+        self.recordings = recordings
+        self.latency = latency
+        self.chunk_delay = chunk_delay
+        self.chunk_chars = max(1, chunk_chars)
+        self.rate_limit_every = rate_limit_every
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+
+        self._counter = itertools.count(1)
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "rate_limited": 0, "streams": 0}
+
+    def next_request(self) -> int:
+        with self._lock:
+            self.stats["requests"] += 1
+            return next(self._counter)
+
+    def count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def should_rate_limit(self, request_number: int) -> bool:
+        if self.rate_limit_every and request_number % self.rate_limit_every == 0:
+            return True
+        return bool(self.rate_limit_rate) and random.random() < self.rate_limit_rate
+
+    def reply_for(self, prompt: str, request_number: int) -> str:
+        for rule in self.recordings:
+            if rule.get("match", "") in prompt:
+                return rule["content"].replace("{n}", str(request_number))
+        return "OK"
+
+
+def load_recordings(path: str):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _prompt_text(body) -> str:
+    """Concatenate the text of all request messages for rule matching."""
+    messages = body.get("messages") or body.get("input") or []
+    if isinstance(messages, str):
+        return messages
+    parts = []
+    for message in messages:
+        content = message.get("content", "") if isinstance(message, dict) else message
+        if isinstance(content, list):
+            content = " ".join(
+                part.get("text", "") for part in content if isinstance(part, dict)
+            )
+        parts.append(str(content))
+    return "\n".join(parts)
+
+
+def _usage(prompt: str, reply: str):
+    prompt_tokens = max(1, len(prompt) // 4)
+    completion_tokens = max(1, len(reply) // 4)
+    return prompt_tokens, completion_tokens
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Request handler; the server's ``config`` attribute holds a StubConfig."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def config(self) -> StubConfig:
+        return self.server.config
+
+    def _send_json(self, status: int, payload, headers=None):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _start_event_stream(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+    def _send_event(self, payload, event: str = None):
+        prefix = f"event: {event}\n" if event else ""
+        data = payload if isinstance(payload, str) else json.dumps(payload)
+        self.wfile.write(f"{prefix}data: {data}\n\n".encode("utf-8"))
+        self.wfile.flush()
+
+    def _chunks(self, reply: str):
+        size = self.config.chunk_chars
+        for start in range(0, len(reply), size):
+            if self.config.chunk_delay:
+                time.sleep(self.config.chunk_delay)
+            yield reply[start : start + size]
+
+    def do_GET(self):
+        if self.path.rstrip("/").endswith("/models"):
+            models = sorted(
+                {"gpt-4o", "gpt-4o-mini", os.getenv("OPENAI_MODEL", "gpt-4o")}
+            )
+            self._send_json(
+                200,
+                {
+                    "object": "list",
+                    "data": [
+                        {"id": model, "object": "model", "owned_by": "stub"}
+                        for model in models
+                    ],
+                },
+            )
+        elif self.path.rstrip("/").endswith("/stats"):
+            self._send_json(200, self.config.stats)
+        else:
+            self._send_json(404, {"error": {"message": "Not found"}})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send_json(400, {"error": {"message": "Invalid JSON body"}})
+            return
+
+        request_number = self.config.next_request()
+        if self.config.latency:
+            time.sleep(self.config.latency)
+
+        if self.config.should_rate_limit(request_number):
+            self.config.count("rate_limited")
+            self._send_json(
+                429,
+                {
+                    "error": {
+                        "message": "Rate limit reached (stub)",
+                        "type": "requests",
+                        "code": "rate_limit_exceeded",
+                    }
+                },
+                headers={"Retry-After": str(self.config.retry_after)},
+            )
+            return
+
+        prompt = _prompt_text(body)
+        reply = self.config.reply_for(prompt, request_number)
+        model = body.get("model", "gpt-4o")
+
+        path = self.path.rstrip("/")
+        if path.endswith("/chat/completions"):
+            if body.get("stream"):
+                self._stream_chat_completion(body, model, prompt, reply)
+            else:
+                self._chat_completion(model, prompt, reply)
+        elif path.endswith("/responses"):
+            self._stream_response(model, prompt, reply)
+        else:
+            self._send_json(404, {"error": {"message": "Not found"}})
+
+    def _chat_completion(self, model: str, prompt: str, reply: str):
+        prompt_tokens, completion_tokens = _usage(prompt, reply)
+        self._send_json(
+            200,
+            {
+                "id": f"chatcmpl-{uuid.uuid4().hex}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": reply},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "total_tokens": prompt_tokens + completion_tokens,
+                },
+            },
+        )
+
+    def _stream_chat_completion(self, body, model: str, prompt: str, reply: str):
+        self.config.count("streams")
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        created = int(time.time())
+
+        def chunk(delta, finish_reason=None):
+            return {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [
+                    {"index": 0, "delta": delta, "finish_reason": finish_reason}
+                ],
+            }
+
+        self._start_event_stream()
+        self._send_event(chunk({"role": "assistant", "content": ""}))
+        for piece in self._chunks(reply):
+            self._send_event(chunk({"content": piece}))
+        self._send_event(chunk({}, "stop"))
+
+        if (body.get("stream_options") or {}).get("include_usage"):
+            prompt_tokens, completion_tokens = _usage(prompt, reply)
+            self._send_event(
+                {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": created,
+                    "model": model,
+                    "choices": [],
+                    "usage": {
+                        "prompt_tokens": prompt_tokens,
+                        "completion_tokens": completion_tokens,
+                        "total_tokens": prompt_tokens + completion_tokens,
+                    },
+                }
+            )
+        self._send_event("[DONE]")
+
+    def _stream_response(self, model: str, prompt: str, reply: str):
+        self.config.count("streams")
+        response_id = f"resp_{uuid.uuid4().hex}"
+        item_id = f"msg_{uuid.uuid4().hex}"
+        prompt_tokens, completion_tokens = _usage(prompt, reply)
+        response = {
+            "id": response_id,
+            "object": "response",
+            "created_at": int(time.time()),
+            "model": model,
+            "status": "in_progress",
+            "output": [],
+            "parallel_tool_calls": False,
+            "tool_choice": "auto",
+            "tools": [],
+        }
+        sequence = itertools.count()
+
+        def event(event_type, **fields):
+            payload = {"type": event_type, "sequence_number": next(sequence)}
+            payload.update(fields)
+            self._send_event(payload, event=event_type)
+
+        self._start_event_stream()
+        event("response.created", response=response)
+        for piece in self._chunks(reply):
+            event(
+                "response.output_text.delta",
+                item_id=item_id,
+                output_index=0,
+                content_index=0,
+                delta=piece,
+                logprobs=[],
+            )
+
+        message = {
+            "id": item_id,
+            "type": "message",
+            "role": "assistant",
+            "status": "completed",
+            "content": [{"type": "output_text", "text": reply, "annotations": []}],
+        }
+        completed = dict(response, status="completed", output=[message])
+        completed["usage"] = {
+            "input_tokens": prompt_tokens,
+            "input_tokens_details": {"cached_tokens": 0},
+            "output_tokens": completion_tokens,
+            "output_tokens_details": {"reasoning_tokens": 0},
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+        event("response.completed", response=completed)
+
+
+def start_server(
+    config: StubConfig, host: str = "127.0.0.1", port: int = 0
+) -> ThreadingHTTPServer:
+    """Start the stub in a daemon thread; port 0 picks a free port."""
+    server = ThreadingHTTPServer((host, port), StubHandler)
+    server.daemon_threads = True
+    server.config = config
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def base_url(server: ThreadingHTTPServer) -> str:
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}/v1"
+
+
+def add_arguments(parser: argparse.ArgumentParser):
+    """Stub options shared by this script and the benchmarks."""
+    parser.add_argument("--recordings", default=DEFAULT_RECORDINGS)
+    parser.add_argument(
+        "--latency", type=float, default=0.2, help="seconds before each response"
+    )
+    parser.add_argument(
+        "--chunk-delay",
+        type=float,
+        default=0.01,
+        help="seconds between streamed chunks",
+    )
+    parser.add_argument(
+        "--chunk-chars", type=int, default=16, help="characters per streamed chunk"
+    )
+    parser.add_argument(
+        "--rate-limit-every",
+        type=int,
+        default=0,
+        help="answer every Nth request with 429 (0 disables)",
+    )
+    parser.add_argument(
+        "--rate-limit-rate",
+        type=float,
+        default=0.0,
+        help="probability of answering a request with 429",
+    )
+    parser.add_argument(
+        "--retry-after",
+        type=float,
+        default=0.0,
+        help="Retry-After seconds sent with 429 responses",
+    )
+
+
+def config_from_args(args) -> StubConfig:
+    return StubConfig(
+        load_recordings(args.recordings),
+        latency=args.latency,
+        chunk_delay=args.chunk_delay,
+        chunk_chars=args.chunk_chars,
+        rate_limit_every=args.rate_limit_every,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    server = start_server(config_from_args(args), args.host, args.port)
+    print(f"Serving recorded responses at {base_url(server)} (Ctrl+C to stop)")
+    print(f"export OPENAI_BASE_URL={base_url(server)} OPENAI_API_KEY=stub")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""add indexes for hot lookups
+
+Revision ID: 4a897a068e50
+Revises: 10f8534b9062
+Create Date: 2026-10-18 23:05:12.418730
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4a897a068e50"
+down_revision: Union[str, Sequence[str], None] = "10f8534b9062"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns, unique)
+INDEXES = [
+    ("ix_papers_preprint_id", "papers", ["preprint_id"], False),
+    ("ix_papers_doi", "papers", ["doi"], False),
+    ("ix_papers_title", "papers", ["title"], False),
+    ("ix_papers_added_date", "papers", ["added_date"], False),
+    ("ix_authors_full_name", "authors", ["full_name"], True),
+    ("ix_paper_authors_author_id", "paper_authors", ["author_id"], False),
+    (
+        "ix_paper_collections_collection_id",
+        "paper_collections",
+        ["collection_id"],
+        False,
+    ),
+]
+
+# Lowest author id per name; the surviving row of each duplicate group
+_KEPT_AUTHORS = "SELECT MIN(id) FROM authors GROUP BY full_name"
+
+
+def _merge_duplicate_authors() -> None:
+    """Fold authors sharing a full_name into the oldest row before the unique index.
+
+    Sync inserted authors with INSERT OR IGNORE, which never ignored anything
+    without a unique constraint, so synced libraries accumulate duplicates.
+    """
+    for column in ("first_name", "last_name", "email", "affiliation"):
+        op.execute(
+            f"UPDATE authors SET {column} = (SELECT MAX(d.{column}) FROM authors d "
+            f"WHERE d.full_name = authors.full_name) "
+            f"WHERE {column} IS NULL AND id IN ({_KEPT_AUTHORS})"
+        )
+    op.execute(
+        "UPDATE OR IGNORE paper_authors SET author_id = ("
+        "SELECT MIN(k.id) FROM authors k JOIN authors a ON a.full_name = k.full_name "
+        "WHERE a.id = paper_authors.author_id) "
+        f"WHERE author_id NOT IN ({_KEPT_AUTHORS})"
+    )
+    # Rows left behind duplicated an existing (paper, author, position) entry
+    op.execute(f"DELETE FROM paper_authors WHERE author_id NOT IN ({_KEPT_AUTHORS})")
+    op.execute(f"DELETE FROM authors WHERE id NOT IN ({_KEPT_AUTHORS})")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _merge_duplicate_authors()
+    for name, table, columns, unique in INDEXES:
+        # Databases created by create_all() already have these indexes
+        op.create_index(name, table, columns, unique=unique, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _columns, _unique in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
@@ -5,7 +5,6 @@ from typing import TYPE_CHECKING, Any, Dict, List
 from pluralizer import Pluralizer
 
 from ng.commands import CommandHandler
-from ng.dialogs import ChatDialog
 from ng.services import ChatService, export, LLMSummaryService
 
 if TYPE_CHECKING:
@@ -121,6 +120,8 @@ class ExportCommandHandler(CommandHandler):
 
     async def handle_chat_command(self, provider: str = None):
         """Handle /chat command with optional provider."""
+        from ng.dialogs import ChatDialog
+
         papers_to_chat = self._get_target_papers()
         if not papers_to_chat:
             self.app.notify("No papers selected or under cursor", severity="warning")
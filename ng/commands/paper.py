@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-import os
 from typing import TYPE_CHECKING, Any, Dict, List
 
 from ng.commands import CommandHandler
 from ng.db.models import Paper
-from ng.dialogs import AddDialog, ConfirmDialog, DetailDialog, EditDialog
+from ng.dialogs import ConfirmDialog
 from ng.services import (
     AddPaperService,
     BackgroundOperationService,
@@ -13,6 +12,7 @@ from ng.services import (
     PDFDownloadHandler,
     PDFDownloadTaskFactory,
     PDFService,
+    snapshot_store,
     validation,
 )
 from pluralizer import Pluralizer
@@ -111,6 +111,95 @@ class PaperCommandHandler(CommandHandler):
             self.app.notify(f"Error adding paper: {str(e)}", severity="error")
             return False
 
+    def _handle_bulk_import(
+        self, source: str, path_id: str, add_method: callable
+    ) -> bool:
+        """Handle BibTeX/RIS imports: stream entries into the database, then fetch PDFs."""
+        last_reported = [0]
+
+        def on_import_progress(position, size, added_count):
+            if not size or position >= size:
+                return
+            percent = int(position * 100 / size)
+            # Report roughly every 10% of the file
+            if percent - last_reported[0] >= 10:
+                last_reported[0] = percent
+                self.app.call_from_thread(
+                    self.app.notify,
+                    f"Importing {source.upper()} file... {percent}% "
+                    f"({_pluralizer.pluralize('paper', added_count, True)} added)",
+                    severity="information",
+                )
+
+        def on_import_complete(result, error):
+            if error:
+                self.app.notify(f"Error adding paper: {str(error)}", severity="error")
+                return
+            papers, errors = result
+            self._on_bulk_import_complete(source, papers, errors)
+
+        self.background_service.run_operation(
+            lambda: add_method(path_id, on_progress=on_import_progress),
+            f"{source}_import",
+            f"Importing {source.upper()} file: {path_id}...",
+            on_import_complete,
+        )
+        return True
+
+    def _on_bulk_import_complete(
+        self, source: str, papers: List[Paper], errors: List[str]
+    ):
+        """Report a finished import and start the background PDF download phase."""
+        message = (
+            f"Imported {_pluralizer.pluralize('paper', len(papers), True)} "
+            f"from {source.upper()} file"
+        )
+        if errors:
+            message += f" ({_pluralizer.pluralize('error', len(errors), True)})"
+            for error in errors:
+                self.app._add_log(f"{source}_import_error", error)
+        self.app.notify(message, severity="warning" if errors else "information")
+        self.app.load_papers()
+
+        pending = [p for p in papers if p.url]
+        if not pending:
+            return
+
+        total = len(pending)
+        step = max(1, total // 10)
+
+        def on_progress(completed, total_count, paper, error):
+            if completed % step == 0 and completed < total_count:
+                self.app.call_from_thread(
+                    self.app.notify,
+                    f"Downloading PDFs... ({completed}/{total_count} completed)",
+                    severity="information",
+                )
+
+        def on_complete(result, error):
+            if error:
+                self.app.notify(f"PDF downloads failed: {error}", severity="error")
+                return
+            failed = len(result["failed"])
+            downloaded_text = _pluralizer.pluralize("PDF", result["downloaded"], True)
+            if failed:
+                self.app.notify(
+                    f"Downloaded {downloaded_text}, {failed} failed (see /log)",
+                    severity="warning",
+                )
+            else:
+                self.app.notify(f"Downloaded {downloaded_text}", severity="information")
+            self.app.load_papers()  # Reload to show PDF indicators
+
+        self.background_service.run_operation(
+            lambda: self.add_paper_service.download_pdfs_for_papers(
+                pending, on_progress=on_progress
+            ),
+            f"{source}_pdf_bulk_download",
+            f"Downloading {_pluralizer.pluralize('PDF', total, True)} in background...",
+            on_complete,
+        )
+
     def _handle_async_pdf_paper(self, source: str, path_id: str) -> bool:
         """Handle async PDF paper addition with background metadata extraction."""
         try:
@@ -230,11 +319,11 @@ class PaperCommandHandler(CommandHandler):
                 source_lower, path_id, self.add_paper_service.add_doi_paper
             )
         elif source_lower == "bib":
-            return self._handle_sync_paper(
+            return self._handle_bulk_import(
                 source_lower, path_id, self.add_paper_service.add_bib_papers
             )
         elif source_lower == "ris":
-            return self._handle_sync_paper(
+            return self._handle_bulk_import(
                 source_lower, path_id, self.add_paper_service.add_ris_papers
             )
         elif source_lower == "pdf":
@@ -274,6 +363,8 @@ class PaperCommandHandler(CommandHandler):
 
     async def handle_add_command(self, args: List[str]):
         """Handle /add command."""
+        from ng.dialogs import AddDialog
+
         if not args:
             # Show the add dialog if no arguments are provided
             add_dialog = AddDialog(self._handle_add_dialog_result, self.app)
@@ -294,6 +385,8 @@ class PaperCommandHandler(CommandHandler):
 
     async def handle_edit_command(self, args: List[str]):
         """Handle /edit command."""
+        from ng.dialogs import EditDialog
+
         papers_to_edit = self._get_target_papers()
         if not papers_to_edit:
             self.app.notify(
@@ -415,14 +508,7 @@ class PaperCommandHandler(CommandHandler):
 
     async def _open_html_file(self, paper: Paper):
         """Open HTML snapshot file for a paper."""
-        import os
-
-        from ng.db.database import get_db_manager
-
-        db_manager = get_db_manager()
-        data_dir = os.path.dirname(db_manager.db_path)
-        html_snapshot_dir = os.path.join(data_dir, "html_snapshots")
-        html_absolute_path = os.path.join(html_snapshot_dir, paper.html_snapshot_path)
+        html_absolute_path = snapshot_store.snapshot_path(paper.html_snapshot_path)
 
         success, error_message = self.app.system_service.open_file(
             html_absolute_path, "HTML snapshot"
@@ -439,6 +525,8 @@ class PaperCommandHandler(CommandHandler):
 
     async def handle_detail_command(self):
         """Handle /detail command."""
+        from ng.dialogs import DetailDialog
+
         papers_to_detail = self._get_target_papers()
         if not papers_to_detail:
             self.app.notify(
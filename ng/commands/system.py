@@ -4,13 +4,11 @@ import os
 from pathlib import Path
 from typing import TYPE_CHECKING, List
 
-import requests
-from openai import OpenAI
 from pluralizer import Pluralizer
 
 from ng.commands import CommandHandler
-from ng.dialogs import ConfigDialog, DoctorDialog, MessageDialog, SyncDialog
-from ng.services import DatabaseHealthService, constants, llm_utils
+from ng.dialogs import DoctorDialog, MessageDialog
+from ng.services import DatabaseHealthService, constants, llm_gateway, llm_utils
 from ng.version import VersionManager
 
 if TYPE_CHECKING:
@@ -54,12 +52,14 @@ class SystemCommandHandler(CommandHandler):
                 cleaned_records = self.db_health_service.clean_orphaned_records()
                 cleaned_pdfs = self.db_health_service.clean_orphaned_pdfs()
                 cleaned_htmls = self.db_health_service.clean_orphaned_htmls()
+                cleaned_texts = self.db_health_service.clean_orphaned_snapshot_texts()
                 fixed_paths = self.db_health_service.fix_absolute_pdf_paths()
                 renamed_files = self.db_health_service.clean_pdf_filenames()
 
                 total_cleaned_records = sum(cleaned_records.values())
                 total_cleaned_pdfs = sum(cleaned_pdfs.values())
                 total_cleaned_htmls = sum(cleaned_htmls.values())
+                total_cleaned_texts = sum(cleaned_texts.values())
                 total_fixed_paths = sum(fixed_paths.values())
                 total_renamed = sum(renamed_files.values())
 
@@ -67,6 +67,7 @@ class SystemCommandHandler(CommandHandler):
                     total_cleaned_records > 0
                     or total_cleaned_pdfs > 0
                     or total_cleaned_htmls > 0
+                    or total_cleaned_texts > 0
                     or total_fixed_paths > 0
                     or total_renamed > 0
                 ):
@@ -77,6 +78,8 @@ class SystemCommandHandler(CommandHandler):
                         details.append(f"PDF files: {total_cleaned_pdfs}")
                     if total_cleaned_htmls > 0:
                         details.append(f"HTML files: {total_cleaned_htmls}")
+                    if total_cleaned_texts > 0:
+                        details.append(f"Snapshot text files: {total_cleaned_texts}")
                     if total_fixed_paths > 0:
                         details.append(f"PDF paths: {total_fixed_paths}")
                     if total_renamed > 0:
@@ -99,6 +102,12 @@ class SystemCommandHandler(CommandHandler):
                                 "HTML file", total_cleaned_htmls, True
                             )
                         )
+                    if total_cleaned_texts > 0:
+                        cleanup_summary.append(
+                            self._pluralizer.pluralize(
+                                "snapshot text file", total_cleaned_texts, True
+                            )
+                        )
                     if total_fixed_paths > 0:
                         cleanup_summary.append(
                             self._pluralizer.pluralize("path", total_fixed_paths, True)
@@ -133,6 +142,7 @@ class SystemCommandHandler(CommandHandler):
                                         "records": total_cleaned_records,
                                         "pdfs": total_cleaned_pdfs,
                                         "htmls": total_cleaned_htmls,
+                                        "snapshot_texts": total_cleaned_texts,
                                         "paths": total_fixed_paths,
                                         "renamed": total_renamed,
                                     },
@@ -242,6 +252,11 @@ Notes:
         if html_count > 0:
             orphan_items.append(f"- **Orphaned HTML files:** {html_count:,}")
 
+        orphaned_texts = report.get("orphaned_snapshot_texts", {}).get("summary", {})
+        text_count = orphaned_texts.get("orphaned_text_files", 0)
+        if text_count > 0:
+            orphan_items.append(f"- **Orphaned snapshot text files:** {text_count:,}")
+
         absolute_paths = report.get("absolute_pdf_paths", {}).get("summary", {})
         absolute_count = absolute_paths.get("absolute_path_count", 0)
         if absolute_count > 0:
@@ -359,6 +374,19 @@ Notes:
                     f"- **HTML snapshots folder:** Does not exist (`{html_folder_path}`)"
                 )
 
+        # Add LLM request statistics for this session
+        llm_stats = llm_gateway.get_gateway().format_stats()
+        if llm_stats:
+            markdown_lines.extend(
+                [
+                    "",
+                    "## LLM Requests",
+                    "*OpenAI calls made this session, per call site*",
+                    "",
+                ]
+            )
+            markdown_lines.extend(f"- {line}" for line in llm_stats.splitlines())
+
         markdown_lines.extend(
             ["", "## System Health", "*Python environment and dependencies*", ""]
         )
@@ -443,6 +471,7 @@ Notes:
             or absolute_count > 0
             or pdf_count > 0
             or html_count > 0
+            or text_count > 0
         ):
             markdown_lines.extend(
                 [
@@ -516,6 +545,8 @@ Notes:
 
                     # Get release notes from GitHub
                     try:
+                        import requests
+
                         url = f"https://api.github.com/repos/{self.version_manager.github_repo}/releases/latest"
                         response = requests.get(url, timeout=10)
                         if response.status_code == 200:
@@ -636,6 +667,8 @@ Notes:
 
     def handle_config_command(self, args: List[str]):
         """Handle /config command for configuration management."""
+        from ng.dialogs import ConfigDialog
+
         # Check if using legacy command format
         if args:
             action = args[0].lower()
@@ -904,7 +937,7 @@ gpt-4                           - Standard GPT-4 model
 gpt-3.5-turbo                   - GPT-3.5 Turbo model (faster, cheaper)"""
 
             # Query OpenAI for available models
-            client = OpenAI(api_key=api_key)
+            client = llm_gateway.get_gateway().client
             models_response = client.models.list()
 
             # Filter for chat models and sort by ID
@@ -1363,6 +1396,8 @@ gpt-3.5-turbo                   - GPT-3.5 Turbo model (faster, cheaper)"""
 
     def handle_sync_command(self, args: List[str]):
         """Handle /sync command for synchronizing with remote storage."""
+        from ng.dialogs import SyncDialog
+
         try:
             # Get data directory path
             local_data_dir = Path(self.app.db_path).parent
@@ -3,34 +3,143 @@ Database initialization and connection management.
 """
 
 import os
+import re
+import sqlite3
+import time
+import zlib
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Generator, Optional
+from typing import Generator, Optional, Tuple
 
-from alembic import command
-from alembic.config import Config
-from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 
 import ng
+from ng.db import storage
 from ng.db.models import Base
 
+_REVISION_PATTERN = re.compile(r"^revision\b[^=]*=\s*[\"']([^\"']+)[\"']", re.M)
+_DOWN_REVISION_PATTERN = re.compile(r"^down_revision\b[^=]*=(.*)$", re.M)
+_QUOTED_PATTERN = re.compile(r"[\"']([^\"']+)[\"']")
+
+# DDL of every table and index except Alembic's own bookkeeping
+_SCHEMA_SQL_QUERY = (
+    "SELECT group_concat(sql, ';') FROM (SELECT sql FROM sqlite_master"
+    " WHERE sql IS NOT NULL AND name != 'alembic_version' ORDER BY name)"
+)
+# Alembic revision, stored fingerprint and live schema DDL in one round trip
+_SCHEMA_STATE_QUERY = (
+    "SELECT (SELECT version_num FROM alembic_version),"
+    " (SELECT user_version FROM pragma_user_version),"
+    f" ({_SCHEMA_SQL_QUERY})"
+)
+
+
+def find_alembic_config() -> Optional[Tuple[Path, Path]]:
+    """Return (alembic.ini, script directory), preferring the working directory."""
+    # Try to find alembic.ini in the current directory first (for development)
+    if os.path.exists("alembic.ini"):
+        return Path("alembic.ini"), Path("alembic")
+
+    # Look for it relative to the ng package (installed package)
+    ng_path = Path(ng.__file__).parent
+    if (ng_path / "alembic.ini").exists():
+        return ng_path / "alembic.ini", ng_path / "alembic"
+    return None
+
+
+@lru_cache(maxsize=None)
+def _head_revision(script_dir: str) -> Optional[str]:
+    """Read the head revision from migration scripts without importing Alembic."""
+    revisions, parents = set(), set()
+    for path in Path(script_dir, "versions").glob("*.py"):
+        text = path.read_text(encoding="utf-8")
+        revision = _REVISION_PATTERN.search(text)
+        if revision:
+            revisions.add(revision.group(1))
+        down_revision = _DOWN_REVISION_PATTERN.search(text)
+        if down_revision:
+            parents.update(_QUOTED_PATTERN.findall(down_revision.group(1)))
+    heads = revisions - parents
+    # Branched histories are left to Alembic
+    return heads.pop() if len(heads) == 1 else None
+
+
+def packaged_head_revision() -> Optional[str]:
+    """Return the head revision of the packaged migrations, if unambiguous."""
+    paths = find_alembic_config()
+    if paths is None:
+        return None
+    return _head_revision(str(paths[1].resolve()))
+
+
+def _schema_fingerprint(schema_sql: Optional[str]) -> int:
+    """Hash the schema DDL into a positive value that fits PRAGMA user_version."""
+    return zlib.crc32((schema_sql or "").encode("utf-8")) & 0x7FFFFFFF or 1
+
+
+def _read_schema_state(
+    db_path: str, remote: bool = False
+) -> Tuple[Optional[str], int, Optional[str]]:
+    """Return (alembic revision, stored fingerprint, schema DDL) for a database."""
+    conn = storage.connect(db_path, remote=remote)
+    try:
+        return conn.execute(_SCHEMA_STATE_QUERY).fetchone()
+    finally:
+        conn.close()
+
+
+def schema_is_current(db_path: str, remote: bool = False) -> bool:
+    """
+    Check with a single query whether a database is already at the packaged head.
+
+    The database must report the head revision in ``alembic_version`` and its
+    schema must still match the fingerprint recorded after the last migration
+    (see ``record_schema_fingerprint``). Any doubt returns False so the caller
+    falls back to a full Alembic upgrade.
+    """
+    head = packaged_head_revision()
+    if head is None or not os.path.exists(db_path):
+        return False
+    try:
+        revision, stored, schema_sql = _read_schema_state(db_path, remote=remote)
+    except sqlite3.Error:
+        # Typically no alembic_version table yet
+        return False
+    return revision == head and stored == _schema_fingerprint(schema_sql)
+
 
-def ensure_schema_current(db_path: str, silent: bool = False) -> bool:
+def record_schema_fingerprint(db_path: str, remote: bool = False) -> None:
+    """Store the current schema fingerprint after a successful migration."""
+    try:
+        conn = storage.connect(db_path, remote=remote)
+        try:
+            schema_sql = conn.execute(_SCHEMA_SQL_QUERY).fetchone()[0]
+            conn.execute(f"PRAGMA user_version = {_schema_fingerprint(schema_sql)}")
+            conn.commit()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        # Without a fingerprint the next start simply runs Alembic again
+        pass
+
+
+def ensure_schema_current(
+    db_path: str, silent: bool = False, remote: bool = False
+) -> bool:
     """
     Ensure database schema is up to date by adding any missing columns.
 
     Args:
         db_path: Path to the SQLite database file
         silent: If True, suppress print statements
+        remote: If True, open the database with the remote (sync) profile
 
     Returns:
         True if schema was updated or already current, False on error
     """
-    import sqlite3
-
     try:
-        conn = sqlite3.connect(db_path)
+        conn = storage.connect(db_path, remote=remote)
         cursor = conn.cursor()
 
         # Check if papers table exists
@@ -90,21 +199,26 @@ class DatabaseManager:
 
     def __init__(self, db_path: str):
         self.db_path = db_path
-        self.engine = create_engine(f"sqlite:///{db_path}")
-
-        # Enable foreign key constraints for SQLite
-        @event.listens_for(self.engine, "connect")
-        def set_sqlite_pragma(dbapi_connection, connection_record):
-            cursor = dbapi_connection.cursor()
-            cursor.execute("PRAGMA foreign_keys=ON")
-            cursor.close()
+        # Shared pooled engine with foreign keys, WAL and the storage profile
+        self.engine = storage.get_engine(db_path)
 
         self.SessionLocal = sessionmaker(
             autocommit=False, autoflush=True, bind=self.engine
         )
 
+        # Startup instrumentation filled in by create_tables()
+        self.schema_check_seconds = 0.0
+        self.schema_upgraded = False
+
     def create_tables(self) -> None:
         """Create all database tables using Alembic or fallback to direct creation."""
+        started = time.perf_counter()
+        if schema_is_current(self.db_path):
+            # Already at head: skip loading Alembic and the migration scripts
+            self.schema_check_seconds = time.perf_counter() - started
+            return
+
+        self.schema_upgraded = True
         # First try to use Alembic if available
         alembic_success = self._try_alembic_upgrade()
 
@@ -115,22 +229,20 @@ class DatabaseManager:
 
         # Always ensure schema is up to date (adds missing columns if needed)
         ensure_schema_current(self.db_path)
+        record_schema_fingerprint(self.db_path)
+        self.schema_check_seconds = time.perf_counter() - started
 
     def _try_alembic_upgrade(self) -> bool:
         """Try to upgrade using Alembic. Returns True if successful."""
         try:
-            # Try to find alembic.ini in the current directory first (for development)
-            alembic_ini_path: Optional[str | Path] = "alembic.ini"
-            alembic_dir: Optional[str | Path] = "alembic"
-
-            if not os.path.exists(str(alembic_ini_path)):
-                # Look for it relative to the ng package (installed package)
-                ng_path = Path(ng.__file__).parent
-                alembic_ini_path = ng_path / "alembic.ini"
-                alembic_dir = ng_path / "alembic"
-
-                if not alembic_ini_path.exists():
-                    return False
+            # Alembic is slow to import; load it only when migrating
+            from alembic import command
+            from alembic.config import Config
+
+            paths = find_alembic_config()
+            if paths is None:
+                return False
+            alembic_ini_path, alembic_dir = paths
 
             alembic_cfg = Config(str(alembic_ini_path))
             alembic_cfg.set_main_option("sqlalchemy.url", f"sqlite:///{self.db_path}")
@@ -6,7 +6,16 @@ import uuid
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Table, Text
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Table,
+    Text,
+)
 from sqlalchemy.orm import Mapped, declarative_base, mapped_column, relationship
 
 Base = declarative_base()
@@ -22,7 +31,10 @@ class PaperAuthor(Base):
         Integer, ForeignKey("papers.id", ondelete="CASCADE"), primary_key=True
     )
     author_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("authors.id", ondelete="CASCADE"), primary_key=True
+        Integer,
+        ForeignKey("authors.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
     )
     position: Mapped[int] = mapped_column(
         Integer, primary_key=True
@@ -39,6 +51,8 @@ paper_collections = Table(
     Base.metadata,
     Column("paper_id", Integer, ForeignKey("papers.id"), primary_key=True),
     Column("collection_id", Integer, ForeignKey("collections.id"), primary_key=True),
+    # The primary key only serves lookups by paper_id
+    Index("ix_paper_collections_collection_id", "collection_id"),
 )
 
 
@@ -48,7 +62,9 @@ class Author(Base):
     __tablename__ = "authors"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    full_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    full_name: Mapped[str] = mapped_column(
+        String(255), nullable=False, unique=True, index=True
+    )
     first_name: Mapped[Optional[str]] = mapped_column(String(100))
     last_name: Mapped[Optional[str]] = mapped_column(String(100))
     email: Mapped[Optional[str]] = mapped_column(String(255))
@@ -101,7 +117,7 @@ class Paper(Base):
         default=lambda: str(uuid.uuid4()),
         index=True,
     )
-    title: Mapped[str] = mapped_column(String(500), nullable=False)
+    title: Mapped[str] = mapped_column(String(500), nullable=False, index=True)
     abstract: Mapped[Optional[str]] = mapped_column(Text)
 
     # Venue information
@@ -118,9 +134,9 @@ class Paper(Base):
     paper_type: Mapped[Optional[str]] = mapped_column(String(50))
 
     # External identifiers
-    doi: Mapped[Optional[str]] = mapped_column(String(255))
+    doi: Mapped[Optional[str]] = mapped_column(String(255), index=True)
     preprint_id: Mapped[Optional[str]] = mapped_column(
-        String(100)
+        String(100), index=True
     )  # e.g., "arXiv 2505.15134"
     category: Mapped[Optional[str]] = mapped_column(String(50))  # e.g., "cs.LG"
     url: Mapped[Optional[str]] = mapped_column(String(500))  # General URL field
@@ -133,7 +149,9 @@ class Paper(Base):
     notes: Mapped[Optional[str]] = mapped_column(Text)
 
     # Metadata
-    added_date: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+    added_date: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.now, index=True
+    )
     modified_date: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.now, onupdate=datetime.now
     )
@@ -0,0 +1,113 @@
+"""
+SQLite storage profile shared by every connection to a PaperCLI database.
+
+The library database runs in WAL mode, so the UI keeps reading while the
+auto-sync thread or a background worker writes instead of failing with
+"database is locked". Every connection also waits ``busy_timeout`` for a
+competing writer and uses a larger page cache, memory-mapped reads and
+in-memory temp tables.
+
+Remote (sync) databases live in folders that other machines or cloud clients
+copy, and WAL needs shared memory that network filesystems do not provide, so
+they are kept in rollback-journal mode as single self-contained files.
+
+SQLAlchemy engines are shared per database file through ``get_engine``;
+raw ``sqlite3`` connections come from ``connect``.
+"""
+
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Tuple, Union
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+
+from ng.services import constants
+
+PathLike = Union[str, Path]
+
+_engines: Dict[Tuple[str, bool], Engine] = {}
+_engines_lock = threading.Lock()
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(0, int(os.getenv(name, str(default))))
+    except ValueError:
+        return default
+
+
+def is_wal_enabled() -> bool:
+    """Whether the library database uses WAL (PAPERCLI_SQLITE_WAL, default on)."""
+    value = os.getenv("PAPERCLI_SQLITE_WAL", "true")
+    value = value.strip().strip("'\"").lower()
+    return value not in {"0", "false", "no", "off"}
+
+
+def busy_timeout_ms() -> int:
+    return _env_int(
+        "PAPERCLI_SQLITE_BUSY_TIMEOUT_MS", constants.DEFAULT_SQLITE_BUSY_TIMEOUT_MS
+    )
+
+
+def profile_pragmas(remote: bool = False) -> Dict[str, Union[int, str]]:
+    """Return the PRAGMA settings applied to each new connection, in order."""
+    pragmas: Dict[str, Union[int, str]] = {"busy_timeout": busy_timeout_ms()}
+    if remote:
+        pragmas["journal_mode"] = "DELETE"
+    elif is_wal_enabled():
+        pragmas["journal_mode"] = "WAL"
+        # Durable at every checkpoint and never corrupts in WAL mode
+        pragmas["synchronous"] = "NORMAL"
+    cache_mb = _env_int("PAPERCLI_SQLITE_CACHE_MB", constants.DEFAULT_SQLITE_CACHE_MB)
+    pragmas["cache_size"] = -cache_mb * 1024  # Negative values are KiB
+    pragmas["temp_store"] = "MEMORY"
+    if not remote:
+        mmap_mb = _env_int("PAPERCLI_SQLITE_MMAP_MB", constants.DEFAULT_SQLITE_MMAP_MB)
+        pragmas["mmap_size"] = mmap_mb * 1024 * 1024
+    return pragmas
+
+
+def apply_profile(
+    dbapi_connection, remote: bool = False, foreign_keys: bool = False
+) -> None:
+    """Apply the storage profile to an open DB-API connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        if foreign_keys:
+            cursor.execute("PRAGMA foreign_keys=ON")
+        for name, value in profile_pragmas(remote).items():
+            try:
+                cursor.execute(f"PRAGMA {name}={value}")
+            except sqlite3.OperationalError:
+                # Switching journal mode needs a moment without other
+                # connections; the next connection tries again
+                if name != "journal_mode":
+                    raise
+    finally:
+        cursor.close()
+
+
+def connect(db_path: PathLike, remote: bool = False) -> sqlite3.Connection:
+    """Open a raw sqlite3 connection that uses the storage profile."""
+    conn = sqlite3.connect(str(db_path), timeout=busy_timeout_ms() / 1000)
+    apply_profile(conn, remote=remote)
+    return conn
+
+
+def get_engine(db_path: PathLike, remote: bool = False) -> Engine:
+    """Return the shared, pooled SQLAlchemy engine for a database file."""
+    key = (os.path.abspath(str(db_path)), remote)
+    with _engines_lock:
+        engine = _engines.get(key)
+        if engine is None:
+            engine = create_engine(f"sqlite:///{key[0]}")
+
+            @event.listens_for(engine, "connect")
+            def _on_connect(dbapi_connection, connection_record):
+                apply_profile(dbapi_connection, remote=remote, foreign_keys=True)
+
+            _engines[key] = engine
+        return engine
@@ -1,15 +1,51 @@
-from .add import AddDialog
-from .chat import ChatDialog
-from .collect import CollectDialog
-from .config import ConfigDialog
-from .confirm import ConfirmDialog
-from .detail import DetailDialog
-from .doctor import DoctorDialog
-from .edit import EditDialog
-from .filter import FilterDialog
-from .message import MessageDialog
-from .sort import SortDialog
-from .sync import SyncDialog
+import importlib
+from typing import TYPE_CHECKING
+
+# Dialog name -> defining module; imported on first access (see __getattr__)
+# so that dialogs and their dependencies load when first opened.
+_DIALOG_MODULES = {
+    "AddDialog": "add",
+    "ChatDialog": "chat",
+    "CollectDialog": "collect",
+    "ConfigDialog": "config",
+    "ConfirmDialog": "confirm",
+    "DetailDialog": "detail",
+    "DoctorDialog": "doctor",
+    "EditDialog": "edit",
+    "FilterDialog": "filter",
+    "MessageDialog": "message",
+    "SortDialog": "sort",
+    "SyncDialog": "sync",
+}
+
+
+def __getattr__(name: str):
+    """Import a dialog class on first access."""
+    if name not in _DIALOG_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{_DIALOG_MODULES[name]}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from .add import AddDialog
+    from .chat import ChatDialog
+    from .collect import CollectDialog
+    from .config import ConfigDialog
+    from .confirm import ConfirmDialog
+    from .detail import DetailDialog
+    from .doctor import DoctorDialog
+    from .edit import EditDialog
+    from .filter import FilterDialog
+    from .message import MessageDialog
+    from .sort import SortDialog
+    from .sync import SyncDialog
 
 __all__ = [
     "AddDialog",
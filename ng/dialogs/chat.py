@@ -1,10 +1,11 @@
 import os
 import re
+import threading
+import time
 from datetime import datetime
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
 import PyPDF2
-from ng.db.database import get_db_manager
 from ng.services import (
     BackgroundOperationService,
     ChatService,
@@ -17,6 +18,8 @@ from ng.services import (
     format_title_by_words,
     llm_utils,
     prompts,
+    retrieval,
+    snapshot_store,
     theme,
 )
 from pluralizer import Pluralizer
@@ -27,6 +30,9 @@ from textual.widgets import Button, Input, Markdown, Static
 
 _pluralizer = Pluralizer()
 
+# Seconds between markdown re-renders of a response while it streams
+_STREAM_FRAME_INTERVAL = 0.1
+
 
 class ChatDialog(ModalScreen):
     """A modal dialog for chat interactions with OpenAI."""
@@ -167,6 +173,10 @@ class ChatDialog(ModalScreen):
         self.pdf_start_page = 1
         self.pdf_end_page = self.default_pdf_pages_limit
         self.total_pdf_pages = 0
+        # Retrieval picks the relevant passages, so offer whole papers by default
+        self._default_to_all_pages = retrieval.is_enabled()
+        # Page range the map-reduce digests were last prepared for
+        self._digest_range = None
 
         # Services
         self.pdf_manager = PDFManager(self.app)
@@ -186,7 +196,19 @@ class ChatDialog(ModalScreen):
         self._thinking_content = ""
         self._input_tokens = 0
         self._output_tokens = 0
+        self._history_tokens = 0
+        # Turns before _history_start are folded into _history_summary
+        self._history_summary = ""
+        self._history_start = 0
+        self._compaction_running = False
+        self._history_generation = 0
         self._loading_animation_active = False
+        # Render state: one record per mounted history entry
+        self._rendered: List[Dict[str, Any]] = []
+        self._welcome_widget = None
+        self._pending_stream_content = None
+        self._stream_flush_scheduled = False
+        self._last_stream_render = 0.0
         self._loading_frames = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
         self._loading_frame_index = 0
 
@@ -252,7 +274,7 @@ class ChatDialog(ModalScreen):
             self._add_system_message("No papers selected for chat.")
             return
 
-        if not self.chat_service.openai_client:
+        if not self.chat_service.is_configured():
             self._add_system_message(
                 "OpenAI API key not configured. Set OPENAI_API_KEY environment variable."
             )
@@ -263,6 +285,11 @@ class ChatDialog(ModalScreen):
 
     def _initialize_chat_with_papers(self):
         """Initialize chat with paper details, generating summaries if needed (app version logic)."""
+        if self.chat_service.uses_digests(self.papers):
+            self._prepare_digests()
+            self._build_initial_chat_content()
+            return
+
         # Get papers that need summaries
         papers_needing_summaries = []
         for paper in self.papers:
@@ -274,13 +301,7 @@ class ChatDialog(ModalScreen):
                     and hasattr(paper, "html_snapshot_path")
                     and paper.html_snapshot_path
                 ):
-                    db_manager = get_db_manager()
-                    data_dir = os.path.dirname(db_manager.db_path)
-                    html_snapshot_dir = os.path.join(data_dir, "html_snapshots")
-                    html_absolute_path = os.path.join(
-                        html_snapshot_dir, paper.html_snapshot_path
-                    )
-                    if os.path.exists(html_absolute_path):
+                    if snapshot_store.snapshot_exists(paper.html_snapshot_path):
                         papers_needing_summaries.append(paper)
                 # Non-website papers: check for PDF
                 elif fields["pdf_path"]:
@@ -319,6 +340,49 @@ class ChatDialog(ModalScreen):
 
         self._build_initial_chat_content()
 
+    def _prepare_digests(self, on_ready=None):
+        """Condense papers into digests before answering over a large selection.
+
+        ``on_ready`` is called once the digests are ready (not on failure).
+        """
+        self.summary_in_progress = True
+        self._disable_buttons()
+        selection = _pluralizer.pluralize("paper", len(self.papers), True)
+        self._digest_range = (self.pdf_start_page, self.pdf_end_page)
+
+        def on_digests_complete(result, error):
+            self.summary_in_progress = False
+            self._enable_buttons()
+            if error:
+                self.app.notify(
+                    f"Failed to prepare paper digests: {error}", severity="error"
+                )
+                return
+            if result["failed"]:
+                self.app.notify(
+                    f"Could not digest {_pluralizer.pluralize('paper', result['failed'], True)}; "
+                    "using their abstracts instead",
+                    severity="warning",
+                )
+            else:
+                self.app.notify(
+                    f"Ready to chat with {selection}", severity="information"
+                )
+            if on_ready:
+                on_ready()
+
+        self.background_service.run_operation(
+            operation_func=lambda: self.chat_service.prepare_digests(
+                self.papers,
+                self.pdf_start_page,
+                self.pdf_end_page,
+                self.model_name,
+            ),
+            operation_name="chat_digests",
+            initial_message=f"Condensing {selection} for chat...",
+            on_complete=on_digests_complete,
+        )
+
     def _format_paper_info(self, paper, index):
         """Format paper information for display (app version logic)."""
         fields = dialog_utils.get_paper_fields(paper)
@@ -357,88 +421,148 @@ class ChatDialog(ModalScreen):
         self._update_display()
 
     def _update_display(self):
-        """Update the chat display with themed colors, markdown support, and selectable content."""
-        chat_container = self.query_one("#chat-history", VerticalScroll)
+        """Sync the chat display with the history, mounting each message once.
 
-        # Clear existing content
-        chat_container.remove_children()
+        Rendered messages are kept and only re-rendered when their content
+        changes, so updates cost the same in long conversations as in short ones.
+        """
+        chat_container = self.query_one("#chat-history", VerticalScroll)
 
         if not self.chat_history:
-            welcome_text = (
-                "# Chat Session\n\n"
-                "*No messages yet. Type your message below and press "
-                "**Enter** to send (or click Send button).*"
-            )
-            welcome_widget = Markdown(welcome_text)
-            welcome_widget.can_focus = True
-            chat_container.mount(welcome_widget)
-        else:
-            # No title needed - start directly with messages
-            pass
+            if self._welcome_widget is None:
+                chat_container.remove_children()
+                self._rendered = []
+                welcome_text = (
+                    "# Chat Session\n\n"
+                    "*No messages yet. Type your message below and press "
+                    "**Enter** to send (or click Send button).*"
+                )
+                self._welcome_widget = Markdown(welcome_text)
+                self._welcome_widget.can_focus = True
+                chat_container.mount(self._welcome_widget)
+            return
 
-            for i, entry in enumerate(self.chat_history):
-                if i > 0:
-                    # Add separator
-                    separator = Markdown("---")
-                    chat_container.mount(separator)
-
-                role = entry["role"]
-                content = entry["content"]
-
-                # Get theme-appropriate colors using theme service
-                if role == "user":
-                    role_color = theme.get_markup_color("accent", app=self.app)
-                    role_text = "⏵ User"
-                elif role == "assistant":
-                    role_color = theme.get_markup_color("success", app=self.app)
-                    role_text = f"⏵ Model ({self.model_name})"
-                elif role == "system":
-                    role_color = theme.get_markup_color("warning", app=self.app)
-                    role_text = "⏵ System"
-                elif role == "loading":
-                    role_color = theme.get_markup_color("info", app=self.app)
-                    role_text = content
-                    # For loading messages, just show the text
-                    loading_widget = Static(role_text, classes="chat-role-header")
-                    loading_widget.styles.color = role_color
-                    loading_widget.can_focus = True
-                    chat_container.mount(loading_widget)
-                    continue
-                elif role == "error":
-                    role_color = theme.get_markup_color("error", app=self.app)
-                    role_text = f"Error: {content}"
-                    # For error messages, just show the text
-                    error_widget = Static(role_text, classes="chat-role-header")
-                    error_widget.styles.color = role_color
-                    error_widget.can_focus = True
-                    chat_container.mount(error_widget)
-                    continue
-                else:
-                    # Unknown role, use default
-                    role_color = theme.get_markup_color("text", app=self.app)
-                    role_text = f"⏵ {role.capitalize()}"
+        if self._welcome_widget is not None:
+            self._welcome_widget.remove()
+            self._welcome_widget = None
 
-                # Create role header with themed color
-                role_header = Static(role_text, classes="chat-role-header")
-                role_header.styles.color = role_color
-                role_header.can_focus = True
-                chat_container.mount(role_header)
+        # Keep rendered messages up to the first one whose role changed
+        # (e.g. a failed response replaced by an error), remount the rest
+        keep = 0
+        for rendered, entry in zip(self._rendered, self.chat_history):
+            if rendered["role"] != entry["role"]:
+                break
+            keep += 1
+        for rendered in self._rendered[keep:]:
+            for widget in rendered["widgets"]:
+                widget.remove()
+        del self._rendered[keep:]
+
+        for rendered, entry in zip(self._rendered, self.chat_history):
+            if rendered["content"] != entry["content"]:
+                self._set_rendered_content(rendered, entry["content"])
+
+        for index in range(keep, len(self.chat_history)):
+            self._rendered.append(
+                self._mount_entry(chat_container, index, self.chat_history[index])
+            )
 
-                # Create content widget with markdown support
-                # Don't modify system content - let it render as-is
-                content_markdown = content
+        # Auto-scroll to the bottom
+        chat_container.scroll_end(animate=False)
 
-                content_widget = Markdown(content_markdown)
-                content_widget.can_focus = True
-                chat_container.mount(content_widget)
+    def _mount_entry(
+        self, chat_container: VerticalScroll, index: int, entry: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Mount the widgets for one history entry and return its render record."""
+        widgets = []
+        if index > 0:
+            # Add separator
+            widgets.append(Markdown("---"))
+
+        role = entry["role"]
+        content = entry["content"]
+        body = None
+
+        # Get theme-appropriate colors using theme service
+        if role in ("loading", "error"):
+            # Loading and error messages are shown as a single line of text
+            if role == "loading":
+                role_color = theme.get_markup_color("info", app=self.app)
+            else:
+                role_color = theme.get_markup_color("error", app=self.app)
+            line_widget = Static(
+                self._status_text(role, content), classes="chat-role-header"
+            )
+            line_widget.styles.color = role_color
+            line_widget.can_focus = True
+            widgets.append(line_widget)
+        else:
+            if role == "user":
+                role_color = theme.get_markup_color("accent", app=self.app)
+                role_text = "⏵ User"
+            elif role == "assistant":
+                role_color = theme.get_markup_color("success", app=self.app)
+                role_text = f"⏵ Model ({self.model_name})"
+            elif role == "system":
+                role_color = theme.get_markup_color("warning", app=self.app)
+                role_text = "⏵ System"
+            else:
+                # Unknown role, use default
+                role_color = theme.get_markup_color("text", app=self.app)
+                role_text = f"⏵ {role.capitalize()}"
+
+            # Create role header with themed color
+            role_header = Static(role_text, classes="chat-role-header")
+            role_header.styles.color = role_color
+            role_header.can_focus = True
+            widgets.append(role_header)
+
+            # Create content widget with markdown support
+            # Don't modify system content - let it render as-is
+            body = Markdown(content)
+            body.can_focus = True
+            widgets.append(body)
+
+        chat_container.mount(*widgets)
+        return {"role": role, "content": content, "widgets": widgets, "body": body}
+
+    @staticmethod
+    def _status_text(role: str, content: str) -> str:
+        return f"Error: {content}" if role == "error" else content
+
+    def _set_rendered_content(self, rendered: Dict[str, Any], content: str):
+        """Re-render one mounted message with new content."""
+        if rendered["body"] is not None:
+            rendered["body"].update(content)
+        else:
+            rendered["widgets"][-1].update(self._status_text(rendered["role"], content))
+        rendered["content"] = content
 
-        # Auto-scroll to the bottom
+    def _render_streaming_content(self, content: str):
+        """Show in-progress assistant content in its message widget."""
+        if self._rendered and self._rendered[-1]["body"] is self._streaming_widget:
+            self._set_rendered_content(self._rendered[-1], content)
+        else:
+            self._streaming_widget.update(content)
+        chat_container = self.query_one("#chat-history", VerticalScroll)
         chat_container.scroll_end(animate=False)
 
+    def _flush_streaming_content(self):
+        """Render the latest streamed content (at most once per frame interval)."""
+        self._stream_flush_scheduled = False
+        if self._pending_stream_content is None or not self._streaming_widget:
+            return
+        self._render_streaming_content(self._pending_stream_content)
+        self._pending_stream_content = None
+        self._last_stream_render = time.monotonic()
+
     def _refresh_chat_display(self):
         """Refresh chat display (used after summary generation)."""
         # Rebuild initial content with updated summaries
         self.chat_history = []  # Clear existing history
+        self._history_summary = ""
+        self._history_start = 0
+        self._history_generation += 1
         self._build_initial_chat_content()
 
     def _disable_buttons(self):
@@ -607,15 +731,25 @@ class ChatDialog(ModalScreen):
             quoted_thinking = self._format_thinking_content(thinking)
             display_content = f"> **◆ Thinking ◆**\n>\n{quoted_thinking}\n\n{content}"
 
-        if self._streaming_widget:
-            self._streaming_widget.update(display_content)
-            # Scroll to end
-            chat_container = self.query_one("#chat-history", VerticalScroll)
-            chat_container.scroll_end(animate=False)
-        else:
+        if not self._streaming_widget:
             self.app._add_log(
                 "chat_stream_error", "No streaming widget found for content update"
             )
+            return
+
+        # Markdown is re-parsed at most once per frame interval; the latest
+        # content is kept and rendered when the interval elapses
+        self._pending_stream_content = display_content
+        if self._stream_flush_scheduled:
+            return
+        elapsed = time.monotonic() - self._last_stream_render
+        if elapsed >= _STREAM_FRAME_INTERVAL:
+            self._flush_streaming_content()
+        else:
+            self._stream_flush_scheduled = True
+            self.set_timer(
+                _STREAM_FRAME_INTERVAL - elapsed, self._flush_streaming_content
+            )
 
     def _on_streaming_complete(
         self, final_content: str, final_thinking: str = ""
@@ -633,10 +767,16 @@ class ChatDialog(ModalScreen):
                         break
             except Exception:
                 self._streaming_widget = None
-        # Estimate output tokens
+        # Estimate output tokens, preferring the usage reported by the API
         self._output_tokens = self.chat_service.estimate_tokens(
             final_content, self.model_name
         )
+        usage = self.chat_service.last_usage
+        approx = "~"
+        if usage:
+            self._input_tokens = usage["input"]
+            self._output_tokens = usage["output"]
+            approx = ""
 
         # Build display content with thinking prepended if available
         display_content = final_content
@@ -647,7 +787,10 @@ class ChatDialog(ModalScreen):
             )
 
         # Add token info to response
-        final_content_with_tokens = f"{display_content}\n\n*(~{self._input_tokens} input tokens, ~{self._output_tokens} output tokens)*"
+        final_content_with_tokens = (
+            f"{display_content}\n\n*({approx}{self._input_tokens} input tokens "
+            f"(~{self._history_tokens} history), {approx}{self._output_tokens} output tokens)*"
+        )
 
         # Update chat history with final content
         if self.chat_history and self.chat_history[-1]["role"] == "assistant":
@@ -657,10 +800,9 @@ class ChatDialog(ModalScreen):
                 self.chat_history[-1]["thinking"] = final_thinking
 
         # Final widget update (fallback to full refresh if needed)
+        self._pending_stream_content = None
         if self._streaming_widget:
-            self._streaming_widget.update(final_content_with_tokens)
-            chat_container = self.query_one("#chat-history", VerticalScroll)
-            chat_container.scroll_end(animate=False)
+            self._render_streaming_content(final_content_with_tokens)
         else:
             self._update_display()
 
@@ -673,7 +815,7 @@ class ChatDialog(ModalScreen):
         )
         self.app._add_log(
             "chat_response",
-            f"LLM response completed: {response_preview} (~{self._input_tokens} input, ~{self._output_tokens} output tokens)",
+            f"LLM response completed: {response_preview} ({approx}{self._input_tokens} input, {approx}{self._output_tokens} output tokens)",
         )
 
         # Ensure we have some response
@@ -686,6 +828,44 @@ class ChatDialog(ModalScreen):
                     "chat_stream_warning", "Received empty response from LLM"
                 )
             self._update_display()
+            return
+
+        self._compact_history()
+
+    def _compact_history(self) -> None:
+        """Summarize older turns in the background once history grows too large."""
+        if self._compaction_running:
+            return
+        self._compaction_running = True
+        generation = self._history_generation
+        history = list(self.chat_history)
+        summary, start = self._history_summary, self._history_start
+
+        def compaction_worker():
+            try:
+                result = self.chat_service.compact_history(
+                    history, summary, start, self.model_name
+                )
+            except Exception as e:
+                result = None
+                self.app._add_log(
+                    "chat_compaction_error", f"History compaction failed: {e}"
+                )
+            self.app.call_from_thread(self._on_history_compacted, result, generation)
+
+        threading.Thread(target=compaction_worker, daemon=True).start()
+
+    def _on_history_compacted(self, result: Optional[Dict[str, Any]], generation: int):
+        """Apply a finished compaction unless the chat was reset meanwhile."""
+        self._compaction_running = False
+        if not result or generation != self._history_generation:
+            return
+        self._history_summary = result["summary"]
+        self._history_start = result["start"]
+        self.app.notify(
+            f"Compacted earlier chat turns (~{result['before']} → ~{result['after']} history tokens)",
+            severity="information",
+        )
 
     def _on_streaming_error(self, error_message: str) -> None:
         """Handle streaming errors."""
@@ -715,16 +895,9 @@ class ChatDialog(ModalScreen):
         if self.chat_history and self.chat_history[-1]["role"] == "assistant":
             self.chat_history[-1]["content"] = f"{spinner} Generating response..."
 
-            # Update the assistant Markdown widget directly if available
+            # Only the assistant message changed, so only it is re-rendered
             try:
-                if self._streaming_widget:
-                    self._streaming_widget.update(f"{spinner} Generating response...")
-                else:
-                    chat_container = self.query_one("#chat-history", VerticalScroll)
-                    for child in reversed(list(chat_container.children)):
-                        if isinstance(child, Markdown):
-                            child.update(f"{spinner} Generating response...")
-                            break
+                self._update_display()
             except Exception:
                 pass
 
@@ -740,6 +913,15 @@ class ChatDialog(ModalScreen):
         if not user_message:
             return
 
+        # Digests are per page range: condense for a new range, then send
+        page_range = (self.pdf_start_page, self.pdf_end_page)
+        if (
+            self.chat_service.uses_digests(self.papers)
+            and self._digest_range != page_range
+        ):
+            self._prepare_digests(on_ready=self._handle_send)
+            return
+
         # Add user message to history with PDF page range info if applicable
         user_content = user_message
         pdf_info_added = False
@@ -769,10 +951,18 @@ class ChatDialog(ModalScreen):
             self.papers,
             self.pdf_start_page,
             self.pdf_end_page,
+            model_name=self.model_name,
+            history_summary=self._history_summary,
+            history_start=self._history_start,
         )
-        total_input_text = " ".join([msg["content"] for msg in messages])
-        self._input_tokens = self.chat_service.estimate_tokens(
-            total_input_text, self.model_name
+        self._input_tokens = self.chat_service.estimate_message_tokens(
+            messages, self.model_name
+        )
+        self._history_tokens = self.chat_service.history_tokens(
+            self.chat_history,
+            self._history_summary,
+            self._history_start,
+            self.model_name,
         )
 
         self.chat_history.append({"role": "user", "content": user_content})
@@ -811,12 +1001,8 @@ class ChatDialog(ModalScreen):
         self._update_display()
 
         # Get reference to the assistant Markdown widget for updates
-        chat_container = self.query_one("#chat-history", VerticalScroll)
-        self._streaming_widget = None
-        for child in reversed(list(chat_container.children)):
-            if isinstance(child, Markdown):
-                self._streaming_widget = child
-                break
+        self._streaming_widget = self._rendered[-1]["body"] if self._rendered else None
+        self._pending_stream_content = None
 
         # Start spinner timer
         self.set_timer(0.1, self._update_loading_animation)
@@ -898,6 +1084,10 @@ class ChatDialog(ModalScreen):
                 start_input.placeholder = "1"
                 end_input.placeholder = str(self.total_pdf_pages)
 
+                if self._default_to_all_pages:
+                    self.pdf_end_page = self.total_pdf_pages
+                    self._default_to_all_pages = False
+
                 # Validate current values
                 if self.pdf_start_page > self.total_pdf_pages:
                     self.pdf_start_page = self.total_pdf_pages
@@ -146,6 +146,8 @@ class ConfigDialog(ModalScreen):
             "PAPERCLI_AUTO_SYNC": "false",
             "PAPERCLI_AUTO_SYNC_INTERVAL": "5",
             "PAPERCLI_PDF_PAGES": str(constants.DEFAULT_PDF_SUMMARY_PAGES),
+            "PAPERCLI_CHAT_HISTORY_TOKENS": str(constants.DEFAULT_CHAT_HISTORY_TOKENS),
+            "PAPERCLI_CHAT_KEEP_TURNS": str(constants.DEFAULT_CHAT_KEEP_TURNS),
             "PAPERCLI_THEME": "textual-dark",
         }
         self._load_available_models()
@@ -395,6 +397,39 @@ class ConfigDialog(ModalScreen):
                                 classes="form-input",
                             )
 
+                # Chat Tab
+                with TabPane("Chat", id="chat-tab"):
+                    with VerticalScroll():
+                        # History token threshold before older turns are summarized
+                        with Horizontal(classes="form-row"):
+                            yield Label(
+                                "Compact History At (tokens):", classes="form-label"
+                            )
+                            history_tokens = os.getenv(
+                                "PAPERCLI_CHAT_HISTORY_TOKENS",
+                                str(constants.DEFAULT_CHAT_HISTORY_TOKENS),
+                            )
+                            yield Input(
+                                value=history_tokens,
+                                placeholder=str(constants.DEFAULT_CHAT_HISTORY_TOKENS),
+                                id="chat-history-tokens-input",
+                                classes="form-input",
+                            )
+
+                        # Recent turns always sent verbatim
+                        with Horizontal(classes="form-row"):
+                            yield Label("Verbatim Recent Turns:", classes="form-label")
+                            keep_turns = os.getenv(
+                                "PAPERCLI_CHAT_KEEP_TURNS",
+                                str(constants.DEFAULT_CHAT_KEEP_TURNS),
+                            )
+                            yield Input(
+                                value=keep_turns,
+                                placeholder=str(constants.DEFAULT_CHAT_KEEP_TURNS),
+                                id="chat-keep-turns-input",
+                                classes="form-input",
+                            )
+
                 # Theme Tab
                 with TabPane("Theme", id="theme-tab"):
                     with VerticalScroll():
@@ -463,6 +498,8 @@ class ConfigDialog(ModalScreen):
                 "#auto-sync-interval-input", Input
             )
             pdf_pages_input = self.query_one("#pdf-pages-input", Input)
+            history_tokens_input = self.query_one("#chat-history-tokens-input", Input)
+            keep_turns_input = self.query_one("#chat-keep-turns-input", Input)
             theme_radio_set = self.query_one("#theme-radio-set", RadioSet)
 
             # Validate max tokens
@@ -489,6 +526,21 @@ class ConfigDialog(ModalScreen):
                 self.notify(f"PDF pages error: {error_msg}", severity="error")
                 return
 
+            # Validate chat history compaction settings
+            is_valid, error_msg, history_tokens = dialog_utils.validate_numeric_input(
+                history_tokens_input.value, min_val=500, input_type="int"
+            )
+            if not is_valid:
+                self.notify(f"Chat history tokens error: {error_msg}", severity="error")
+                return
+
+            is_valid, error_msg, keep_turns = dialog_utils.validate_numeric_input(
+                keep_turns_input.value, min_val=1, input_type="int"
+            )
+            if not is_valid:
+                self.notify(f"Chat recent turns error: {error_msg}", severity="error")
+                return
+
             # Validate auto-sync interval
             is_valid, error_msg, auto_sync_interval = (
                 dialog_utils.validate_numeric_input(
@@ -582,6 +634,17 @@ class ConfigDialog(ModalScreen):
             if str(pdf_pages) != os.getenv("PAPERCLI_PDF_PAGES", str(constants.DEFAULT_PDF_SUMMARY_PAGES)):
                 changes["PAPERCLI_PDF_PAGES"] = str(pdf_pages)
 
+            # Chat history compaction
+            if str(history_tokens) != os.getenv(
+                "PAPERCLI_CHAT_HISTORY_TOKENS",
+                str(constants.DEFAULT_CHAT_HISTORY_TOKENS),
+            ):
+                changes["PAPERCLI_CHAT_HISTORY_TOKENS"] = str(history_tokens)
+            if str(keep_turns) != os.getenv(
+                "PAPERCLI_CHAT_KEEP_TURNS", str(constants.DEFAULT_CHAT_KEEP_TURNS)
+            ):
+                changes["PAPERCLI_CHAT_KEEP_TURNS"] = str(keep_turns)
+
             # Theme
             selected_theme = None
             if theme_radio_set.pressed_button:
@@ -735,6 +798,13 @@ class ConfigDialog(ModalScreen):
             pdf_pages_input = self.query_one("#pdf-pages-input", Input)
             pdf_pages_input.value = self.default_config["PAPERCLI_PDF_PAGES"]
 
+            self.query_one("#chat-history-tokens-input", Input).value = (
+                self.default_config["PAPERCLI_CHAT_HISTORY_TOKENS"]
+            )
+            self.query_one("#chat-keep-turns-input", Input).value = self.default_config[
+                "PAPERCLI_CHAT_KEEP_TURNS"
+            ]
+
             # Reset theme radio buttons
             theme_radio_set = self.query_one("#theme-radio-set", RadioSet)
             default_theme = self.default_config["PAPERCLI_THEME"]
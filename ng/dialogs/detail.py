@@ -6,7 +6,13 @@ from ng.db.models import Paper
 from ng.dialogs.chat import ChatDialog
 from ng.dialogs.confirm import ConfirmDialog
 from ng.dialogs.edit import EditDialog
-from ng.services import PDFManager, PDFService, SystemService, format_file_size
+from ng.services import (
+    PDFManager,
+    PDFService,
+    SystemService,
+    format_file_size,
+    snapshot_store,
+)
 from pluralizer import Pluralizer
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal, VerticalScroll
@@ -135,15 +141,7 @@ class DetailDialog(ModalScreen):
                     hasattr(self.paper, "html_snapshot_path")
                     and self.paper.html_snapshot_path
                 ):
-                    from ng.db.database import get_db_manager
-
-                    db_manager = get_db_manager()
-                    data_dir = os.path.dirname(db_manager.db_path)
-                    html_snapshot_dir = os.path.join(data_dir, "html_snapshots")
-                    html_absolute_path = os.path.join(
-                        html_snapshot_dir, self.paper.html_snapshot_path
-                    )
-                    if os.path.exists(html_absolute_path):
+                    if snapshot_store.snapshot_exists(self.paper.html_snapshot_path):
                         html_button.disabled = False
                         folder_button.disabled = False
             except Exception:
@@ -208,14 +206,7 @@ class DetailDialog(ModalScreen):
                     and self.paper.html_snapshot_path
                 ):
                     return
-                from ng.db.database import get_db_manager
-
-                db_manager = get_db_manager()
-                data_dir = os.path.dirname(db_manager.db_path)
-                html_snapshot_dir = os.path.join(data_dir, "html_snapshots")
-                file_path = os.path.join(
-                    html_snapshot_dir, self.paper.html_snapshot_path
-                )
+                file_path = snapshot_store.snapshot_path(self.paper.html_snapshot_path)
                 file_type = "HTML snapshot"
             # For non-website papers, show PDF folder
             else:
@@ -248,14 +239,7 @@ class DetailDialog(ModalScreen):
             hasattr(self.paper, "html_snapshot_path") and self.paper.html_snapshot_path
         ):
             return
-        from ng.db.database import get_db_manager
-
-        db_manager = get_db_manager()
-        data_dir = os.path.dirname(db_manager.db_path)
-        html_snapshot_dir = os.path.join(data_dir, "html_snapshots")
-        html_absolute_path = os.path.join(
-            html_snapshot_dir, self.paper.html_snapshot_path
-        )
+        html_absolute_path = snapshot_store.snapshot_path(self.paper.html_snapshot_path)
         self._open_file(html_absolute_path, "HTML snapshot")
 
     def _open_file(self, file_path: str, file_type: str) -> None:
@@ -393,16 +377,7 @@ class DetailDialog(ModalScreen):
         if hasattr(paper, "html_snapshot_path") and paper.html_snapshot_path:
             content.append("## HTML Snapshot")
             # Get absolute path for HTML snapshot
-            import os
-
-            from ng.db.database import get_db_manager
-
-            db_manager = get_db_manager()
-            data_dir = os.path.dirname(db_manager.db_path)
-            html_snapshot_dir = os.path.join(data_dir, "html_snapshots")
-            html_absolute_path = os.path.join(
-                html_snapshot_dir, paper.html_snapshot_path
-            )
+            html_absolute_path = snapshot_store.snapshot_path(paper.html_snapshot_path)
 
             # Get file info
             if os.path.exists(html_absolute_path):
@@ -13,6 +13,7 @@ from ng.services import (
     PDFManager,
     WebpageSnapshotService,
     normalize_paper_data,
+    snapshot_store,
 )
 from pluralizer import Pluralizer
 from textual.app import ComposeResult
@@ -344,10 +345,7 @@ class EditDialog(ModalScreen):
         if not html_path:
             return ""
         # HTML snapshots are stored in html_snapshots folder
-        db_manager = get_db_manager()
-        data_dir = os.path.dirname(db_manager.db_path)
-        html_snapshot_dir = os.path.join(data_dir, "html_snapshots")
-        return os.path.join(html_snapshot_dir, html_path)
+        return snapshot_store.snapshot_path(html_path)
 
     def _normalize_html_snapshot_path(self, html_path: str) -> str:
         """Normalize an HTML snapshot path, converting absolute paths to relative."""
@@ -1045,10 +1043,7 @@ class EditDialog(ModalScreen):
                 return
 
             # Get absolute path
-            db_manager = get_db_manager()
-            data_dir = os.path.dirname(db_manager.db_path)
-            html_snapshot_dir = os.path.join(data_dir, "html_snapshots")
-            html_absolute_path = os.path.join(html_snapshot_dir, html_path)
+            html_absolute_path = snapshot_store.snapshot_path(html_path)
 
             if not os.path.exists(html_absolute_path):
                 self.error_display_callback(
@@ -1066,8 +1061,7 @@ class EditDialog(ModalScreen):
             def extract_from_html_operation():
                 """Extract metadata from HTML snapshot."""
                 # Read HTML content
-                with open(html_absolute_path, "r", encoding="utf-8") as f:
-                    html_content = f.read()
+                html_content = snapshot_store.read_snapshot(html_absolute_path)
 
                 # Extract metadata
                 metadata_extractor = MetadataExtractor(
@@ -1192,10 +1186,7 @@ class EditDialog(ModalScreen):
                 return
 
             # Get absolute path
-            db_manager = get_db_manager()
-            data_dir = os.path.dirname(db_manager.db_path)
-            html_snapshot_dir = os.path.join(data_dir, "html_snapshots")
-            html_absolute_path = os.path.join(html_snapshot_dir, html_path)
+            html_absolute_path = snapshot_store.snapshot_path(html_path)
 
             if not os.path.exists(html_absolute_path):
                 self.error_display_callback(
@@ -1209,7 +1200,9 @@ class EditDialog(ModalScreen):
                 extractor = MetadataExtractor(
                     pdf_manager=self.pdf_manager, app=self.parent_app
                 )
-                summary = extractor.generate_webpage_summary(html_path)
+                # An explicit Summarize regenerates; the fresh response
+                # replaces the cached one that automatic summaries reuse
+                summary = extractor.generate_webpage_summary(html_path, use_cache=False)
                 if not summary:
                     raise Exception("Failed to generate summary - empty response")
                 return {"summary": summary}
@@ -1301,7 +1294,9 @@ class EditDialog(ModalScreen):
             extractor = MetadataExtractor(
                 pdf_manager=self.pdf_manager, app=self.parent_app
             )
-            summary = extractor.generate_paper_summary(pdf_path)
+            # An explicit Summarize regenerates; the fresh response replaces
+            # the cached one that automatic summaries reuse
+            summary = extractor.generate_paper_summary(pdf_path, use_cache=False)
             if not summary:
                 raise Exception("Failed to generate summary - empty response")
             return {"summary": summary}
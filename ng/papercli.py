@@ -1,5 +1,6 @@
 import os
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
 
@@ -23,6 +24,8 @@ from ng.services import (
     PDFManager,
     PDFService,
     SystemService,
+    row_cache,
+    snapshot_store,
 )
 from ng.version import get_version
 from ng.widgets.command_input import CommandInput
@@ -71,18 +74,28 @@ class PaperCLIApp(App):
 
     def on_mount(self) -> None:
         # Initialize database
-        init_database(self.db_path)
+        db_manager = init_database(self.db_path)
+        self._log_schema_check(db_manager)
 
         # Load theme from environment
         saved_theme = os.getenv("PAPERCLI_THEME", "textual-dark")
         self.theme = saved_theme
 
-        # Load papers from the database
-        self.load_papers()
+        cached_rows = row_cache.load_rows(self.db_path)
+        if cached_rows:
+            # Paint last session's rows now; load the live papers in a worker
+            self.main_screen = MainScreen(papers=[], cached_rows=cached_rows)
+            self.push_screen(self.main_screen)
+            self.run_worker(
+                self._refresh_cached_papers, thread=True, exit_on_error=False
+            )
+        else:
+            # Load papers from the database
+            self.load_papers()
 
-        # Push MainScreen with initial papers and store reference
-        self.main_screen = MainScreen(papers=self.current_papers)
-        self.push_screen(self.main_screen)
+            # Push MainScreen with initial papers and store reference
+            self.main_screen = MainScreen(papers=self.current_papers)
+            self.push_screen(self.main_screen)
 
         # Initialize core services
         self.background_service = BackgroundOperationService(app=self)
@@ -93,6 +106,9 @@ class PaperCLIApp(App):
         )
         self.system_service = SystemService(pdf_manager=self.pdf_manager, app=self)
 
+        # Compress HTML snapshots saved by older versions
+        snapshot_store.start_migration(self)
+
         # Initialize auto-sync
         self.auto_sync_service = AutoSyncService(app=self)
         self.auto_sync_service.start_if_enabled()
@@ -107,6 +123,18 @@ class PaperCLIApp(App):
         # Set terminal title for supported terminals (iTerm2, xterm, etc.)
         self._set_terminal_title()
 
+    def _log_schema_check(self, db_manager) -> None:
+        """Record how long the startup schema check took."""
+        elapsed_ms = db_manager.schema_check_seconds * 1000
+        if db_manager.schema_upgraded:
+            details = f"Schema checked and migrated with Alembic in {elapsed_ms:.0f} ms"
+        else:
+            details = (
+                f"Schema already current ({elapsed_ms:.1f} ms); "
+                "skipped Alembic upgrade"
+            )
+        self._add_log("startup_schema", details)
+
     def _add_log(self, action: str, details: str):
         """Add a log entry and update log panel if visible."""
         self.logs.append(
@@ -152,6 +180,7 @@ class PaperCLIApp(App):
             papers = self.paper_service.get_all_papers()
             self.current_papers = papers
             self._add_log("load_papers", f"Loaded {len(papers)} papers from database")
+            row_cache.start_save(papers, self.db_path)
             # Update the PaperList widget - try stored reference first, then find it
             main_screen_to_update = self.main_screen
 
@@ -172,6 +201,42 @@ class PaperCLIApp(App):
         except Exception as e:
             self._add_log("load_papers_error", f"Error loading papers: {e}")
 
+    def _refresh_cached_papers(self) -> None:
+        """Load the live papers behind the cached first paint (worker thread)."""
+        started = time.perf_counter()
+        try:
+            papers = self.paper_service.get_all_papers()
+        except Exception as e:
+            self.call_from_thread(self._refresh_failed, e)
+            return
+        elapsed = time.perf_counter() - started
+        self.call_from_thread(self._apply_refreshed_papers, papers, elapsed)
+
+    def _refresh_failed(self, error: Exception) -> None:
+        """Drop the cached rows when the live papers could not be loaded."""
+        self._add_log("load_papers_error", f"Error loading papers: {error}")
+        paper_list = self.main_screen.query_one("#paper-list-view")
+        if not paper_list.is_refreshing:
+            return
+        # Cached rows have no papers behind them, so they must not stay up
+        self.main_screen.update_paper_list([])
+        self.load_papers()
+
+    def _apply_refreshed_papers(self, papers, elapsed: float) -> None:
+        """Replace the cached rows with the live papers."""
+        paper_list = self.main_screen.query_one("#paper-list-view")
+        if not paper_list.is_refreshing:
+            # A search or reload already replaced the cached rows
+            return
+        self.current_papers = papers
+        self._add_log(
+            "load_papers",
+            f"Loaded {len(papers)} papers from database in {elapsed * 1000:.0f} ms "
+            "(list painted from cache)",
+        )
+        self.main_screen.update_paper_list(papers)
+        row_cache.start_save(papers, self.db_path)
+
     def _set_terminal_title(self) -> None:
         if hasattr(self, "console") and self.console is not None:
             self.console.set_window_title(f"PaperCLI v{get_version()}")
@@ -1,12 +1,12 @@
-from typing import List
+from typing import List, Optional
 
 from textual.events import Key
 from textual.screen import Screen
 from textual.widgets import Footer, Input
 
 from ng.db.models import Paper
-from ng.dialogs import AddDialog, DetailDialog, FilterDialog, MessageDialog, SortDialog
-from ng.services import CollectionService
+from ng.dialogs import FilterDialog, MessageDialog, SortDialog
+from ng.services import CollectionService, row_cache
 from ng.widgets.command_input import CommandInput
 from ng.widgets.custom_header import CustomHeader
 from ng.widgets.log_panel import LogPanel
@@ -72,14 +72,21 @@ class MainScreen(Screen):
     }
     """
 
-    def __init__(self, papers: List[Paper], *args, **kwargs):
+    def __init__(
+        self,
+        papers: List[Paper],
+        *args,
+        cached_rows: Optional[List[row_cache.Row]] = None,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
         self.papers = papers
+        self.cached_rows = cached_rows
 
     def compose(self):
         custom_header = CustomHeader(app_ref=self.app, id="custom-header")
         yield custom_header
-        yield PaperList(self.papers, id="paper-list-view")
+        yield PaperList(self.papers, cached_rows=self.cached_rows, id="paper-list-view")
         yield CommandInput(
             app=self.app, placeholder="❯ Enter command...", id="command-input"
         )
@@ -140,6 +147,8 @@ class MainScreen(Screen):
 
     def _show_detail_dialog(self, paper) -> None:
         """Show details dialog for a paper."""
+        from ng.dialogs import DetailDialog
+
         if paper:
             self.app.push_screen(DetailDialog(paper, None))
         else:
@@ -176,8 +185,8 @@ class MainScreen(Screen):
             header = self.query_one("#custom-header")
             paper_list = self.query_one("#paper-list-view")
 
-            total_papers = len(paper_list.papers)
-            current_position = paper_list.cursor_row + 1 if paper_list.papers else 0
+            total_papers = paper_list.row_count
+            current_position = paper_list.cursor_row + 1 if total_papers else 0
 
             if paper_list.in_select_mode:
                 # In select mode: show actual selected count
@@ -186,7 +195,12 @@ class MainScreen(Screen):
                 # Not in select mode: always show 0 since no papers are selected
                 selected_count = 0
 
-            header.update_stats(total_papers, current_position, selected_count)
+            header.update_stats(
+                total_papers,
+                current_position,
+                selected_count,
+                refreshing=paper_list.is_refreshing,
+            )
         except Exception:
             pass  # Widgets might not be ready yet
 
@@ -242,6 +256,7 @@ class MainScreen(Screen):
 
     def action_show_add_dialog(self) -> None:
         """Show add paper dialog (F1)."""
+        from ng.dialogs import AddDialog
 
         def add_callback(result):
             if result:
@@ -3,8 +3,10 @@
 Ordered to avoid circular imports during module initialization.
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 # Level 1: Core utilities with no dependencies
-from . import http_utils
 from . import constants
 from .utils import fix_broken_lines, normalize_paper_data, sanitize_for_logging
 from .constants import (
@@ -14,9 +16,32 @@ from .constants import (
     DEFAULT_TEMPERATURE,
     DEFAULT_REASONING_EFFORT,
     DEFAULT_SHOW_THINKING,
+    DEFAULT_LLM_MAX_CONCURRENCY,
+    DEFAULT_LLM_TPM_LIMIT,
+    DEFAULT_LLM_MAX_RETRIES,
+    DEFAULT_SUMMARY_CONCURRENCY,
     DEFAULT_PDF_SUMMARY_PAGES,
     DEFAULT_PDF_METADATA_PAGES,
+    DEFAULT_PDF_IDENTIFIER_LOOKUPS,
     DEFAULT_HTML_MAX_CHARS,
+    DEFAULT_CHAT_CONTEXT_TOKENS,
+    DEFAULT_CHAT_HISTORY_TOKENS,
+    DEFAULT_CHAT_KEEP_TURNS,
+    DEFAULT_CHAT_MAP_REDUCE_PAPERS,
+    DEFAULT_CHAT_DIGEST_SOURCE_TOKENS,
+    DEFAULT_PDF_DOWNLOAD_WORKERS,
+    DEFAULT_PDF_DOWNLOAD_INTERVAL,
+    DEFAULT_SNAPSHOT_CONCURRENCY,
+    DEFAULT_SNAPSHOT_RECYCLE_PAGES,
+    DEFAULT_SNAPSHOT_ASSET_CONCURRENCY,
+    DEFAULT_SNAPSHOT_ASSET_MAX_KB,
+    DEFAULT_SNAPSHOT_IMAGE_MAX_KB,
+    DEFAULT_SNAPSHOT_ASSET_CACHE_MB,
+    DEFAULT_SNAPSHOT_ASSET_MAX_AGE_DAYS,
+    DEFAULT_LLM_CACHE_MB,
+    DEFAULT_SQLITE_BUSY_TIMEOUT_MS,
+    DEFAULT_SQLITE_CACHE_MB,
+    DEFAULT_SQLITE_MMAP_MB,
     DEFAULT_AUTO_SYNC,
     DEFAULT_AUTO_SYNC_INTERVAL,
     DEFAULT_THEME,
@@ -32,53 +57,122 @@ from .formatting import (
     format_download_speed,
 )
 
+# Levels 3-9 are imported on first access (see ``__getattr__``) so that
+# heavy dependencies such as openai, playwright, PyPDF2 and alembic load only
+# when a feature first needs them rather than before the first frame.
 # Level 3: Independent modules
-from . import validation
-from . import prompts
-from . import llm_utils
+_LAZY_MODULES = {
+    "http_utils",
+    "validation",
+    "prompts",
+    "llm_utils",
+    "llm_gateway",
+    "llm_cache",
+    "venue",
+    "retrieval",
+    "row_cache",
+    "snapshot_assets",
+    "snapshot_store",
+    "export",
+    "theme",
+    "dialog_utils",
+    "paper_tracker",
+}
 
-# Level 4: Metadata services (exposed early for aggregator use)
-from .metadata import MetadataExtractor
+# Exported name -> defining submodule
+_LAZY_ATTRIBUTES = {
+    # Level 4: Metadata services
+    "MetadataExtractor": "metadata",
+    # Level 5: PDF and snapshot services
+    "PDFManager": "pdf",
+    "PDFService": "pdf",
+    "PDFDownloadHandler": "pdf",
+    "PDFExtractionHandler": "pdf",
+    "PDFDownloadTaskFactory": "pdf",
+    "WebpageSnapshotService": "webpage",
+    # Level 6: Database services
+    "DatabaseHealthService": "database",
+    # Level 7: Background and infrastructure services
+    "BackgroundOperationService": "background",
+    "CollectionService": "collection",
+    "SearchService": "search",
+    # Level 8: Sync services
+    "SyncOperation": "sync",
+    "SyncConflict": "sync",
+    "SyncResult": "sync",
+    "SyncService": "sync",
+    "AutoSyncService": "auto_sync",
+    # Level 9: Higher-level services
+    "BulkImportIndex": "paper",
+    "PaperService": "paper",
+    "SystemService": "system",
+    "ChatService": "chat",
+    "LLMSummaryService": "llm",
+    "AddPaperService": "add_paper",
+}
 
-# Level 5: PDF and snapshot services (depends on formatting, http_utils, may reference metadata types)
-from .pdf import (
-    PDFManager,
-    PDFService,
-    PDFDownloadHandler,
-    PDFExtractionHandler,
-    PDFDownloadTaskFactory,
-)
-from .webpage import WebpageSnapshotService
 
-# Level 6: Database services (depends on formatting, pdf)
-from .database import DatabaseHealthService
+def __getattr__(name: str):
+    """Import lazily exported services and modules on first access."""
+    if name in _LAZY_MODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    elif name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
 
-# Level 7: Background and infrastructure services
-from .background import BackgroundOperationService
-from .collection import CollectionService
-from .search import SearchService
-from . import export
-from . import theme
-from . import dialog_utils
-from . import paper_tracker
 
-# Level 8: Sync services
-from .sync import SyncOperation, SyncConflict, SyncResult, SyncService
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
-# Level 8.5: Auto-sync (depends on SyncService)
-from .auto_sync import AutoSyncService
 
-# Level 9: Higher-level services (depend on services above)
-from .paper import PaperService
-from .system import SystemService
-from .chat import ChatService
-from .llm import LLMSummaryService
-from .add_paper import AddPaperService
+if TYPE_CHECKING:
+    from . import (
+        dialog_utils,
+        export,
+        http_utils,
+        llm_cache,
+        llm_gateway,
+        llm_utils,
+        paper_tracker,
+        prompts,
+        retrieval,
+        row_cache,
+        snapshot_assets,
+        snapshot_store,
+        theme,
+        validation,
+        venue,
+    )
+    from .add_paper import AddPaperService
+    from .auto_sync import AutoSyncService
+    from .background import BackgroundOperationService
+    from .chat import ChatService
+    from .collection import CollectionService
+    from .database import DatabaseHealthService
+    from .llm import LLMSummaryService
+    from .metadata import MetadataExtractor
+    from .paper import BulkImportIndex, PaperService
+    from .pdf import (
+        PDFDownloadHandler,
+        PDFDownloadTaskFactory,
+        PDFExtractionHandler,
+        PDFManager,
+        PDFService,
+    )
+    from .search import SearchService
+    from .sync import SyncConflict, SyncOperation, SyncResult, SyncService
+    from .system import SystemService
+    from .webpage import WebpageSnapshotService
 
 __all__ = [
     "AddPaperService",
     "BackgroundOperationService",
     "AutoSyncService",
+    "BulkImportIndex",
     "ChatService",
     "CollectionService",
     "DatabaseHealthService",
@@ -118,6 +212,13 @@ __all__ = [
     "paper_tracker",
     "prompts",
     "llm_utils",
+    "llm_gateway",
+    "llm_cache",
+    "venue",
+    "retrieval",
+    "row_cache",
+    "snapshot_assets",
+    "snapshot_store",
     "constants",
     # Application constants (from constants.py)
     "DEFAULT_CHAT_MODEL",
@@ -126,9 +227,32 @@ __all__ = [
     "DEFAULT_TEMPERATURE",
     "DEFAULT_REASONING_EFFORT",
     "DEFAULT_SHOW_THINKING",
+    "DEFAULT_LLM_MAX_CONCURRENCY",
+    "DEFAULT_LLM_TPM_LIMIT",
+    "DEFAULT_LLM_MAX_RETRIES",
+    "DEFAULT_SUMMARY_CONCURRENCY",
     "DEFAULT_PDF_SUMMARY_PAGES",
     "DEFAULT_PDF_METADATA_PAGES",
+    "DEFAULT_PDF_IDENTIFIER_LOOKUPS",
     "DEFAULT_HTML_MAX_CHARS",
+    "DEFAULT_CHAT_CONTEXT_TOKENS",
+    "DEFAULT_CHAT_HISTORY_TOKENS",
+    "DEFAULT_CHAT_KEEP_TURNS",
+    "DEFAULT_CHAT_MAP_REDUCE_PAPERS",
+    "DEFAULT_CHAT_DIGEST_SOURCE_TOKENS",
+    "DEFAULT_PDF_DOWNLOAD_WORKERS",
+    "DEFAULT_PDF_DOWNLOAD_INTERVAL",
+    "DEFAULT_SNAPSHOT_CONCURRENCY",
+    "DEFAULT_SNAPSHOT_RECYCLE_PAGES",
+    "DEFAULT_SNAPSHOT_ASSET_CONCURRENCY",
+    "DEFAULT_SNAPSHOT_ASSET_MAX_KB",
+    "DEFAULT_SNAPSHOT_IMAGE_MAX_KB",
+    "DEFAULT_SNAPSHOT_ASSET_CACHE_MB",
+    "DEFAULT_SNAPSHOT_ASSET_MAX_AGE_DAYS",
+    "DEFAULT_LLM_CACHE_MB",
+    "DEFAULT_SQLITE_BUSY_TIMEOUT_MS",
+    "DEFAULT_SQLITE_CACHE_MB",
+    "DEFAULT_SQLITE_MMAP_MB",
     "DEFAULT_AUTO_SYNC",
     "DEFAULT_AUTO_SYNC_INTERVAL",
     "DEFAULT_THEME",
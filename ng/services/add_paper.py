@@ -2,18 +2,23 @@ from __future__ import annotations
 
 import os
 import shutil
+import threading
+import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Tuple
 
 from ng.db.database import get_pdf_directory
 from ng.services import (
+    BulkImportIndex,
     MetadataExtractor,
     PaperService,
     PDFManager,
     PDFService,
     SystemService,
     WebpageSnapshotService,
+    constants,
     format_title_by_words,
     normalize_paper_data,
 )
@@ -375,7 +380,10 @@ class AddPaperService:
 
         # Create minimal paper entry first (will be updated with metadata later)
         paper_data = {
-            "title": "PDF Paper (extracting metadata...)",
+            # Named after the file so that several imports can be pending at once
+            "title": (
+                f"PDF Paper {os.path.basename(pdf_path)} (extracting metadata...)"
+            ),
             "abstract": "",
             "authors": ["Unknown"],
             "year": datetime.now().year,
@@ -516,8 +524,17 @@ class AddPaperService:
                 )
             return {"success": False, "error": error_msg}
 
-    def add_bib_papers(self, bib_path: str) -> Tuple[List[Paper], List[str]]:
-        """Add papers from .bib file."""
+    def add_bib_papers(
+        self,
+        bib_path: str,
+        on_progress: Callable[[int, int, int], None] | None = None,
+    ) -> Tuple[List[Paper], List[str]]:
+        """Add papers from .bib file.
+
+        Entries are streamed from disk and inserted in batches while parsing
+        continues. Only metadata is inserted; PDFs referenced by entry URLs are
+        fetched afterwards by ``download_pdfs_for_papers``.
+        """
         # Resolve path and do simple validation
         bib_path = self._resolve_path(bib_path)
         if not os.path.exists(bib_path) or not bib_path.lower().endswith(
@@ -525,125 +542,221 @@ class AddPaperService:
         ):
             raise Exception(f"Invalid BibTeX file: {bib_path}")
 
-        # Extract metadata from BibTeX file
-        papers_metadata = self.metadata_extractor.extract_from_bibtex(bib_path)
+        entries = self.metadata_extractor.iter_bibtex_entries(bib_path)
+        return self._import_entry_stream(entries, "bib", on_progress)
 
-        added_papers = []
-        errors = []
+    def add_ris_papers(
+        self,
+        ris_path: str,
+        on_progress: Callable[[int, int, int], None] | None = None,
+    ) -> Tuple[List[Paper], List[str]]:
+        """Add papers from .ris file.
+
+        Records are streamed from disk and inserted in batches while parsing
+        continues. Only metadata is inserted; PDFs referenced by entry URLs are
+        fetched afterwards by ``download_pdfs_for_papers``.
+        """
+        # Resolve path and do simple validation
+        ris_path = self._resolve_path(ris_path)
+        if not os.path.exists(ris_path) or not ris_path.lower().endswith(
+            (".ris", ".txt")
+        ):
+            raise Exception(f"Invalid RIS file: {ris_path}")
 
-        for metadata in papers_metadata:
-            try:
-                # Prepare and normalize paper data
-                paper_data = self._build_paper_data(metadata)
+        entries = self.metadata_extractor.iter_ris_entries(ris_path)
+        return self._import_entry_stream(entries, "ris", on_progress)
+
+    def _import_entry_stream(
+        self,
+        entries: Iterable[Dict[str, Any]],
+        source: str,
+        on_progress: Callable[[int, int, int], None] | None = None,
+        batch_size: int = 500,
+    ) -> Tuple[List[Paper], List[str]]:
+        """Insert streamed bibliography entries in bulk batches.
 
-                # Add to database first
-                authors = paper_data.get("authors", [])
-                collections = []
+        Args:
+            entries: Items from ``iter_bibtex_entries``/``iter_ris_entries``
+            source: Short source name used in logs ("bib" or "ris")
+            on_progress: Callback(bytes_read, total_bytes, added_count) after each batch
+            batch_size: Entries per bulk insert
 
-                paper = self.paper_service.add_paper_from_metadata(
-                    paper_data, authors, collections
+        Returns:
+            tuple[List[Paper], List[str]]: (added_papers, error_messages)
+        """
+        added_papers: List[Paper] = []
+        errors: List[str] = []
+        batch: List[Dict[str, Any]] = []
+        seen = 0
+        position = size = 0
+        # Scan the library for duplicates once, not once per batch
+        index = BulkImportIndex()
+
+        def flush():
+            if batch:
+                added, insert_errors = self.paper_service.add_papers_bulk(
+                    batch, index=index
                 )
+                added_papers.extend(added)
+                errors.extend(insert_errors)
+                batch.clear()
+            if on_progress:
+                on_progress(position, size, len(added_papers))
+
+        for item in entries:
+            position, size = item["position"], item["size"]
+            if item["error"]:
+                errors.append(item["error"])
                 if self.app:
-                    self.app._add_log(
-                        "paper_add_bib_entry",
-                        (
-                            "Added paper from BIB entry '"
-                            + paper_data.get("title", "Unknown Title")[:80]
-                            + f"...' (ID {paper.id})"
-                        ),
-                    )
-
-                # Try to download or process PDF if URL is provided
-                if metadata.get("url"):
-                    pdf_manager = PDFManager(app=self.app)
-
-                    try:
-                        pdf_path, pdf_error = pdf_manager.process_pdf_path(
-                            metadata["url"], paper_data
-                        )
-                        download_duration = (
-                            0.0  # process_pdf_path doesn't return duration
-                        )
-
-                        if pdf_path and not pdf_error:
-                            # process_pdf_path returns a relative path; ensure we store it as-is
-                            relative_pdf_path = pdf_path
-                            absolute_pdf_path = pdf_manager.get_absolute_path(
-                                relative_pdf_path
-                            )
-
-                            update_data = {"pdf_path": relative_pdf_path}
-                            updated_paper, update_error = (
-                                self.paper_service.update_paper(paper.id, update_data)
-                            )
-
-                            if not update_error and self.app:
-                                summary = PDFService(
-                                    app=self.app
-                                ).create_download_summary(
-                                    absolute_pdf_path, download_duration
-                                )
-                                preview = format_title_by_words(
-                                    paper_data.get("title", "") or ""
-                                )
-                                self.app.notify(
-                                    f"PDF available for '{preview}': {summary}",
-                                    severity="information",
-                                )
-
-                    except Exception as pdf_e:
-                        # Don't fail the entire paper addition if PDF download fails
-                        if self.app:
-                            self.app._add_log(
-                                "bib_pdf_warning",
-                                f"Could not download PDF for '{paper_data['title']}': {str(pdf_e)}",
-                            )
-
-                added_papers.append(paper)
+                    self.app._add_log(f"{source}_parse_warning", item["error"])
+                continue
 
+            metadata = item["metadata"]
+            seen += 1
+            try:
+                # Prepare and normalize paper data
+                paper_data = self._build_paper_data(metadata)
+                paper_data["authors"] = paper_data.get("authors") or []
+                batch.append(paper_data)
             except Exception as e:
                 errors.append(
                     f"Failed to add paper '{metadata.get('title', 'Unknown')}': {e}"
                 )
 
-        return added_papers, errors
+            if len(batch) >= batch_size:
+                flush()
 
-    def add_ris_papers(self, ris_path: str) -> Tuple[List[Paper], List[str]]:
-        """Add papers from .ris file."""
-        # Resolve path and do simple validation
-        ris_path = self._resolve_path(ris_path)
-        if not os.path.exists(ris_path) or not ris_path.lower().endswith(
-            (".ris", ".txt")
-        ):
-            raise Exception(f"Invalid RIS file: {ris_path}")
+        flush()
 
-        # Extract metadata from RIS file
-        papers_metadata = self.metadata_extractor.extract_from_ris(ris_path)
+        if self.app:
+            self.app._add_log(
+                f"paper_add_{source}",
+                f"Imported {len(added_papers)}/{seen} "
+                f"{source.upper()} entries ({len(errors)} skipped)",
+            )
 
-        added_papers = []
-        errors = []
+        return added_papers, errors
 
-        for metadata in papers_metadata:
-            try:
-                # Prepare and normalize paper data
-                paper_data = self._build_paper_data(metadata)
+    def download_pdfs_for_papers(
+        self,
+        papers: List[Paper],
+        on_progress: Callable[[int, int, Paper, str], None] | None = None,
+        max_workers: int | None = None,
+        min_interval: float | None = None,
+    ) -> Dict[str, Any]:
+        """Download PDFs for imported papers concurrently (background phase).
+
+        Each paper's ``url`` is fetched through ``PDFManager.process_pdf_path``
+        on a bounded worker pool. Download starts are spaced by ``min_interval``
+        seconds so publishers are not hammered, and each PDF path is written
+        back to the database as soon as its download lands.
 
-                # Add to database
-                authors = paper_data.get("authors", [])
-                collections = []
+        Args:
+            papers: Papers returned by the metadata-insert phase
+            on_progress: Callback(completed, total, paper, error) invoked from
+                worker threads after every paper
+            max_workers: Concurrent downloads (defaults to PAPERCLI_PDF_DOWNLOAD_WORKERS)
+            min_interval: Seconds between download starts
 
-                paper = self.paper_service.add_paper_from_metadata(
-                    paper_data, authors, collections
+        Returns:
+            dict: total/downloaded counts and a list of failure messages
+        """
+        candidates = [p for p in papers if p.url]
+        result: Dict[str, Any] = {
+            "total": len(candidates),
+            "downloaded": 0,
+            "failed": [],
+        }
+        if not candidates:
+            return result
+
+        if max_workers is None:
+            max_workers = int(
+                os.getenv(
+                    "PAPERCLI_PDF_DOWNLOAD_WORKERS",
+                    str(constants.DEFAULT_PDF_DOWNLOAD_WORKERS),
                 )
+            )
+        if min_interval is None:
+            min_interval = constants.DEFAULT_PDF_DOWNLOAD_INTERVAL
+        max_workers = max(1, max_workers)
+
+        if self.app:
+            self.app._add_log(
+                "bulk_pdf_download_start",
+                f"Downloading {len(candidates)} PDF(s) with {max_workers} worker(s)",
+            )
 
-                added_papers.append(paper)
+        lock = threading.Lock()
+        next_start = [time.monotonic()]
+        completed = [0]
+
+        def wait_for_slot():
+            with lock:
+                now = time.monotonic()
+                start_at = max(now, next_start[0])
+                next_start[0] = start_at + min_interval
+            delay = start_at - now
+            if delay > 0:
+                time.sleep(delay)
+
+        def download_one(paper: Paper) -> str:
+            wait_for_slot()
+            naming_data = {
+                "title": paper.title,
+                "authors": [a.full_name for a in paper.get_ordered_authors()],
+                "year": paper.year,
+            }
+            pdf_manager = PDFManager(app=self.app)
+            pdf_path, pdf_error = pdf_manager.process_pdf_path(paper.url, naming_data)
+            if pdf_error or not pdf_path:
+                return pdf_error or "Unknown PDF download error"
 
-            except Exception as e:
-                errors.append(
-                    f"Failed to add paper '{metadata.get('title', 'Unknown')}': {e}"
-                )
+            _, update_error = self.paper_service.update_paper(
+                paper.id, {"pdf_path": pdf_path}
+            )
+            return update_error
 
-        return added_papers, errors
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(download_one, p): p for p in candidates}
+            for future in as_completed(futures):
+                paper = futures[future]
+                try:
+                    error = future.result()
+                except Exception as e:
+                    error = str(e)
+
+                with lock:
+                    completed[0] += 1
+                    done = completed[0]
+                    if error:
+                        result["failed"].append(
+                            f"{format_title_by_words(paper.title or '')}: {error}"
+                        )
+                    else:
+                        result["downloaded"] += 1
+
+                if self.app:
+                    if error:
+                        self.app._add_log(
+                            "bulk_pdf_download_warning",
+                            f"Could not download PDF for '{paper.title}': {error}",
+                        )
+                    else:
+                        self.app._add_log(
+                            "bulk_pdf_download_success",
+                            f"Stored PDF for paper {paper.id} ({done}/{len(candidates)})",
+                        )
+                if on_progress:
+                    on_progress(done, len(candidates), paper, error)
+
+        if self.app:
+            self.app._add_log(
+                "bulk_pdf_download_complete",
+                f"Downloaded {result['downloaded']}/{result['total']} PDF(s), "
+                f"{len(result['failed'])} failed",
+            )
+        return result
 
     def add_doi_paper(self, doi: str) -> Dict[str, Any]:
         """Add a paper from DOI."""
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import os
-import sqlite3
 import threading
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from ng.db import storage
 from ng.services import SyncService
 from pluralizer import Pluralizer
 
@@ -221,7 +221,7 @@ class AutoSyncService:
 
     def _has_pending_metadata_extractions(self, db_path: Path) -> bool:
         try:
-            conn = sqlite3.connect(str(db_path))
+            conn = storage.connect(db_path)
             cursor = conn.cursor()
             cursor.execute(
                 "SELECT COUNT(1) FROM papers WHERE title LIKE ?",
@@ -239,7 +239,7 @@ class AutoSyncService:
 
     def _count_pending_metadata(self, db_path: Path) -> int:
         try:
-            conn = sqlite3.connect(str(db_path))
+            conn = storage.connect(db_path)
             cursor = conn.cursor()
             cursor.execute(
                 "SELECT COUNT(1) FROM papers WHERE title LIKE ?",
@@ -1,23 +1,52 @@
 from __future__ import annotations
 
+import hashlib
 import os
 import threading
 import time
 import traceback
 import webbrowser
-from typing import TYPE_CHECKING, Any, Callable, Dict, List
-
-import PyPDF2
-import tiktoken
-from bs4 import BeautifulSoup
-from ng.db.database import get_db_manager
-from ng.services import PDFManager, dialog_utils, llm_utils, prompts, sanitize_for_logging
-from openai import OpenAI
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from ng.services import (
+    PDFManager,
+    constants,
+    dialog_utils,
+    llm_gateway,
+    llm_utils,
+    prompts,
+    retrieval,
+    sanitize_for_logging,
+    snapshot_store,
+)
 from pluralizer import Pluralizer
 
 if TYPE_CHECKING:
     from ng.db.models import Paper
 
+# Token counts kept per text chunk (paper context, page text, history message)
+_TOKEN_COUNT_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=16)
+def _get_encoding(model_name: str):
+    """Return the tiktoken encoding for a model, loaded once per model.
+
+    Returns None if no encoding can be loaded (e.g. offline on first use).
+    """
+    import tiktoken
+
+    try:
+        return tiktoken.encoding_for_model(model_name.lower())
+    except Exception:
+        try:
+            return tiktoken.get_encoding("cl100k_base")
+        except Exception:
+            return None
+
 
 class ChatService:
     """Service for chat functionality."""
@@ -26,15 +55,23 @@ class ChatService:
         self.app = app
         self.pdf_manager = PDFManager(app=self.app)
         self._pluralizer = Pluralizer()
-        self.openai_client = None
-
-        # Initialize OpenAI client if API key available
-        api_key = os.getenv("OPENAI_API_KEY")
-        if api_key:
-            try:
-                self.openai_client = OpenAI(api_key=api_key)
-            except Exception:
-                pass
+        self._token_counts: OrderedDict = OrderedDict()
+        self._token_counts_lock = threading.Lock()
+        # paper id -> (cache key, extracted document) for this chat session
+        self._documents: Dict[int, tuple] = {}
+        # document cache key (paper, page range, file) -> digest for map-reduce
+        self._digests: Dict[tuple, str] = {}
+        # Token usage reported by the API for the last streamed response
+        self.last_usage: Optional[Dict[str, int]] = None
+
+    @staticmethod
+    def is_configured() -> bool:
+        """Whether an OpenAI API key is set.
+
+        The shared client (and the SDK import) is only resolved when a
+        response is requested, so building the service stays cheap at startup.
+        """
+        return bool(os.getenv("OPENAI_API_KEY"))
 
     def copy_prompt_to_clipboard(self, papers: List[Paper]) -> Dict[str, Any]:
         """Generate and copy paper prompt to clipboard for external LLM use."""
@@ -103,11 +140,8 @@ class ChatService:
                         hasattr(paper, "html_snapshot_path")
                         and paper.html_snapshot_path
                     ):
-                        db_manager = get_db_manager()
-                        data_dir = os.path.dirname(db_manager.db_path)
-                        html_snapshot_dir = os.path.join(data_dir, "html_snapshots")
-                        file_path = os.path.join(
-                            html_snapshot_dir, paper.html_snapshot_path
+                        file_path = snapshot_store.snapshot_path(
+                            paper.html_snapshot_path
                         )
                         file_type = "HTML"
                 # For non-website papers, open PDF folder
@@ -177,13 +211,38 @@ class ChatService:
             }
 
     def estimate_tokens(self, text: str, model_name: str) -> int:
-        """Estimate tokens using OpenAI's tiktoken library."""
-        try:
-            encoding = tiktoken.encoding_for_model(model_name.lower())
-            return len(encoding.encode(text))
-        except Exception:
-            encoding = tiktoken.get_encoding("cl100k_base")
-            return len(encoding.encode(text))
+        """Estimate tokens using OpenAI's tiktoken library.
+
+        Counts are memoized per text chunk, so callers should pass stable chunks
+        (a paper context block, a history message) rather than re-joined text.
+        """
+        if not text:
+            return 0
+
+        encoding = _get_encoding(model_name)
+        if encoding is None:
+            return len(text) // 4
+
+        key = (encoding.name, hashlib.sha1(text.encode("utf-8", "ignore")).digest())
+        with self._token_counts_lock:
+            count = self._token_counts.get(key)
+            if count is not None:
+                self._token_counts.move_to_end(key)
+                return count
+
+        count = len(encoding.encode(text, disallowed_special=()))
+        with self._token_counts_lock:
+            self._token_counts[key] = count
+            if len(self._token_counts) > _TOKEN_COUNT_CACHE_SIZE:
+                self._token_counts.popitem(last=False)
+        return count
+
+    def estimate_message_tokens(self, messages: List[Dict], model_name: str) -> int:
+        """Sum memoized token counts of each message in a conversation."""
+        return sum(
+            self.estimate_tokens(message.get("content") or "", model_name)
+            for message in messages
+        )
 
     def clean_pdf_text(self, text: str) -> str:
         """Clean PDF text to remove surrogates and other problematic characters."""
@@ -196,14 +255,16 @@ class ChatService:
         except Exception:
             return ""
 
-    def extract_page_range(
+    def extract_pages(
         self, pdf_path: str, start_page: int = 1, end_page: int = 10
-    ) -> str:
-        """Extract text from a specific page range of a PDF."""
+    ) -> List[tuple]:
+        """Extract cleaned (page number, text) pairs for a page range of a PDF."""
+        import PyPDF2
+
         try:
             with open(pdf_path, "rb") as file:
                 pdf_reader = PyPDF2.PdfReader(file)
-                text_parts = []
+                pages = []
                 total_pages = len(pdf_reader.pages)
 
                 if end_page > total_pages or start_page > total_pages:
@@ -219,24 +280,315 @@ class ChatService:
                     if page_text.strip():
                         cleaned_text = self.clean_pdf_text(page_text.strip())
                         if cleaned_text:
-                            text_parts.append(f"Page {page_num + 1}:\n{cleaned_text}")
+                            pages.append((page_num + 1, cleaned_text))
 
-                return "\n\n".join(text_parts)
+                return pages
         except Exception as e:
             if self.app:
                 self.app._add_log(
                     "pdf_extract_error", f"Failed to extract PDF text: {e}"
                 )
-            return ""
+            return []
 
-    def build_paper_context(
-        self, papers: List[Paper], pdf_start_page: int = 1, pdf_end_page: int = 10
+    def extract_page_range(
+        self, pdf_path: str, start_page: int = 1, end_page: int = 10
     ) -> str:
-        """Build paper context for LLM."""
-        if not papers:
-            return "No papers are currently selected for discussion."
+        """Extract text from a specific page range of a PDF."""
+        return "\n\n".join(
+            f"Page {page_num}:\n{text}"
+            for page_num, text in self.extract_pages(pdf_path, start_page, end_page)
+        )
+
+    def _load_paper_document(
+        self, paper: Paper, fields: Dict[str, Any], start_page: int, end_page: int
+    ) -> Optional[Dict[str, Any]]:
+        """Return a paper's attached text, extracted once per chat session.
+
+        Cached per paper and keyed by (paper id, modified_date, page range, file
+        mtime and size), so snapshots and PDFs are only re-read when they change.
+        """
+        if (
+            paper.paper_type == "website"
+            and hasattr(paper, "html_snapshot_path")
+            and paper.html_snapshot_path
+        ):
+            path = snapshot_store.snapshot_path(paper.html_snapshot_path)
+            kind, page_range = "html", None
+        elif fields["pdf_path"]:
+            path = self.pdf_manager.get_absolute_path(fields["pdf_path"])
+            kind, page_range = "pdf", (start_page, end_page)
+        else:
+            return None
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        key = (
+            paper.id,
+            getattr(paper, "modified_date", None),
+            page_range,
+            path,
+            stat.st_mtime_ns,
+            stat.st_size,
+        )
+        cached = self._documents.get(paper.id)
+        if cached and cached[0] == key:
+            return cached[1]
+
+        try:
+            if kind == "html":
+                text_content = snapshot_store.snapshot_text(path)
+
+                # Limit text length to avoid token limits (similar to PDF pages)
+                max_chars = 20000
+                truncated = text_content
+                if len(truncated) > max_chars:
+                    truncated = truncated[:max_chars] + "\n... (content truncated)"
+
+                document = {
+                    "pages": [(None, text_content)] if text_content else [],
+                    "full_block": f"Webpage content attached to this chat:\n{truncated}\n",
+                    "excerpt_label": "Relevant webpage excerpts",
+                }
+            else:
+                pages = self.extract_pages(path, start_page, end_page)
+                pdf_text = "\n\n".join(
+                    f"Page {page_num}:\n{text}" for page_num, text in pages
+                )
+                if start_page == end_page:
+                    full_block = (
+                        f"Page {start_page} attached to this chat:\n{pdf_text}\n"
+                    )
+                else:
+                    full_block = f"Pages {start_page}-{end_page} attached to this chat:\n{pdf_text}\n"
+                document = {
+                    "pages": pages,
+                    "full_block": full_block,
+                    "excerpt_label": f"Relevant excerpts from pages {start_page}-{end_page}",
+                }
+        except Exception as e:
+            if self.app:
+                self.app._add_log(
+                    f"{kind}_extract_error",
+                    f"Failed to extract {'HTML content' if kind == 'html' else 'PDF pages'} for '{fields['title']}': {e}",
+                )
+            return None
+
+        # Built on first use: the BM25 index and its chunk token counts per model
+        document["index"] = None
+        document["costs"] = {}
+        self._documents[paper.id] = (key, document)
+        return document
+
+    def _document_index(self, document: Dict[str, Any], model_name: str) -> tuple:
+        """Return a document's BM25 index and chunk token counts, built once."""
+        if document["index"] is None:
+            document["index"] = retrieval.BM25Index(
+                retrieval.chunk_pages(document["pages"])
+            )
+        index = document["index"]
+        costs = document["costs"].get(model_name)
+        if costs is None:
+            costs = document["costs"][model_name] = [
+                self.estimate_tokens(chunk.text, model_name) for chunk in index.chunks
+            ]
+        return index, costs
+
+    def _pack_relevant_text(
+        self, document: Dict[str, Any], query: str, token_budget: int, model_name: str
+    ) -> str:
+        """Keep only the chunks of a document most relevant to ``query``."""
+        index, costs = self._document_index(document, model_name)
+        packed = retrieval.pack_chunks(
+            index.chunks, query, token_budget, costs, index=index
+        )
+        return retrieval.format_chunks(packed)
+
+    def _spread_text(
+        self, document: Dict[str, Any], token_budget: int, model_name: str
+    ) -> str:
+        """Keep chunks spread evenly over the whole document."""
+        index, costs = self._document_index(document, model_name)
+        return retrieval.format_chunks(
+            retrieval.spread_chunks(index.chunks, token_budget, costs)
+        )
+
+    @staticmethod
+    def uses_digests(papers: List[Paper]) -> bool:
+        """Whether a chat over ``papers`` is answered from per-paper digests.
+
+        True once the selection reaches PAPERCLI_CHAT_MAP_REDUCE_PAPERS papers
+        (0 disables map-reduce mode).
+        """
+        try:
+            threshold = int(
+                os.getenv(
+                    "PAPERCLI_CHAT_MAP_REDUCE_PAPERS",
+                    str(constants.DEFAULT_CHAT_MAP_REDUCE_PAPERS),
+                )
+            )
+        except ValueError:
+            threshold = constants.DEFAULT_CHAT_MAP_REDUCE_PAPERS
+        return threshold > 0 and len(papers) >= threshold
+
+    def _cached_digest(self, paper: Paper, document: Optional[Dict[str, Any]]):
+        """The session digest of ``paper``'s attached text for its page range."""
+        document_entry = self._documents.get(paper.id)
+        if not document or not document_entry:
+            return None
+        return self._digests.get(document_entry[0])
+
+    def _digest_paper(
+        self,
+        paper: Paper,
+        fields: Dict[str, Any],
+        start_page: int,
+        end_page: int,
+        model_name: str,
+    ) -> Optional[str]:
+        """Condense a paper's attached text into a digest (map step).
+
+        Digests do not depend on the question, so they are kept per page range
+        for the chat session and in the LLM response cache across sessions.
+        The source text is sampled evenly from the whole attached range.
+        """
+        document = self._load_paper_document(paper, fields, start_page, end_page)
+        if not document or not document["pages"]:
+            return None
+        cached = self._cached_digest(paper, document)
+        if cached:
+            return cached
+
+        text = self._spread_text(
+            document, constants.DEFAULT_CHAT_DIGEST_SOURCE_TOKENS, model_name
+        )
+        params = llm_utils.get_model_parameters(model_name, temperature=0)
+        params["messages"] = [
+            {"role": "system", "content": prompts.chat_digest_system_message()},
+            {
+                "role": "user",
+                "content": prompts.chat_digest_prompt(fields["title"], text),
+            },
+        ]
+
+        digest = (
+            llm_gateway.get_gateway()
+            .cached_completion(params, "chat_digest", app=self.app)
+            .strip()
+        )
+        if not digest:
+            return None
+
+        self._digests[self._documents[paper.id][0]] = digest
+        return digest
+
+    def prepare_digests(
+        self,
+        papers: List[Paper],
+        pdf_start_page: int = 1,
+        pdf_end_page: int = 10,
+        model_name: str = "",
+        on_progress: Optional[Callable[[int, int], None]] = None,
+    ) -> Dict[str, Any]:
+        """Build the per-paper digests a map-reduce chat answers over.
+
+        Papers with stored notes reuse them; the others are condensed in
+        parallel, at most PAPERCLI_SUMMARY_CONCURRENCY at a time. Runs blocking,
+        so call it from a background thread. Returns counts of ``digested``,
+        ``reused`` and ``failed`` papers.
+        """
+        model_name = model_name or os.getenv(
+            "OPENAI_MODEL", constants.DEFAULT_CHAT_MODEL
+        )
+        start_page = max(1, pdf_start_page)
+        end_page = max(start_page, pdf_end_page)
+
+        pending = []
+        reused = 0
+        for paper in papers:
+            fields = dialog_utils.get_paper_fields(paper)
+            if fields["notes"]:
+                reused += 1
+            else:
+                pending.append((paper, fields))
 
-        context_parts = []
+        try:
+            max_workers = int(
+                os.getenv(
+                    "PAPERCLI_SUMMARY_CONCURRENCY",
+                    str(constants.DEFAULT_SUMMARY_CONCURRENCY),
+                )
+            )
+        except ValueError:
+            max_workers = constants.DEFAULT_SUMMARY_CONCURRENCY
+
+        digested = failed = done = 0
+        if pending:
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+                futures = {
+                    executor.submit(
+                        self._digest_paper,
+                        paper,
+                        fields,
+                        start_page,
+                        end_page,
+                        model_name,
+                    ): fields["title"]
+                    for paper, fields in pending
+                }
+                for future in as_completed(futures):
+                    done += 1
+                    try:
+                        if future.result():
+                            digested += 1
+                    except Exception as e:
+                        failed += 1
+                        if self.app:
+                            self.app._add_log(
+                                "chat_digest_error",
+                                f"Failed to digest '{futures[future]}': {e}",
+                            )
+                    if on_progress:
+                        on_progress(done, len(pending))
+
+        if self.app:
+            self.app._add_log(
+                "chat_digests",
+                f"Prepared digests for {self._pluralizer.pluralize('paper', len(papers), True)}: "
+                f"{digested} condensed, {reused} from notes, {failed} failed",
+            )
+        return {"digested": digested, "reused": reused, "failed": failed}
+
+    def _paper_context_blocks(
+        self,
+        papers: List[Paper],
+        pdf_start_page: int,
+        pdf_end_page: int,
+        query: str,
+        model_name: str,
+    ) -> List[tuple]:
+        """Return a (stable block, excerpt block) pair per paper.
+
+        The stable block only changes when a paper, its file or the page range
+        changes. With retrieval, the question-specific excerpts are kept apart
+        so the system prompt stays byte-identical across turns. Large
+        selections (see uses_digests) get each paper's notes or digest instead
+        of its text.
+        """
+        use_digests = self.uses_digests(papers)
+        use_retrieval = (
+            bool(query and query.strip()) and retrieval.is_enabled() and not use_digests
+        )
+        paper_budget = max(1, retrieval.context_token_budget() // len(papers))
+        model_name = model_name or os.getenv(
+            "OPENAI_MODEL", constants.DEFAULT_CHAT_MODEL
+        )
+        start_page = max(1, pdf_start_page)
+        end_page = max(start_page, pdf_end_page)
+
+        blocks = []
         for i, paper in enumerate(papers, 1):
             fields = dialog_utils.get_paper_fields(paper)
 
@@ -247,76 +599,66 @@ class ChatService:
             if fields["abstract"]:
                 paper_context += f"Abstract: {fields['abstract']}\n"
 
-            content_added = False
-
-            # For website papers, use HTML snapshot instead of PDF
-            if (
-                paper.paper_type == "website"
-                and hasattr(paper, "html_snapshot_path")
-                and paper.html_snapshot_path
-            ):
-                try:
-                    db_manager = get_db_manager()
-                    data_dir = os.path.dirname(db_manager.db_path)
-                    html_snapshot_dir = os.path.join(data_dir, "html_snapshots")
-                    html_absolute_path = os.path.join(
-                        html_snapshot_dir, paper.html_snapshot_path
+            excerpts = ""
+            if use_digests:
+                # Map-reduce: answer over stored notes or digests, never full text
+                if fields["notes"]:
+                    paper_context += f"Notes: {fields['notes']}\n"
+                else:
+                    document = self._load_paper_document(
+                        paper, fields, start_page, end_page
                     )
+                    digest = self._cached_digest(paper, document)
+                    if digest:
+                        paper_context += f"Digest: {digest}\n"
+                    elif document and document["pages"]:
+                        # No digest for this page range yet: attach a sample
+                        # of the text rather than nothing
+                        text = self._spread_text(document, paper_budget, model_name)
+                        paper_context += f"Excerpts from the attached text:\n{text}\n"
+                blocks.append((paper_context, excerpts))
+                continue
+
+            document = self._load_paper_document(paper, fields, start_page, end_page)
+            if document and document["pages"]:
+                if use_retrieval:
+                    paper_context += "Full text attached; relevant excerpts are provided with each question.\n"
+                    text = self._pack_relevant_text(
+                        document, query, paper_budget, model_name
+                    )
+                    excerpts = f"Paper {i} - {document['excerpt_label']}:\n{text}\n"
+                else:
+                    paper_context += document["full_block"]
+            elif fields["notes"]:
+                paper_context += f"Notes: {fields['notes']}\n"
 
-                    if os.path.exists(html_absolute_path):
-                        with open(html_absolute_path, "r", encoding="utf-8") as f:
-                            html_content = f.read()
-
-                        soup = BeautifulSoup(html_content, "html.parser")
-                        text_content = soup.get_text(separator="\n", strip=True)
-
-                        # Limit text length to avoid token limits (similar to PDF pages)
-                        max_chars = 20000
-                        if len(text_content) > max_chars:
-                            text_content = (
-                                text_content[:max_chars] + "\n... (content truncated)"
-                            )
-
-                        paper_context += (
-                            f"Webpage content attached to this chat:\n{text_content}\n"
-                        )
-                        content_added = True
-                except Exception as e:
-                    if self.app:
-                        self.app._add_log(
-                            "html_extract_error",
-                            f"Failed to extract HTML content for '{fields['title']}': {e}",
-                        )
-
-            # For non-website papers, use PDF
-            elif fields["pdf_path"]:
-                absolute_path = self.pdf_manager.get_absolute_path(fields["pdf_path"])
-                if os.path.exists(absolute_path):
-                    try:
-                        start_page = max(1, pdf_start_page)
-                        end_page = max(start_page, pdf_end_page)
-                        pdf_text = self.extract_page_range(
-                            absolute_path, start_page=start_page, end_page=end_page
-                        )
-                        if pdf_text:
-                            if start_page == end_page:
-                                paper_context += f"Page {start_page} attached to this chat:\n{pdf_text}\n"
-                            else:
-                                paper_context += f"Pages {start_page}-{end_page} attached to this chat:\n{pdf_text}\n"
-                            content_added = True
-                    except Exception as e:
-                        if self.app:
-                            self.app._add_log(
-                                "pdf_extract_error",
-                                f"Failed to extract PDF pages for '{fields['title']}': {e}",
-                            )
+            blocks.append((paper_context, excerpts))
+        return blocks
 
-            if not content_added and fields["notes"]:
-                paper_context += f"Notes: {fields['notes']}\n"
+    def build_paper_context(
+        self,
+        papers: List[Paper],
+        pdf_start_page: int = 1,
+        pdf_end_page: int = 10,
+        query: str = "",
+        model_name: str = "",
+    ) -> str:
+        """Build paper context for LLM.
 
-            context_parts.append(paper_context)
+        With a ``query`` (and PAPERCLI_CHAT_RETRIEVAL enabled), PDF pages and
+        webpage text are chunked and only the passages most relevant to the
+        query are attached, within PAPERCLI_CHAT_CONTEXT_TOKENS shared across
+        the papers.
+        """
+        if not papers:
+            return "No papers are currently selected for discussion."
 
-        return prompts.chat_paper_context_header() + "\n".join(context_parts)
+        blocks = self._paper_context_blocks(
+            papers, pdf_start_page, pdf_end_page, query, model_name
+        )
+        return prompts.chat_paper_context_header() + "\n".join(
+            stable + excerpts for stable, excerpts in blocks
+        )
 
     def build_conversation_messages(
         self,
@@ -325,23 +667,58 @@ class ChatService:
         papers: List[Paper],
         pdf_start_page: int = 1,
         pdf_end_page: int = 10,
+        model_name: str = "",
+        history_summary: str = "",
+        history_start: int = 0,
     ) -> list:
-        """Build messages for OpenAI API."""
-        paper_context = self.build_paper_context(papers, pdf_start_page, pdf_end_page)
+        """Build messages for OpenAI API.
+
+        The system message is byte-stable across turns (so provider-side prompt
+        caching applies); excerpts retrieved for the current question are sent
+        in a separate message just before it. History before ``history_start``
+        has been compacted into ``history_summary`` (see compact_history).
+        """
+        # Retrieve for the current question plus the previous one, so that
+        # short follow-ups ("what about its limitations?") keep their topic
+        previous_questions = [
+            entry["content"]
+            for entry in chat_history
+            if entry["role"] == "user" and not entry.get("ui_only", False)
+        ]
+        query = " ".join(previous_questions[-1:] + [user_message or ""])
+
+        if papers:
+            blocks = self._paper_context_blocks(
+                papers, pdf_start_page, pdf_end_page, query, model_name
+            )
+            paper_context = prompts.chat_paper_context_header() + "\n".join(
+                stable for stable, _ in blocks
+            )
+            excerpts = "\n".join(excerpt for _, excerpt in blocks if excerpt)
+        else:
+            paper_context = self.build_paper_context(papers)
+            excerpts = ""
         system_message = prompts.chat_system_message(paper_context)
 
         messages = [{"role": "system", "content": system_message}]
 
-        # Include recent history in order. Do not drop the last item,
+        if history_summary:
+            messages.append(
+                {
+                    "role": "system",
+                    "content": prompts.chat_history_summary_message(history_summary),
+                }
+            )
+
+        # Include the uncompacted history in order. Do not drop the last item,
         # since the current user message is passed separately.
-        recent_history = chat_history[-8:] if len(chat_history) > 8 else chat_history
-        for entry in recent_history:
-            if (
-                entry["role"] in ["user", "assistant"]
-                and entry["content"].strip()
-                and not entry.get("ui_only", False)
-            ):
-                messages.append({"role": entry["role"], "content": entry["content"]})
+        for _, entry in self._conversation_entries(chat_history, history_start):
+            messages.append({"role": entry["role"], "content": entry["content"]})
+
+        if excerpts:
+            messages.append(
+                {"role": "system", "content": prompts.chat_excerpts_message(excerpts)}
+            )
 
         # Append the current user message to be answered
         if user_message and user_message.strip():
@@ -349,6 +726,119 @@ class ChatService:
 
         return messages
 
+    @staticmethod
+    def _conversation_entries(chat_history: List[Dict], start: int = 0) -> List[tuple]:
+        """(index, entry) pairs of user/assistant turns that are sent to the model."""
+        return [
+            (index, entry)
+            for index, entry in enumerate(chat_history[start:], start)
+            if entry["role"] in ["user", "assistant"]
+            and entry["content"].strip()
+            and not entry.get("ui_only", False)
+        ]
+
+    @staticmethod
+    def history_settings() -> tuple:
+        """Return (token threshold, verbatim recent turns) for history compaction."""
+        try:
+            threshold = int(
+                os.getenv(
+                    "PAPERCLI_CHAT_HISTORY_TOKENS",
+                    str(constants.DEFAULT_CHAT_HISTORY_TOKENS),
+                )
+            )
+        except ValueError:
+            threshold = constants.DEFAULT_CHAT_HISTORY_TOKENS
+        try:
+            keep_turns = int(
+                os.getenv(
+                    "PAPERCLI_CHAT_KEEP_TURNS", str(constants.DEFAULT_CHAT_KEEP_TURNS)
+                )
+            )
+        except ValueError:
+            keep_turns = constants.DEFAULT_CHAT_KEEP_TURNS
+        return threshold, max(1, keep_turns)
+
+    def history_tokens(
+        self,
+        chat_history: List[Dict],
+        history_summary: str,
+        history_start: int,
+        model_name: str,
+    ) -> int:
+        """Tokens the (compacted) history adds to each request."""
+        return self.estimate_tokens(history_summary, model_name) + sum(
+            self.estimate_tokens(entry["content"], model_name)
+            for _, entry in self._conversation_entries(chat_history, history_start)
+        )
+
+    def compact_history(
+        self,
+        chat_history: List[Dict],
+        history_summary: str,
+        history_start: int,
+        model_name: str,
+    ) -> Optional[Dict[str, Any]]:
+        """Fold older turns into a model-written summary once history is too large.
+
+        The latest PAPERCLI_CHAT_KEEP_TURNS user turns (and the replies that
+        follow them) stay verbatim. Returns None when no compaction is needed,
+        otherwise a dict with the new ``summary`` and ``start`` index plus the
+        history token counts ``before`` and ``after``. If the summary request
+        fails, the older turns are dropped so requests stay bounded.
+        """
+        threshold, keep_turns = self.history_settings()
+        before = self.history_tokens(
+            chat_history, history_summary, history_start, model_name
+        )
+        if before <= threshold:
+            return None
+
+        entries = self._conversation_entries(chat_history, history_start)
+        user_indexes = [index for index, entry in entries if entry["role"] == "user"]
+        if len(user_indexes) <= keep_turns:
+            return None
+        cut = user_indexes[-keep_turns]
+
+        transcript = "\n\n".join(
+            f"{entry['role'].capitalize()}: {entry['content']}"
+            for index, entry in entries
+            if index < cut
+        )
+        params = llm_utils.get_model_parameters(model_name, temperature=0)
+        params["messages"] = [
+            {
+                "role": "system",
+                "content": prompts.chat_history_compaction_system_message(),
+            },
+            {
+                "role": "user",
+                "content": prompts.chat_history_compaction_prompt(
+                    history_summary, transcript
+                ),
+            },
+        ]
+        try:
+            response = llm_gateway.get_gateway().chat_completion(
+                params, call_site="chat_compaction"
+            )
+            summary = (response.choices[0].message.content or "").strip()
+        except Exception as e:
+            summary = ""
+            if self.app:
+                self.app._add_log(
+                    "chat_compaction_error", f"Failed to summarize chat history: {e}"
+                )
+        summary = summary or history_summary
+
+        after = self.history_tokens(chat_history, summary, cut, model_name)
+        if self.app:
+            self.app._add_log(
+                "chat_compaction",
+                f"Compacted chat history before message {cut}: ~{before} -> ~{after} tokens",
+            )
+        return {"summary": summary, "start": cut, "before": before, "after": after}
+
     def stream_chat_response(
         self,
         model_name: str,
@@ -373,6 +863,8 @@ class ChatService:
         def send_request():
             try:
                 self.app._add_log("chat_api_call", f"Sending to OpenAI {model_name}")
+                # The shared client (and the SDK) load here, on the worker thread
+                gateway = llm_gateway.get_gateway()
 
                 use_responses_api = (
                     llm_utils.is_reasoning_model(model_name) and show_thinking
@@ -393,13 +885,17 @@ class ChatService:
                     if max_tokens:
                         params["max_output_tokens"] = max_tokens
 
-                    stream = self.openai_client.responses.create(**params)
+                    stream = gateway.stream(
+                        params, call_site="chat", responses_api=True
+                    )
                 else:
                     params = llm_utils.get_model_parameters(model_name)
                     params["messages"] = messages
                     params["stream"] = True
-                    stream = self.openai_client.chat.completions.create(**params)
+                    params["stream_options"] = {"include_usage": True}
+                    stream = gateway.stream(params, call_site="chat")
 
+                self.last_usage = None
                 full_response = ""
                 full_thinking = ""
                 last_update_time = 0
@@ -425,6 +921,14 @@ class ChatService:
                                     )
                                     last_thinking_update_time = current_time
 
+                            elif event.type == "response.completed":
+                                usage = getattr(event.response, "usage", None)
+                                if usage:
+                                    self.last_usage = {
+                                        "input": usage.input_tokens,
+                                        "output": usage.output_tokens,
+                                    }
+
                             elif event.type == "response.output_text.delta":
                                 full_response += event.delta
                                 chunk_count += 1
@@ -441,6 +945,12 @@ class ChatService:
                                     last_update_time = current_time
                 else:
                     for chunk in stream:
+                        usage = getattr(chunk, "usage", None)
+                        if usage:
+                            self.last_usage = {
+                                "input": usage.prompt_tokens,
+                                "output": usage.completion_tokens,
+                            }
                         if chunk.choices and chunk.choices[0].delta.content is not None:
                             full_response += chunk.choices[0].delta.content
                             chunk_count += 1
@@ -17,6 +17,12 @@ DEFAULT_TEMPERATURE = 0.7  # Temperature for non-reasoning models (0.0-2.0)
 DEFAULT_REASONING_EFFORT = "medium"  # Reasoning effort for o1/o3 models (low/medium/high)
 DEFAULT_SHOW_THINKING = False  # Whether to show reasoning model's thinking process
 
+# Request gateway (shared client)
+DEFAULT_LLM_MAX_CONCURRENCY = 4  # Maximum concurrent OpenAI requests
+DEFAULT_LLM_TPM_LIMIT = 0  # Tokens-per-minute budget (0 = unlimited)
+DEFAULT_LLM_MAX_RETRIES = 5  # Retries for rate-limited and transient failures
+DEFAULT_SUMMARY_CONCURRENCY = 4  # Summaries generated at once for multi-paper requests
+
 
 # ============================================================================
 # PDF and HTML Processing
@@ -24,7 +30,44 @@ DEFAULT_SHOW_THINKING = False  # Whether to show reasoning model's thinking proc
 
 DEFAULT_PDF_SUMMARY_PAGES = 10  # Number of pages to extract for paper summarization
 DEFAULT_PDF_METADATA_PAGES = 2  # Number of pages to extract for metadata extraction
+DEFAULT_PDF_IDENTIFIER_LOOKUPS = 3  # Page-one identifiers looked up before the LLM
 DEFAULT_HTML_MAX_CHARS = 20000  # Maximum characters to extract from HTML for summarization
+DEFAULT_CHAT_CONTEXT_TOKENS = 12000  # Token budget for retrieved paper excerpts in chat
+DEFAULT_CHAT_HISTORY_TOKENS = 6000  # History size that triggers summarizing older turns
+DEFAULT_CHAT_KEEP_TURNS = 4  # Most recent chat turns always sent verbatim
+DEFAULT_CHAT_MAP_REDUCE_PAPERS = 6  # Chats with this many papers answer from digests
+DEFAULT_CHAT_DIGEST_SOURCE_TOKENS = 3000  # Paper text condensed into each digest
+
+
+# ============================================================================
+# Bulk Import (BibTeX/RIS)
+# ============================================================================
+
+DEFAULT_PDF_DOWNLOAD_WORKERS = 4  # Concurrent PDF downloads after a bulk import
+DEFAULT_PDF_DOWNLOAD_INTERVAL = 0.25  # Minimum seconds between starting two downloads
+DEFAULT_SNAPSHOT_CONCURRENCY = 4  # Pages the shared snapshot browser loads at once
+DEFAULT_SNAPSHOT_RECYCLE_PAGES = 50  # Pages before the snapshot browser is relaunched
+DEFAULT_SNAPSHOT_ASSET_CONCURRENCY = 8  # Assets fetched at once per snapshot run
+DEFAULT_SNAPSHOT_ASSET_MAX_KB = 2048  # Larger assets are linked instead of inlined
+DEFAULT_SNAPSHOT_IMAGE_MAX_KB = 1024  # Larger images stay links (0 skips images)
+DEFAULT_SNAPSHOT_ASSET_CACHE_MB = 100  # On-disk snapshot asset cache (0 disables)
+DEFAULT_SNAPSHOT_ASSET_MAX_AGE_DAYS = 7  # Cached assets older than this are refetched
+
+
+# ============================================================================
+# LLM Response Cache
+# ============================================================================
+
+DEFAULT_LLM_CACHE_MB = 50  # Size budget of llm_cache.db before LRU eviction
+
+
+# ============================================================================
+# Database Storage
+# ============================================================================
+
+DEFAULT_SQLITE_BUSY_TIMEOUT_MS = 5000  # Wait this long for a competing writer
+DEFAULT_SQLITE_CACHE_MB = 32  # Page cache per connection
+DEFAULT_SQLITE_MMAP_MB = 128  # Memory-mapped reads of the library database (0 disables)
 
 
 # ============================================================================
@@ -9,10 +9,16 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict
 
+from ng.db import storage
 from ng.db.database import get_pdf_directory
 from ng.db.models import Author, Paper, PaperAuthor
-from ng.services import PDFManager, format_file_size, format_title_by_words
-from sqlalchemy import create_engine, event, inspect, text
+from ng.services import (
+    PDFManager,
+    format_file_size,
+    format_title_by_words,
+    snapshot_store,
+)
+from sqlalchemy import inspect, text
 from sqlalchemy.orm import sessionmaker
 
 
@@ -22,15 +28,8 @@ class DatabaseHealthService:
     def __init__(self, db_path: str = None, app=None):
         # If db_path is not provided, get it from app
         self.db_path = db_path if db_path else (app.db_path if app else None)
-        self.engine = create_engine(f"sqlite:///{self.db_path}")
-
-        # Enable foreign key constraints for SQLite
-        def _enable_foreign_keys(dbapi_connection, connection_record):
-            cursor = dbapi_connection.cursor()
-            cursor.execute("PRAGMA foreign_keys=ON")
-            cursor.close()
-
-        event.listen(self.engine, "connect", _enable_foreign_keys)
+        # Same pooled engine as the app's DatabaseManager
+        self.engine = storage.get_engine(self.db_path)
 
         self.Session = sessionmaker(bind=self.engine)
         self.app = app
@@ -49,6 +48,7 @@ class DatabaseHealthService:
                 "orphaned_records": self._find_orphaned_records(),
                 "orphaned_pdfs": self._find_orphaned_pdfs(),
                 "orphaned_htmls": self._find_orphaned_htmls(),
+                "orphaned_snapshot_texts": self._find_orphaned_snapshot_texts(),
                 "absolute_pdf_paths": self._find_absolute_pdf_paths(),
                 "missing_pdfs": self._find_missing_pdfs(),
                 "missing_htmls": self._find_missing_htmls(),
@@ -104,6 +104,12 @@ class DatabaseHealthService:
             )
             report["recommendations"].append("Run '/doctor clean' to remove them.")
 
+        if report["orphaned_snapshot_texts"]["summary"]["orphaned_text_files"] > 0:
+            report["issues_found"].append(
+                "Orphaned snapshot text files found (not matching any snapshot)."
+            )
+            report["recommendations"].append("Run '/doctor clean' to remove them.")
+
         if report["absolute_pdf_paths"]["summary"]["absolute_path_count"] > 0:
             report["issues_found"].append(
                 "Papers with absolute PDF paths found (should be relative)."
@@ -289,13 +295,13 @@ class DatabaseHealthService:
         if html_dir.is_dir():
             session = self.Session()
             try:
-                db_html_paths = {
-                    Path(p.html_snapshot_path).name
+                db_html_paths = snapshot_store.referenced_names(
+                    p.html_snapshot_path
                     for p in session.query(Paper)
                     .filter(Paper.html_snapshot_path.isnot(None))
                     .all()
-                }
-                for html_file in html_dir.glob("*.html"):
+                )
+                for html_file in snapshot_store.snapshot_files(html_dir):
                     if html_file.name not in db_html_paths:
                         orphaned_html_files.append(str(html_file))
             except Exception as e:
@@ -309,6 +315,31 @@ class DatabaseHealthService:
             "details": orphaned_html_files,
         }
 
+    def _find_orphaned_snapshot_texts(self) -> Dict[str, Any]:
+        """Finds snapshot text sidecars not matching any linked HTML snapshot."""
+        orphaned_text_files = []
+        session = self.Session()
+        try:
+            orphaned_text_files = [
+                str(text_file)
+                for text_file in snapshot_store.orphaned_text_files(
+                    p.html_snapshot_path
+                    for p in session.query(Paper)
+                    .filter(Paper.html_snapshot_path.isnot(None))
+                    .all()
+                )
+            ]
+        except Exception as e:
+            self._add_log(
+                "orphaned_texts_error", f"Error finding orphaned snapshot texts: {e}"
+            )
+        finally:
+            session.close()
+        return {
+            "summary": {"orphaned_text_files": len(orphaned_text_files)},
+            "details": orphaned_text_files,
+        }
+
     def _find_absolute_pdf_paths(self) -> Dict[str, Any]:
         """Finds papers with absolute PDF paths instead of relative ones."""
         session = self.Session()
@@ -445,7 +476,9 @@ class DatabaseHealthService:
                         # Relative path - resolve relative to HTML directory
                         full_path = html_dir / paper.html_snapshot_path
 
-                    if not full_path.exists():
+                    if not full_path.exists() and not os.path.exists(
+                        f"{full_path}{snapshot_store.GZIP_SUFFIX}"
+                    ):
                         missing_htmls.append(paper.id)
                         missing_html_details.append(
                             {
@@ -556,7 +589,7 @@ class DatabaseHealthService:
                 return stats
 
             stats["html_folder_exists"] = True
-            html_files = list(html_dir.glob("*.html"))
+            html_files = snapshot_store.snapshot_files(html_dir)
             stats["total_html_files"] = len(html_files)
 
             if html_files:
@@ -951,16 +984,16 @@ class DatabaseHealthService:
         if html_dir.is_dir():
             session = self.Session()
             try:
-                db_html_paths = {
-                    Path(p.html_snapshot_path).name
+                db_html_paths = snapshot_store.referenced_names(
+                    p.html_snapshot_path
                     for p in session.query(Paper)
                     .filter(Paper.html_snapshot_path.isnot(None))
                     .all()
-                }
+                )
 
                 current_time = time.time()
 
-                for html_file in html_dir.glob("*.html"):
+                for html_file in snapshot_store.snapshot_files(html_dir):
                     if html_file.name not in db_html_paths:
                         try:
                             # Don't delete files that are very recent (< 2 minutes old)
@@ -995,6 +1028,49 @@ class DatabaseHealthService:
                 session.close()
         return {"deleted_htmls": cleaned_count}
 
+    def clean_orphaned_snapshot_texts(self) -> Dict[str, int]:
+        """Deletes snapshot text sidecars not matching any linked HTML snapshot."""
+        cleaned_count = 0
+        session = self.Session()
+        try:
+            orphaned_text_files = snapshot_store.orphaned_text_files(
+                p.html_snapshot_path
+                for p in session.query(Paper)
+                .filter(Paper.html_snapshot_path.isnot(None))
+                .all()
+            )
+
+            current_time = time.time()
+
+            for text_file in orphaned_text_files:
+                try:
+                    # Sidecars are written before the snapshot path is saved
+                    file_age = current_time - text_file.stat().st_mtime
+                    if file_age < 120:
+                        self._add_log(
+                            "clean_text_skip",
+                            f"Skipping recent file (age: {file_age:.1f}s): {text_file.name}",
+                        )
+                        continue
+
+                    os.remove(text_file)
+                    cleaned_count += 1
+                    self._add_log(
+                        "clean_text",
+                        f"Deleted orphaned snapshot text: {text_file.name}",
+                    )
+                except OSError as e:
+                    self._add_log(
+                        "clean_text_error", f"Error deleting {text_file.name}: {e}"
+                    )
+        except Exception as e:
+            self._add_log(
+                "clean_text_error", f"Error finding snapshot texts to clean: {e}"
+            )
+        finally:
+            session.close()
+        return {"deleted_snapshot_texts": cleaned_count}
+
     def fix_absolute_pdf_paths(self) -> Dict[str, int]:
         """Converts absolute PDF paths in the database to relative paths."""
         session = self.Session()
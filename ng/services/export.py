@@ -5,14 +5,14 @@ import re
 import unicodedata
 from typing import List
 
-import bibtexparser
-from bibtexparser.customization import string_to_latex
-
 from ..db.models import Paper
 
 
 def export_to_bibtex(papers: List[Paper]) -> str:
     """Export papers to BibTeX format using bibtexparser v1."""
+    import bibtexparser
+    from bibtexparser.customization import string_to_latex
+
     bib_database = bibtexparser.bibdatabase.BibDatabase()
 
     for paper in papers:
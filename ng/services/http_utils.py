@@ -1,8 +1,11 @@
 """HTTP utility functions for making web requests with consistent error handling."""
 
-from typing import Dict, Optional
+from __future__ import annotations
 
-import requests
+from typing import TYPE_CHECKING, Dict, Optional
+
+if TYPE_CHECKING:
+    import requests
 
 DEFAULT_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
@@ -32,6 +35,8 @@ def get(
     Raises:
         requests.RequestException: On HTTP errors
     """
+    import requests
+
     merged_headers = DEFAULT_HEADERS.copy()
     if headers:
         merged_headers.update(headers)
@@ -2,10 +2,17 @@ from __future__ import annotations
 
 import os
 import threading
+from collections import deque
 from functools import partial
 from typing import TYPE_CHECKING, Any, Callable, Dict, List
 
-from ng.services import MetadataExtractor, PDFManager, format_title_by_words
+from ng.services import (
+    MetadataExtractor,
+    PDFManager,
+    constants,
+    format_title_by_words,
+    snapshot_store,
+)
 from pluralizer import Pluralizer
 
 if TYPE_CHECKING:
@@ -42,15 +49,7 @@ class LLMSummaryService:
             # Website papers: check for HTML snapshot
             if p.paper_type == "website":
                 if hasattr(p, "html_snapshot_path") and p.html_snapshot_path:
-                    from ng.db.database import get_db_manager
-
-                    db_manager = get_db_manager()
-                    data_dir = os.path.dirname(db_manager.db_path)
-                    html_snapshot_dir = os.path.join(data_dir, "html_snapshots")
-                    html_absolute_path = os.path.join(
-                        html_snapshot_dir, p.html_snapshot_path
-                    )
-                    if os.path.exists(html_absolute_path):
+                    if snapshot_store.snapshot_exists(p.html_snapshot_path):
                         papers_with_content.append(p)
             # Non-website papers: check for PDF
             elif p.pdf_path:
@@ -69,6 +68,9 @@ class LLMSummaryService:
         """
         Generate summaries for one or more papers with batched database updates.
 
+        At most PAPERCLI_SUMMARY_CONCURRENCY summaries run at once; requests also
+        share the LLM gateway's tokens-per-minute budget.
+
         Args:
             papers: Single Paper object or list of Paper objects
             on_all_complete: Callback when all summaries are complete (optional)
@@ -96,6 +98,9 @@ class LLMSummaryService:
             "papers": papers_with_pdfs,
             "on_all_complete": on_all_complete,
             "operation_prefix": operation_prefix,
+            "pending": deque(papers_with_pdfs),
+            "in_flight": 0,
+            "max_concurrency": self._read_concurrency(),
         }
 
         # Set initial status
@@ -111,12 +116,32 @@ class LLMSummaryService:
                     severity="information",
                 )
 
-        # Start all summary operations
-        for paper in papers_with_pdfs:
-            self._start_paper_summary(paper, tracking)
+        # Start the first window of summary operations
+        self._start_pending_summaries(tracking)
 
         return tracking
 
+    @staticmethod
+    def _read_concurrency() -> int:
+        try:
+            value = int(
+                os.getenv(
+                    "PAPERCLI_SUMMARY_CONCURRENCY",
+                    str(constants.DEFAULT_SUMMARY_CONCURRENCY),
+                )
+            )
+        except ValueError:
+            value = constants.DEFAULT_SUMMARY_CONCURRENCY
+        return max(1, value)
+
+    def _start_pending_summaries(self, tracking: Dict[str, Any]):
+        """Start queued papers until the concurrency limit is reached."""
+        while (
+            tracking["pending"] and tracking["in_flight"] < tracking["max_concurrency"]
+        ):
+            tracking["in_flight"] += 1
+            self._start_paper_summary(tracking["pending"].popleft(), tracking)
+
     def _start_paper_summary(self, paper: Paper, tracking: Dict[str, Any]):
         """Start summary generation for a single paper."""
         generate_summary_func = partial(
@@ -176,6 +201,7 @@ class LLMSummaryService:
     ):
         """Handle completion of a single paper summary."""
         tracking["completed"] += 1
+        tracking["in_flight"] -= 1
 
         if error:
             tracking["failed"].append((current_paper.id, str(error)))
@@ -201,13 +227,15 @@ class LLMSummaryService:
                     f"Successfully generated summary for '{result['paper_title']}'",
                 )
 
+        self._start_pending_summaries(tracking)
         self._check_completion(tracking)
 
     def _check_completion(self, tracking: Dict[str, Any]):
         """Check if all summaries are complete and process the queue."""
         if tracking["completed"] < tracking["total"]:
-            # Still in progress
-            if self.background_service.app:
+            # Still in progress; report roughly every 10%
+            step = max(1, tracking["total"] // 10)
+            if self.background_service.app and tracking["completed"] % step == 0:
                 total_text = self._pluralizer.pluralize(
                     "summary", tracking["total"], True
                 )
@@ -246,37 +274,33 @@ class LLMSummaryService:
         ).start()
 
     def _process_queue_worker(self, tracking: Dict[str, Any]):
-        """Worker method to process the summary queue."""
-        for paper_id, summary, paper_title in tracking["queue"]:
-            try:
-                if self.app:
-                    self.app._add_log(
-                        f"{tracking['operation_prefix']}_save_attempt_{paper_id}",
-                        f"Attempting to save summary for paper ID {paper_id}: {format_title_by_words(paper_title)}",
-                    )
+        """Worker method to save the whole summary queue in one transaction."""
+        updates = {
+            paper_id: {"notes": summary} for paper_id, summary, _ in tracking["queue"]
+        }
+        try:
+            saved_ids, errors = self.paper_service.update_papers_bulk(updates)
+        except Exception as e:
+            saved_ids, errors = [], [str(e)]
 
-                updated_paper, error_msg = self.paper_service.update_paper(
-                    paper_id, {"notes": summary}
+        for error_msg in errors:
+            if self.app:
+                self.app._add_log(
+                    f"{tracking['operation_prefix']}_save_error", error_msg
                 )
 
-                if error_msg:
-                    if self.app:
-                        self.app._add_log(
-                            f"{tracking['operation_prefix']}_save_error_{paper_id}",
-                            f"Failed to save summary for {format_title_by_words(paper_title)}: {error_msg}",
-                        )
-                else:
-                    if self.app:
-                        self.app._add_log(
-                            f"{tracking['operation_prefix']}_save_success_{paper_id}",
-                            f"Successfully saved summary for {format_title_by_words(paper_title)}",
-                        )
-            except Exception as e:
-                if self.app:
-                    self.app._add_log(
-                        f"{tracking['operation_prefix']}_save_exception_{paper_id}",
-                        f"Exception saving summary for {format_title_by_words(paper_title)}: {e}",
-                    )
+        # Summaries that could not be saved count as failures
+        saved = set(saved_ids)
+        for paper_id, _, _ in tracking["queue"]:
+            if paper_id not in saved:
+                tracking["failed"].append((paper_id, "Failed to save summary"))
+        tracking["queue"] = [item for item in tracking["queue"] if item[0] in saved]
+
+        if self.app and saved_ids:
+            self.app._add_log(
+                f"{tracking['operation_prefix']}_save_success",
+                f"Saved {self._pluralizer.pluralize('summary', len(saved_ids), True)}",
+            )
 
         # Schedule UI update after processing the whole queue
         if self.background_service.app:
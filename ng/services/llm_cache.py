@@ -0,0 +1,149 @@
+"""
+Persistent cache for LLM responses.
+
+Responses are keyed by a hash of the model, request parameters and messages,
+stored in a small SQLite file in the data directory, and evicted least-recently
+used first once the cache grows past its size budget.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+from . import constants
+
+
+class LLMResponseCache:
+    """Size-bounded, LRU-evicted store of LLM responses."""
+
+    def __init__(self, cache_path: str, max_bytes: int):
+        self.cache_path = cache_path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, model TEXT, response TEXT NOT NULL, "
+                "size INTEGER NOT NULL, created_at REAL NOT NULL, "
+                "last_used REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_responses_last_used "
+                "ON responses (last_used)"
+            )
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.cache_path, timeout=5)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def make_key(params: Dict[str, Any]) -> str:
+        """Hash request parameters (model, sampling settings, messages) into a key."""
+        canonical = json.dumps(params, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for ``key`` or None."""
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT response FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key)
+            )
+            return row[0]
+
+    def put(self, key: str, model: str, response: str) -> None:
+        """Store a response and evict old entries if over budget."""
+        size = len(response.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, model, response, size, created_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, response, size, now, now),
+            )
+            (total,) = conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+            if total > self.max_bytes:
+                self._evict(conn, total)
+
+    def _evict(self, conn: sqlite3.Connection, total: int) -> None:
+        """Drop least-recently-used entries until the cache is at 90% of budget."""
+        target = int(self.max_bytes * 0.9)
+        rows = conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_used ASC"
+        ).fetchall()
+        doomed = []
+        for key, size in rows:
+            if total <= target:
+                break
+            doomed.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM responses")
+
+    def stats(self) -> Dict[str, int]:
+        """Return entry count and total stored bytes."""
+        with self._lock, self._connect() as conn:
+            count, total = conn.execute(
+                "SELECT COUNT(1), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+            return {"entries": count, "bytes": total}
+
+
+_cache: Optional[LLMResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def is_enabled() -> bool:
+    """Whether response caching is enabled (PAPERCLI_LLM_CACHE, default on)."""
+    value = os.getenv("PAPERCLI_LLM_CACHE", "true").strip().strip("'\"").lower()
+    return value not in {"0", "false", "no", "off"}
+
+
+def get_cache() -> Optional[LLMResponseCache]:
+    """Return the process-wide cache stored next to the database, or None."""
+    global _cache
+    if not is_enabled():
+        return None
+    if _cache is not None:
+        return _cache
+
+    with _cache_lock:
+        if _cache is None:
+            try:
+                from ng.db.database import get_db_manager
+
+                data_dir = os.path.dirname(get_db_manager().db_path)
+                max_mb = int(
+                    os.getenv(
+                        "PAPERCLI_LLM_CACHE_MB", str(constants.DEFAULT_LLM_CACHE_MB)
+                    )
+                )
+                _cache = LLMResponseCache(
+                    os.path.join(data_dir, "llm_cache.db"), max_mb * 1024 * 1024
+                )
+            except Exception:
+                return None
+    return _cache
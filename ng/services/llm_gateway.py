@@ -0,0 +1,345 @@
+"""
+Process-wide gateway for OpenAI requests.
+
+Holds one configured client (and therefore one HTTP connection pool), caps the
+number of concurrent requests, keeps tokens-per-minute under a configurable
+limit, retries rate-limited (429) and transient failures (connection errors,
+timeouts, 408/409 and 5xx responses) with jittered backoff, and records
+latency, token usage and cache hits per call site.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional
+
+from . import constants, llm_cache
+
+if TYPE_CHECKING:
+    from openai import OpenAI
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def estimate_request_tokens(params: Dict[str, Any]) -> int:
+    """Rough token estimate for a request (4 chars per token plus the output budget)."""
+    messages = params.get("messages") or params.get("input") or []
+    chars = 0
+    for message in messages:
+        content = message.get("content", "") if isinstance(message, dict) else message
+        chars += len(content) if isinstance(content, str) else len(str(content))
+    output_budget = (
+        params.get("max_tokens")
+        or params.get("max_completion_tokens")
+        or params.get("max_output_tokens")
+        or 0
+    )
+    return chars // 4 + output_budget
+
+
+class LLMGateway:
+    """Shared OpenAI client with concurrency, rate-limit and retry handling."""
+
+    def __init__(
+        self,
+        max_concurrency: int = constants.DEFAULT_LLM_MAX_CONCURRENCY,
+        tpm_limit: int = constants.DEFAULT_LLM_TPM_LIMIT,
+        max_retries: int = constants.DEFAULT_LLM_MAX_RETRIES,
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.tpm_limit = max(0, tpm_limit)
+        self.max_retries = max(0, max_retries)
+
+        self._client: Optional[OpenAI] = None
+        self._client_config = None
+        self._client_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+
+        # (timestamp, tokens) of requests in the last minute
+        self._token_window: deque = deque()
+        self._token_lock = threading.Lock()
+
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._stats_lock = threading.Lock()
+
+    @property
+    def client(self) -> OpenAI:
+        """The shared client, rebuilt only if the API key or base URL changes."""
+        config = (os.getenv("OPENAI_API_KEY"), os.getenv("OPENAI_BASE_URL"))
+        with self._client_lock:
+            if self._client is None or config != self._client_config:
+                # The SDK takes a while to import; load it with the first request
+                from openai import OpenAI
+
+                # Retries are handled here so that they respect the shared rate limit
+                self._client = OpenAI(max_retries=0)
+                self._client_config = config
+            return self._client
+
+    # ------------------------------------------------------------------
+    # Rate limiting
+    # ------------------------------------------------------------------
+
+    def _reserve_tokens(self, tokens: int) -> list:
+        """Block until ``tokens`` fit in the per-minute budget, then reserve them."""
+        while True:
+            with self._token_lock:
+                now = time.monotonic()
+                while self._token_window and now - self._token_window[0][0] >= 60:
+                    self._token_window.popleft()
+                used = sum(entry[1] for entry in self._token_window)
+                # A single oversized request is let through on an empty window
+                if (
+                    not self.tpm_limit
+                    or used + tokens <= self.tpm_limit
+                    or not self._token_window
+                ):
+                    entry = [now, tokens]
+                    self._token_window.append(entry)
+                    return entry
+                wait = 60 - (now - self._token_window[0][0])
+            time.sleep(min(max(wait, 0.05), 5))
+
+    def _settle_tokens(self, entry: list, actual_tokens: Optional[int]):
+        """Replace a reservation with the usage the API reported."""
+        if actual_tokens is not None:
+            with self._token_lock:
+                entry[1] = actual_tokens
+
+    @contextmanager
+    def _slot(self, params: Dict[str, Any]) -> Iterator[list]:
+        reservation = self._reserve_tokens(estimate_request_tokens(params))
+        with self._slots:
+            yield reservation
+
+    def _create_with_retry(self, create, params: Dict[str, Any], call_site: str):
+        """Call ``create(**params)``, retrying transient failures with backoff."""
+        import openai
+
+        attempt = 0
+        while True:
+            try:
+                return create(**params)
+            except openai.OpenAIError as e:
+                if attempt >= self.max_retries or not self._is_retryable(e):
+                    raise
+                delay = self._retry_delay(e, attempt)
+                self._record(call_site, retries=1)
+                attempt += 1
+                time.sleep(delay)
+
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        """Whether the SDK's own retry policy would retry ``error``."""
+        import openai
+
+        retryable = (
+            openai.RateLimitError,
+            openai.APIConnectionError,  # Includes APITimeoutError
+            openai.InternalServerError,
+        )
+        if isinstance(error, retryable):
+            return True
+        return getattr(error, "status_code", None) in (408, 409)
+
+    @staticmethod
+    def _retry_delay(error: Exception, attempt: int) -> float:
+        """Honor Retry-After when given, else exponential backoff with full jitter."""
+        response = getattr(error, "response", None)
+        retry_after = (
+            response.headers.get("retry-after") if response is not None else None
+        )
+        try:
+            if retry_after is not None:
+                return float(retry_after) + random.uniform(0, 1)
+        except ValueError:
+            pass
+        return random.uniform(0, min(30.0, 2.0 ** (attempt + 1)))
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+
+    def chat_completion(self, params: Dict[str, Any], call_site: str = "default"):
+        """Run a non-streaming chat completion and return the API response."""
+        started = time.monotonic()
+        with self._slot(params) as reservation:
+            try:
+                response = self._create_with_retry(
+                    self.client.chat.completions.create, params, call_site
+                )
+            except Exception:
+                self._record(call_site, calls=1, errors=1)
+                raise
+
+        self._record_usage(
+            call_site, reservation, started, getattr(response, "usage", None)
+        )
+        return response
+
+    def cached_completion(
+        self,
+        params: Dict[str, Any],
+        call_site: str = "default",
+        use_cache: bool = True,
+        app=None,
+    ) -> str:
+        """Run a chat completion, reusing a cached response for identical requests.
+
+        With ``use_cache=False`` the cache is not read, but the fresh response
+        still replaces the stored one. Returns the message content.
+        """
+        cache = llm_cache.get_cache()
+        key = cache.make_key(params) if cache else None
+
+        if cache and use_cache:
+            cached = cache.get(key)
+            if cached is not None:
+                self.record_cache_hit(call_site)
+                if app:
+                    app._add_log(
+                        "llm_cache_hit", f"Reused cached {params.get('model')} response"
+                    )
+                return cached
+
+        response = self.chat_completion(params, call_site=call_site)
+        content = response.choices[0].message.content or ""
+
+        if cache and content.strip():
+            cache.put(key, params.get("model", ""), content)
+        return content
+
+    def stream(
+        self, params: Dict[str, Any], call_site: str = "default", responses_api=False
+    ) -> Iterator[Any]:
+        """Yield streamed chunks (chat completions) or events (responses API).
+
+        The concurrency slot is held until the stream is exhausted or closed.
+        The call is recorded, and its token reservation settled with the usage
+        the stream reported, even when the consumer closes it early.
+        """
+        started = time.monotonic()
+        create = (
+            self.client.responses.create
+            if responses_api
+            else self.client.chat.completions.create
+        )
+        usage = None
+        failed = False
+        with self._slot(params) as reservation:
+            try:
+                stream = self._create_with_retry(create, params, call_site)
+                for item in stream:
+                    # Chat chunks carry usage (with include_usage); responses
+                    # API events carry it on the completed response
+                    usage = (
+                        getattr(item, "usage", None)
+                        or getattr(getattr(item, "response", None), "usage", None)
+                        or usage
+                    )
+                    yield item
+            except Exception:
+                failed = True
+                self._record(call_site, calls=1, errors=1)
+                raise
+            finally:
+                # Also runs when the consumer closes the stream early
+                if not failed:
+                    self._record_usage(call_site, reservation, started, usage)
+
+    # ------------------------------------------------------------------
+    # Instrumentation
+    # ------------------------------------------------------------------
+
+    def _record_usage(
+        self, call_site: str, reservation: list, started: float, usage: Any
+    ):
+        """Settle a reservation with the reported usage and record the call."""
+        self._settle_tokens(reservation, getattr(usage, "total_tokens", None))
+        self._record(
+            call_site,
+            calls=1,
+            latency=time.monotonic() - started,
+            # Chat completions and responses API names
+            prompt_tokens=getattr(usage, "prompt_tokens", None)
+            or getattr(usage, "input_tokens", 0)
+            or 0,
+            completion_tokens=getattr(usage, "completion_tokens", None)
+            or getattr(usage, "output_tokens", 0)
+            or 0,
+        )
+
+    def _record(self, call_site: str, **values: float):
+        with self._stats_lock:
+            stats = self._stats.setdefault(
+                call_site,
+                {
+                    "calls": 0,
+                    "errors": 0,
+                    "retries": 0,
+                    "cache_hits": 0,
+                    "latency": 0.0,
+                    "prompt_tokens": 0,
+                    "completion_tokens": 0,
+                },
+            )
+            for key, value in values.items():
+                stats[key] += value
+
+    def record_cache_hit(self, call_site: str):
+        """Count a request answered from the response cache."""
+        self._record(call_site, cache_hits=1)
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """Return a copy of the per-call-site counters."""
+        with self._stats_lock:
+            return {site: dict(stats) for site, stats in self._stats.items()}
+
+    def format_stats(self) -> str:
+        """Format per-call-site counters as one line per call site."""
+        lines = []
+        for site, stats in sorted(self.get_stats().items()):
+            calls = int(stats["calls"])
+            average = stats["latency"] / calls if calls else 0.0
+            lines.append(
+                f"{site}: {calls} calls, {int(stats['cache_hits'])} cache hits, "
+                f"{int(stats['retries'])} retries, {int(stats['errors'])} errors, "
+                f"avg {average:.2f}s, {int(stats['prompt_tokens'])} prompt / "
+                f"{int(stats['completion_tokens'])} completion tokens"
+            )
+        return "\n".join(lines)
+
+
+_gateway: Optional[LLMGateway] = None
+_gateway_lock = threading.Lock()
+
+
+def get_gateway() -> LLMGateway:
+    """Return the process-wide gateway, configured from the environment."""
+    global _gateway
+    if _gateway is None:
+        with _gateway_lock:
+            if _gateway is None:
+                _gateway = LLMGateway(
+                    max_concurrency=_env_int(
+                        "PAPERCLI_LLM_CONCURRENCY",
+                        constants.DEFAULT_LLM_MAX_CONCURRENCY,
+                    ),
+                    tpm_limit=_env_int(
+                        "PAPERCLI_LLM_TPM", constants.DEFAULT_LLM_TPM_LIMIT
+                    ),
+                    max_retries=_env_int(
+                        "PAPERCLI_LLM_MAX_RETRIES", constants.DEFAULT_LLM_MAX_RETRIES
+                    ),
+                )
+    return _gateway
@@ -5,24 +5,20 @@ import os
 import re
 import tempfile
 import xml.etree.ElementTree as ET
-from typing import TYPE_CHECKING, Any, Dict, List
-
-import bibtexparser
-import PyPDF2
-import requests
-import rispy
-from bs4 import BeautifulSoup
-from ng.db.database import get_db_manager
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Tuple
+
 from ng.services import (
     constants,
     fix_broken_lines,
     http_utils,
+    llm_gateway,
     llm_utils,
     normalize_paper_data,
     prompts,
     sanitize_for_logging,
+    snapshot_store,
+    venue,
 )
-from openai import OpenAI
 
 if TYPE_CHECKING:
     from ng.services import PDFManager
@@ -40,15 +36,38 @@ def _truncate_for_logging(content: str, max_chars: int = 300) -> tuple[str, str]
     return content, f"({len(content)} chars)"
 
 
+# Identifiers commonly printed on the first page of a paper
+_ARXIV_ID_PATTERN = re.compile(
+    r"(?:arxiv\s*:\s*|arxiv\.org/(?:abs|pdf)/)(\d{4}\.\d{4,5})(v\d+)?",
+    re.IGNORECASE,
+)
+_DOI_PATTERN = re.compile(r"\b(10\.\d{4,9}/[^\s\"<>]+)", re.IGNORECASE)
+_OPENREVIEW_ID_PATTERN = re.compile(
+    r"openreview\.net/(?:forum|pdf)\?id=([A-Za-z0-9_\-]+)", re.IGNORECASE
+)
+# "@article{", "@string (" ... at column 0 always begins a new BibTeX block
+_BIBTEX_ENTRY_START = re.compile(r"@[A-Za-z]+\s*[{(]")
+
+
+def _alnum_key(text: str) -> str:
+    """Lowercase alphanumeric-only form used to match titles against page text."""
+    return re.sub(r"[^a-z0-9]", "", (text or "").lower())
+
+
 class MetadataExtractor:
     """Service for extracting metadata from various sources."""
 
+    # Process-wide counters for the identifier fast path in extract_from_pdf
+    _identifier_stats = {"hits": 0, "total": 0}
+
     def __init__(self, pdf_manager: PDFManager, app):
         self.app = app
         self.pdf_manager = pdf_manager
 
     def extract_from_arxiv(self, arxiv_id: str) -> Dict[str, Any]:
         """Extract metadata from arXiv."""
+        import requests
+
         arxiv_id = re.sub(r"arxiv[:\s]*", "", arxiv_id, flags=re.IGNORECASE)
         arxiv_id = re.sub(
             r"[^\d\.v]", "", arxiv_id
@@ -124,6 +143,8 @@ class MetadataExtractor:
 
     def extract_from_dblp(self, dblp_url: str) -> Dict[str, Any]:
         """Extract metadata from DBLP URL using BibTeX endpoint with LLM venue enhancement."""
+        import requests
+
         try:
             # Convert DBLP HTML URL to BibTeX URL
             bib_url = self._convert_dblp_url_to_bib(dblp_url)
@@ -187,13 +208,29 @@ class MetadataExtractor:
 
         return bib_url
 
+    def _complete_chat(
+        self, params: Dict[str, Any], call_site: str, use_cache: bool = True
+    ) -> str:
+        """Run a chat completion through the gateway's response cache."""
+        return llm_gateway.get_gateway().cached_completion(
+            params, call_site, use_cache=use_cache, app=self.app
+        )
+
     def _extract_venue_with_llm(self, venue_field: str) -> Dict[str, str]:
-        """Extract venue name and acronym using LLM."""
+        """Extract venue name and acronym, asking the LLM only for unknown venues."""
         if not venue_field:
             return {"venue_full": "", "venue_acronym": ""}
 
-        # Initialize chat service if not available
-        client = OpenAI()
+        venues = venue.get_venue_dictionary()
+        known = venues.lookup(venue_field)
+        if known:
+            if self.app:
+                self.app._add_log(
+                    "venue_dictionary_hit",
+                    f"Resolved '{venue_field}' to {known['venue_full']} ({known['venue_acronym']})",
+                )
+            return known
+
         model_name = os.getenv("OPENAI_MODEL", constants.DEFAULT_EXTRACTION_MODEL)
 
         try:
@@ -210,20 +247,21 @@ class MetadataExtractor:
                 f"Prompt sent to {model_name} {length_info}:\n{truncated_prompt}",
             )
 
-            response = client.chat.completions.create(
-                model=model_name,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": prompts.venue_extraction_system_message(),
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                max_tokens=200,
-                temperature=0.1,
-            )
-
-            response_text = response.choices[0].message.content.strip()
+            response_text = self._complete_chat(
+                call_site="venue_extraction",
+                params={
+                    "model": model_name,
+                    "messages": [
+                        {
+                            "role": "system",
+                            "content": prompts.venue_extraction_system_message(),
+                        },
+                        {"role": "user", "content": prompt},
+                    ],
+                    "max_tokens": 200,
+                    "temperature": 0.1,
+                },
+            ).strip()
 
             # Log the LLM response
             self.app._add_log(
@@ -248,10 +286,12 @@ class MetadataExtractor:
             # Try to parse JSON response
             try:
                 venue_info = json.loads(response_text)
-                return {
+                result = {
                     "venue_full": venue_info.get("venue_full", venue_field),
                     "venue_acronym": venue_info.get("venue_acronym", ""),
                 }
+                venues.learn(venue_field, result["venue_full"], result["venue_acronym"])
+                return result
             except json.JSONDecodeError:
                 # Fallback if JSON parsing fails
                 return {
@@ -299,6 +339,8 @@ class MetadataExtractor:
 
     def extract_from_openreview(self, openreview_id: str) -> Dict[str, Any]:
         """Extract metadata from OpenReview paper ID."""
+        import requests
+
         try:
             # Clean OpenReview ID - extract just the ID part
             if openreview_id.startswith("https://openreview.net/forum?id="):
@@ -504,7 +546,13 @@ class MetadataExtractor:
         }
 
     def extract_from_pdf(self, pdf_path: str) -> Dict[str, Any]:
-        """Extract metadata from PDF file using LLM analysis of first two pages."""
+        """Extract metadata from PDF file using LLM analysis of first two pages.
+
+        Identifiers printed on page one (arXiv id, DOI, OpenReview id) are
+        resolved first; the LLM is only called when none of them match.
+        """
+        import PyPDF2
+
         if not self.pdf_manager:
             raise RuntimeError("PDFManager not set for MetadataExtractor.")
 
@@ -520,10 +568,14 @@ class MetadataExtractor:
                 # Extract text from first pages for metadata extraction
                 pages_to_extract = min(constants.DEFAULT_PDF_METADATA_PAGES, len(pdf_reader.pages))
                 text_content = ""
+                first_page_text = ""
 
                 for i in range(pages_to_extract):
                     page = pdf_reader.pages[i]
-                    text_content += page.extract_text() + "\n\n"
+                    page_text = page.extract_text()
+                    if i == 0:
+                        first_page_text = page_text or ""
+                    text_content += page_text + "\n\n"
 
                 if not text_content.strip():
                     raise Exception("Could not extract text from PDF")
@@ -531,7 +583,13 @@ class MetadataExtractor:
                 # Sanitize PDF text to remove surrogate characters that can't be encoded
                 text_content = sanitize_for_logging(text_content)
 
-            client = OpenAI()
+            # Fast path: resolve a printed identifier instead of calling the LLM
+            metadata = self._extract_from_pdf_identifiers(
+                sanitize_for_logging(first_page_text), pdf_path
+            )
+            if metadata:
+                return metadata
+
             model_name = os.getenv("OPENAI_MODEL", constants.DEFAULT_EXTRACTION_MODEL)
 
             prompt = prompts.metadata_extraction_prompt(text_content)
@@ -557,9 +615,7 @@ class MetadataExtractor:
                 {"role": "user", "content": prompt},
             ]
 
-            response = client.chat.completions.create(**params)
-
-            response_content = response.choices[0].message.content.strip()
+            response_content = self._complete_chat(params, "pdf_metadata").strip()
 
             # Log the LLM response
             self.app._add_log(
@@ -627,8 +683,113 @@ class MetadataExtractor:
         except Exception as e:
             raise Exception(f"Failed to extract metadata from PDF: {e}")
 
-    def generate_paper_summary(self, pdf_path: str) -> str:
-        """Generate an academic summary of the paper using LLM analysis of the full text."""
+    def _find_pdf_identifiers(self, text: str) -> List[Tuple[str, str]]:
+        """Find (source, identifier) candidates in page text, best first.
+
+        The first arXiv id, DOI and OpenReview id come first, in page order,
+        followed by any further ones, so a reference list full of arXiv ids
+        does not push the paper's own DOI past the lookup cap.
+        """
+        found: List[Tuple[int, str, str]] = []
+        for match in _ARXIV_ID_PATTERN.finditer(text):
+            found.append(
+                (match.start(), "arxiv", match.group(1) + (match.group(2) or ""))
+            )
+        for match in _DOI_PATTERN.finditer(text):
+            found.append((match.start(), "doi", match.group(1).rstrip(".,;:)]}")))
+        for match in _OPENREVIEW_ID_PATTERN.finditer(text):
+            found.append((match.start(), "openreview", match.group(1)))
+
+        firsts: List[Tuple[str, str]] = []
+        others: List[Tuple[str, str]] = []
+        for _, source, identifier in sorted(found):
+            candidate = (source, identifier)
+            if candidate in firsts or candidate in others:
+                continue
+            if any(seen == source for seen, _ in firsts):
+                others.append(candidate)
+            else:
+                firsts.append(candidate)
+        return firsts + others
+
+    def _extract_from_pdf_identifiers(
+        self, first_page_text: str, pdf_path: str
+    ) -> Dict[str, Any] | None:
+        """Resolve metadata from an arXiv id, DOI or OpenReview id on page one.
+
+        At most ``DEFAULT_PDF_IDENTIFIER_LOOKUPS`` candidates are looked up,
+        stopping at the first match. A candidate is accepted only if the
+        resolved title also appears in the page text, so DOIs of cited works
+        are not mistaken for the paper's own. Returns None when nothing matches
+        and the LLM should be used.
+        """
+        stats = MetadataExtractor._identifier_stats
+        stats["total"] += 1
+
+        # Each lookup is a blocking request; try only the best few
+        candidates = self._find_pdf_identifiers(first_page_text or "")[
+            : constants.DEFAULT_PDF_IDENTIFIER_LOOKUPS
+        ]
+        page_key = _alnum_key(first_page_text)
+        resolvers = {
+            "arxiv": self.extract_from_arxiv,
+            "doi": self.extract_from_doi,
+            "openreview": self.extract_from_openreview,
+        }
+
+        metadata = None
+        for source, identifier in candidates:
+            try:
+                resolved = resolvers[source](identifier)
+            except Exception as e:
+                self.app._add_log(
+                    "pdf_identifier_lookup_failed",
+                    f"Could not resolve {source} '{identifier}': {e}",
+                )
+                continue
+
+            title_key = _alnum_key(resolved.get("title", ""))
+            if not title_key or title_key not in page_key:
+                self.app._add_log(
+                    "pdf_identifier_mismatch",
+                    f"Ignoring {source} '{identifier}': title not found on first page",
+                )
+                continue
+
+            if source == "arxiv" and not resolved.get("url"):
+                resolved["url"] = f"https://arxiv.org/abs/{identifier}"
+            elif source == "doi" and not resolved.get("url"):
+                resolved["url"] = f"https://doi.org/{identifier}"
+            metadata = resolved
+            stats["hits"] += 1
+            self.app._add_log(
+                "pdf_identifier_hit",
+                f"Resolved PDF {os.path.basename(pdf_path)} via {source} '{identifier}'",
+            )
+            break
+
+        hit_rate = stats["hits"] / stats["total"] * 100
+        fallback = f"; {len(candidates)} candidate(s), falling back to LLM"
+        self.app._add_log(
+            "pdf_identifier_stats",
+            f"Identifier fast path: {stats['hits']}/{stats['total']} PDFs "
+            f"({hit_rate:.0f}%) resolved without LLM" + ("" if metadata else fallback),
+        )
+
+        if not metadata:
+            return None
+
+        if not metadata.get("authors"):
+            metadata["authors"] = ""
+        return normalize_paper_data(metadata)
+
+    def generate_paper_summary(self, pdf_path: str, use_cache: bool = True) -> str:
+        """Generate an academic summary of the paper using LLM analysis of the full text.
+
+        Pass ``use_cache=False`` to regenerate instead of reusing a cached summary.
+        """
+        import PyPDF2
+
         if not self.pdf_manager:
             raise RuntimeError("PDFManager not set for MetadataExtractor.")
 
@@ -656,7 +817,6 @@ class MetadataExtractor:
                 # Sanitize PDF text to remove surrogate characters that can't be encoded
                 full_text = sanitize_for_logging(full_text)
 
-            client = OpenAI()
             model_name = os.getenv("OPENAI_MODEL", constants.DEFAULT_CHAT_MODEL)
 
             prompt = prompts.summary_academic_summary(full_text)
@@ -682,14 +842,12 @@ class MetadataExtractor:
                 {"role": "user", "content": prompt},
             ]
 
-            response = client.chat.completions.create(**params)
-
             # Handle None or empty response from API
-            content = response.choices[0].message.content
-            if content is None:
+            content = self._complete_chat(params, "paper_summary", use_cache=use_cache)
+            if not content:
                 self.app._add_log(
                     "paper_summary_error",
-                    f"OpenAI API returned None content for PDF: {pdf_path}"
+                    f"OpenAI API returned empty content for PDF: {pdf_path}",
                 )
                 return ""
 
@@ -716,24 +874,22 @@ class MetadataExtractor:
             )
             return ""  # Return empty string if summarization fails, don't break the workflow
 
-    def generate_webpage_summary(self, html_snapshot_path: str) -> str:
-        """Generate an academic summary of a webpage using LLM analysis of the HTML content."""
+    def generate_webpage_summary(
+        self, html_snapshot_path: str, use_cache: bool = True
+    ) -> str:
+        """Generate an academic summary of a webpage using LLM analysis of the HTML content.
+
+        Pass ``use_cache=False`` to regenerate instead of reusing a cached summary.
+        """
         try:
             # Get absolute path to HTML snapshot
-            db_manager = get_db_manager()
-            data_dir = os.path.dirname(db_manager.db_path)
-            html_snapshot_dir = os.path.join(data_dir, "html_snapshots")
-            html_absolute_path = os.path.join(html_snapshot_dir, html_snapshot_path)
+            html_absolute_path = snapshot_store.snapshot_path(html_snapshot_path)
 
             if not os.path.exists(html_absolute_path):
                 return ""
 
-            # Read HTML and extract text
-            with open(html_absolute_path, "r", encoding="utf-8") as f:
-                html_content = f.read()
-
-            soup = BeautifulSoup(html_content, "html.parser")
-            full_text = soup.get_text(separator="\n", strip=True)
+            # Extracted text is cached alongside the snapshot
+            full_text = snapshot_store.snapshot_text(html_absolute_path)
 
             if not full_text.strip():
                 return ""
@@ -746,7 +902,6 @@ class MetadataExtractor:
             # Sanitize HTML text to remove surrogate characters that can't be encoded
             full_text = sanitize_for_logging(full_text)
 
-            client = OpenAI()
             model_name = os.getenv("OPENAI_MODEL", constants.DEFAULT_CHAT_MODEL)
 
             prompt = prompts.summary_academic_summary(full_text)
@@ -772,14 +927,14 @@ class MetadataExtractor:
                 {"role": "user", "content": prompt},
             ]
 
-            response = client.chat.completions.create(**params)
-
             # Handle None or empty response from API
-            content = response.choices[0].message.content
-            if content is None:
+            content = self._complete_chat(
+                params, "webpage_summary", use_cache=use_cache
+            )
+            if not content:
                 self.app._add_log(
                     "webpage_summary_error",
-                    f"OpenAI API returned None content for HTML: {html_absolute_path}"
+                    f"OpenAI API returned empty content for HTML: {html_absolute_path}",
                 )
                 return ""
 
@@ -808,94 +963,218 @@ class MetadataExtractor:
 
     def extract_from_bibtex(self, bib_path: str) -> List[Dict[str, Any]]:
         """Extract metadata from BibTeX file."""
+        import bibtexparser
+
         try:
             with open(bib_path, "r", encoding="utf-8") as file:
                 bib_database = bibtexparser.load(file)
 
-            papers_metadata = []
+            return [self._bibtex_entry_to_metadata(e) for e in bib_database.entries]
 
-            for entry in bib_database.entries:
-                metadata = {
-                    "title": entry.get("title", "").replace("{ ", "").replace("}", ""),
-                    "abstract": entry.get("abstract", ""),
-                    "year": (
-                        int(entry.get("year"))
-                        if entry.get("year", "").isdigit()
-                        else None
-                    ),
-                    "venue_full": entry.get("booktitle") or entry.get("journal", ""),
-                    "venue_acronym": "",
-                    "paper_type": self._infer_paper_type_from_bibtex(entry),
-                    "doi": entry.get("doi", ""),
-                    "url": entry.get("url", ""),
-                    "category": "",
-                    "pdf_path": None,
-                    "preprint_id": entry.get("eprint", ""),
-                    "volume": entry.get("volume", ""),
-                    "issue": entry.get("number", ""),
-                    "pages": entry.get("pages", ""),
-                }
+        except Exception as e:
+            raise Exception(f"Failed to extract metadata from BibTeX file: {e}")
+
+    def _bibtex_entry_to_metadata(self, entry: Dict[str, str]) -> Dict[str, Any]:
+        """Convert a parsed BibTeX entry into paper metadata."""
+        metadata = {
+            "title": entry.get("title", "").replace("{ ", "").replace("}", ""),
+            "abstract": entry.get("abstract", ""),
+            "year": (
+                int(entry.get("year")) if entry.get("year", "").isdigit() else None
+            ),
+            "venue_full": entry.get("booktitle") or entry.get("journal", ""),
+            "venue_acronym": "",
+            "paper_type": self._infer_paper_type_from_bibtex(entry),
+            "doi": entry.get("doi", ""),
+            "url": entry.get("url", ""),
+            "category": "",
+            "pdf_path": None,
+            "preprint_id": entry.get("eprint", ""),
+            "volume": entry.get("volume", ""),
+            "issue": entry.get("number", ""),
+            "pages": entry.get("pages", ""),
+        }
 
-                metadata["authors"] = entry.get("author", "")
+        metadata["authors"] = entry.get("author", "")
 
-                papers_metadata.append(metadata)
+        return metadata
 
-            return papers_metadata
+    def iter_bibtex_entries(self, bib_path: str) -> Iterator[Dict[str, Any]]:
+        """Stream a BibTeX file one entry at a time.
 
-        except Exception as e:
-            raise Exception(f"Failed to extract metadata from BibTeX file: {e}")
+        Entries are split on top-level ``@`` lines and parsed individually, so
+        memory use is bounded by the largest entry rather than the file. Every
+        yielded item is a dict with ``metadata`` (or None), ``error`` (or None),
+        ``position`` (bytes consumed so far) and ``size`` (total bytes). A
+        malformed entry produces an item with ``error`` set instead of aborting.
+        """
+        import bibtexparser
+
+        size = os.path.getsize(bib_path)
+        # One parser for the whole file: its grammar is built once, and
+        # @string macros parsed into its database stay visible to later entries
+        parser = bibtexparser.bparser.BibTexParser(common_strings=True)
+        parser.expect_multiple_parse = True
+        database = parser.bib_database
+
+        for chunk, position, complete in self._iter_bibtex_chunks(bib_path):
+            header = chunk.lstrip()[:10].lower()
+            if header.startswith(("@comment", "@preamble")):
+                continue
+
+            try:
+                if not complete:
+                    raise ValueError("unbalanced braces")
+                del database.entries[:]
+                parser.parse(chunk)
+                if header.startswith("@string"):
+                    continue
+                if not database.entries:
+                    raise ValueError("unparseable entry")
+                for entry in database.entries:
+                    yield {
+                        "metadata": self._bibtex_entry_to_metadata(entry),
+                        "error": None,
+                        "position": position,
+                        "size": size,
+                    }
+            except Exception as e:
+                first_line = chunk.strip().splitlines()[0][:80] if chunk.strip() else ""
+                yield {
+                    "metadata": None,
+                    "error": f"Skipped BibTeX entry '{first_line}': {e}",
+                    "position": position,
+                    "size": size,
+                }
+
+    def _iter_bibtex_chunks(self, bib_path: str) -> Iterator[Tuple[str, int, bool]]:
+        """Yield (raw_entry_text, bytes_read, balanced) for each top-level block.
+
+        A line starting with ``@type{`` at column 0 always starts a new block,
+        so an entry with an unbalanced ``{`` is reported on its own instead of
+        swallowing the rest of the file.
+        """
+        buffer: List[str] = []
+        depth = 0
+        position = 0
+
+        with open(bib_path, "rb") as file:
+            for raw_line in file:
+                position += len(raw_line)
+                line = raw_line.decode("utf-8", errors="replace")
+
+                starts_entry = _BIBTEX_ENTRY_START.match(line) is not None
+                if starts_entry or (depth <= 0 and line.lstrip().startswith("@")):
+                    if buffer:
+                        yield "".join(buffer), position - len(raw_line), depth <= 0
+                    buffer = []
+                    depth = 0
+
+                if buffer or line.lstrip().startswith("@"):
+                    buffer.append(line)
+                    unescaped = line.replace("\\{", "").replace("\\}", "")
+                    depth += unescaped.count("{") - unescaped.count("}")
+
+            if buffer:
+                yield "".join(buffer), position, depth <= 0
 
     def extract_from_ris(self, ris_path: str) -> List[Dict[str, Any]]:
         """Extract metadata from RIS file."""
+        import rispy
+
         try:
             with open(ris_path, "r", encoding="utf-8") as file:
                 entries = rispy.load(file)
 
-            papers_metadata = []
+            return [self._ris_entry_to_metadata(entry) for entry in entries]
 
-            for entry in entries:
-                metadata = {
-                    "title": entry.get("title", "") or entry.get("primary_title", ""),
-                    "abstract": entry.get("abstract", ""),
-                    "year": int(entry.get("year")) if entry.get("year") else None,
-                    "venue_full": entry.get("journal_name", "")
-                    or entry.get("secondary_title", ""),
-                    "venue_acronym": entry.get("alternate_title1", ""),
-                    "paper_type": self._infer_paper_type_from_ris(entry),
-                    "doi": entry.get("doi", ""),
-                    "url": entry.get("url", ""),
-                    "category": "",
-                    "pdf_path": None,
-                    "preprint_id": "",
-                    "volume": entry.get("volume", ""),
-                    "issue": entry.get("number", ""),
-                    "pages": entry.get("start_page", "")
-                    + (
-                        "-" + entry.get("end_page", "") if entry.get("end_page") else ""
-                    ),
+        except Exception as e:
+            raise Exception(f"Failed to extract metadata from RIS file: {e}")
+
+    def _ris_entry_to_metadata(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a parsed RIS entry into paper metadata."""
+        metadata = {
+            "title": entry.get("title", "") or entry.get("primary_title", ""),
+            "abstract": entry.get("abstract", ""),
+            "year": int(entry.get("year")) if entry.get("year") else None,
+            "venue_full": entry.get("journal_name", "")
+            or entry.get("secondary_title", ""),
+            "venue_acronym": entry.get("alternate_title1", ""),
+            "paper_type": self._infer_paper_type_from_ris(entry),
+            "doi": entry.get("doi", ""),
+            "url": entry.get("url", ""),
+            "category": "",
+            "pdf_path": None,
+            "preprint_id": "",
+            "volume": entry.get("volume", ""),
+            "issue": entry.get("number", ""),
+            "pages": entry.get("start_page", "")
+            + ("-" + entry.get("end_page", "") if entry.get("end_page") else ""),
+        }
+
+        authors = entry.get("authors", []) or entry.get("first_authors", [])
+        if authors:
+            author_names = [
+                (
+                    f"{author.get('given', '')} {author.get('family', '')}".strip()
+                    if isinstance(author, dict)
+                    else str(author)
+                )
+                for author in authors
+            ]
+            # Convert to string format that normalize_author_names expects
+            metadata["authors"] = " and ".join(author_names)
+        else:
+            metadata["authors"] = ""
+
+        return metadata
+
+    def iter_ris_entries(self, ris_path: str) -> Iterator[Dict[str, Any]]:
+        """Stream a RIS file one record at a time.
+
+        Records are split on ``ER  -`` lines and parsed individually. Yields the
+        same ``metadata``/``error``/``position``/``size`` dicts as
+        ``iter_bibtex_entries``; a malformed record is reported, not raised.
+        """
+        import rispy
+
+        size = os.path.getsize(ris_path)
+        buffer: List[str] = []
+        position = 0
+
+        def parse(record: str) -> Dict[str, Any]:
+            try:
+                entries = rispy.loads(record)
+                if not entries:
+                    raise ValueError("unparseable record")
+                return {
+                    "metadata": self._ris_entry_to_metadata(entries[0]),
+                    "error": None,
+                    "position": position,
+                    "size": size,
+                }
+            except Exception as e:
+                first_line = record.strip().splitlines()[0][:80]
+                return {
+                    "metadata": None,
+                    "error": f"Skipped RIS record '{first_line}': {e}",
+                    "position": position,
+                    "size": size,
                 }
 
-                authors = entry.get("authors", []) or entry.get("first_authors", [])
-                if authors:
-                    author_names = [
-                        (
-                            f"{author.get('given', '')} {author.get('family', '')}".strip()
-                            if isinstance(author, dict)
-                            else str(author)
-                        )
-                        for author in authors
-                    ]
-                    # Convert to string format that normalize_author_names expects
-                    metadata["authors"] = " and ".join(author_names)
-                else:
-                    metadata["authors"] = ""
-
-                papers_metadata.append(metadata)
-
-            return papers_metadata
+        with open(ris_path, "rb") as file:
+            for raw_line in file:
+                position += len(raw_line)
+                line = raw_line.decode("utf-8-sig", errors="replace")
+                if not buffer and not line.strip():
+                    continue
+                buffer.append(line)
+                if line.startswith("ER  -"):
+                    yield parse("".join(buffer))
+                    buffer = []
 
-        except Exception as e:
-            raise Exception(f"Failed to extract metadata from RIS file: {e}")
+        if any(line.strip() for line in buffer):
+            yield parse("".join(buffer) + "ER  - \n")
 
     def _infer_paper_type_from_bibtex(self, entry: Dict[str, str]) -> str:
         """Infer paper type from BibTeX entry type."""
@@ -929,6 +1208,8 @@ class MetadataExtractor:
 
     def extract_from_doi(self, doi: str) -> Dict[str, Any]:
         """Extract metadata from DOI using Crossref API."""
+        import requests
+
         doi = doi.strip()
         if doi.startswith("http"):
             # Extract DOI from URL like https://doi.org/10.1000/example
@@ -1028,6 +1309,8 @@ class MetadataExtractor:
         Returns:
             Dictionary with paper metadata
         """
+        from bs4 import BeautifulSoup
+
         try:
             soup = BeautifulSoup(html_content, "html.parser")
 
@@ -1036,7 +1319,6 @@ class MetadataExtractor:
 
             text_content = soup.get_text(separator="\n", strip=True)
 
-            client = OpenAI()
             model_name = os.getenv("OPENAI_MODEL", constants.DEFAULT_EXTRACTION_MODEL)
 
             prompt = prompts.webpage_metadata_extraction_prompt(text_content, url)
@@ -1062,8 +1344,7 @@ class MetadataExtractor:
                 {"role": "user", "content": prompt},
             ]
 
-            response = client.chat.completions.create(**params)
-            response_content = response.choices[0].message.content.strip()
+            response_content = self._complete_chat(params, "webpage_metadata").strip()
 
             if self.app:
                 self.app._add_log(
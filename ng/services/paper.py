@@ -1,15 +1,32 @@
 from __future__ import annotations
 
 import os
+import re
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from ng.db.database import get_db_session
 from ng.db.models import Author, Collection, Paper, PaperAuthor
-from ng.services import PDFManager, paper_tracker
+from ng.services import PDFManager, paper_tracker, venue
 from pluralizer import Pluralizer
-from sqlalchemy import text
-from sqlalchemy.orm import joinedload
+from sqlalchemy import inspect, text
+from sqlalchemy.orm import selectinload
+
+
+class BulkImportIndex:
+    """Lookup state shared by the ``add_papers_bulk`` batches of one import.
+
+    The duplicate index of the library is read once, on the first batch, and
+    then extended with the ids each batch inserts. Authors and collections
+    resolved by earlier batches are kept detached and re-attached without a
+    query when a later batch needs them.
+    """
+
+    def __init__(self):
+        # Duplicate key -> paper id (None while still pending in a batch)
+        self.existing: Optional[Dict[tuple, Optional[int]]] = None
+        self.authors_by_name: Dict[str, Author] = {}
+        self.collections_by_name: Dict[str, Collection] = {}
 
 
 class PaperService:
@@ -25,8 +42,8 @@ class PaperService:
             papers = (
                 session.query(Paper)
                 .options(
-                    joinedload(Paper.paper_authors).joinedload(PaperAuthor.author),
-                    joinedload(Paper.collections),
+                    selectinload(Paper.paper_authors).selectinload(PaperAuthor.author),
+                    selectinload(Paper.collections),
                 )
                 .order_by(Paper.added_date.desc())
                 .all()
@@ -49,8 +66,8 @@ class PaperService:
             paper = (
                 session.query(Paper)
                 .options(
-                    joinedload(Paper.paper_authors).joinedload(PaperAuthor.author),
-                    joinedload(Paper.collections),
+                    selectinload(Paper.paper_authors).selectinload(PaperAuthor.author),
+                    selectinload(Paper.collections),
                 )
                 .filter(Paper.id == paper_id)
                 .first()
@@ -228,6 +245,12 @@ class PaperService:
                     details = paper_tracker.format_change_log_details(paper.id, changes)
                     self.app._add_log("paper_update_fields", details)
 
+                # A user-edited venue is a confirmed full name / acronym pair
+                if "venue_full" in paper_data or "venue_acronym" in paper_data:
+                    venue.get_venue_dictionary().learn(
+                        paper.venue_full, paper.venue_full, paper.venue_acronym
+                    )
+
                 if self.app:
                     self.app._add_log(
                         "paper_update",
@@ -259,6 +282,62 @@ class PaperService:
                     )
                 return None, f"Failed to update paper: {str(e)}"
 
+    def update_papers_bulk(
+        self, updates: Dict[int, Dict[str, Any]]
+    ) -> tuple[List[int], List[str]]:
+        """Update simple fields (e.g. notes) of many papers in one transaction.
+
+        Unlike update_paper this does not process PDFs, authors or collections;
+        it writes one log entry and enqueues a single auto-sync operation.
+
+        Returns:
+            tuple[List[int], List[str]]: (updated_paper_ids, error_messages)
+        """
+        if not updates:
+            return [], []
+
+        updated_ids: List[int] = []
+        errors: List[str] = []
+        with get_db_session() as session:
+            try:
+                papers = session.query(Paper).filter(Paper.id.in_(list(updates))).all()
+                found = {paper.id: paper for paper in papers}
+                now = datetime.now()
+
+                for paper_id, fields in updates.items():
+                    paper = found.get(paper_id)
+                    if paper is None:
+                        errors.append(f"Paper with ID {paper_id} not found")
+                        continue
+                    for key, value in fields.items():
+                        if hasattr(paper, key):
+                            setattr(paper, key, value)
+                    paper.modified_date = now
+                    updated_ids.append(paper_id)
+
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                if self.app:
+                    self.app._add_log(
+                        "paper_update_bulk_error",
+                        f"Failed to update {self._pluralizer.pluralize('paper', len(updates), True)}: {e}",
+                    )
+                return [], [f"Failed to update papers: {e}"]
+
+        if self.app and updated_ids:
+            fields = sorted({key for item in updates.values() for key in item})
+            self.app._add_log(
+                "paper_update_bulk",
+                f"Updated {', '.join(fields)} of {self._pluralizer.pluralize('paper', len(updated_ids), True)}",
+            )
+            if hasattr(self.app, "auto_sync_service"):
+                self.app.auto_sync_service.enqueue(
+                    {"resource": "paper", "op": "bulk_edit", "ids": updated_ids}
+                )
+
+        return updated_ids, errors
+
     def delete_paper(self, paper_id: int) -> bool:
         """Delete a paper and its associated PDF file."""
         with get_db_session() as session:
@@ -443,8 +522,8 @@ class PaperService:
             paper_with_relationships = (
                 session.query(Paper)
                 .options(
-                    joinedload(Paper.paper_authors).joinedload(PaperAuthor.author),
-                    joinedload(Paper.collections),
+                    selectinload(Paper.paper_authors).selectinload(PaperAuthor.author),
+                    selectinload(Paper.collections),
                 )
                 .filter(Paper.id == paper.id)
                 .first()
@@ -476,6 +555,286 @@ class PaperService:
 
             return paper_with_relationships
 
+    @staticmethod
+    def _title_key(title: str | None) -> str:
+        """Normalize a title for duplicate detection (case/punctuation-insensitive)."""
+        return re.sub(r"[^a-z0-9]+", " ", (title or "").lower()).strip()
+
+    @classmethod
+    def _duplicate_key(cls, paper_data: Dict[str, Any]) -> Optional[tuple]:
+        """Return the identity key used for duplicate detection.
+
+        Mirrors add_paper_from_metadata: preprint id first, then DOI, then title.
+        """
+        if paper_data.get("preprint_id"):
+            return ("preprint_id", str(paper_data["preprint_id"]).strip().lower())
+        if paper_data.get("doi"):
+            return ("doi", str(paper_data["doi"]).strip().lower())
+        if paper_data.get("title"):
+            return ("title", cls._title_key(paper_data["title"]))
+        return None
+
+    def add_papers_bulk(
+        self,
+        papers_data: List[Dict[str, Any]],
+        chunk_size: int = 500,
+        index: Optional[BulkImportIndex] = None,
+    ) -> tuple[List[Paper], List[str]]:
+        """Insert many papers at once (BibTeX/RIS imports).
+
+        Each item is a paper data dict with ``authors`` (list of names) and an
+        optional ``collections`` list of names. Duplicates are detected against
+        in-memory indexes of existing preprint ids, DOIs and normalized titles
+        (and against earlier items in the same batch), authors and collections
+        are resolved in one pass per chunk, and each chunk is committed as a
+        single transaction. If a chunk fails, its entries are retried one at a
+        time so only the offending ones are reported as errors.
+
+        Pass the same ``index`` to every call of a multi-batch import so the
+        library is scanned for duplicates only once.
+
+        Returns:
+            tuple[List[Paper], List[str]]: (added_papers, error_messages)
+        """
+        added: List[Paper] = []
+        errors: List[str] = []
+        if not papers_data:
+            return added, errors
+
+        with get_db_session() as session:
+            # Keep attribute state after each chunk commit so the detached
+            # papers (and their author links) stay usable by callers.
+            session.expire_on_commit = False
+
+            index = index or BulkImportIndex()
+            if index.existing is None:
+                index.existing = self._load_duplicate_index(session)
+            existing = index.existing
+
+            authors_by_name: Dict[str, Author] = {}
+            collections_by_name: Dict[str, Collection] = {}
+            had_failure = False
+
+            for start in range(0, len(papers_data), chunk_size):
+                chunk = papers_data[start : start + chunk_size]
+                pending: List[tuple] = []
+
+                for item in chunk:
+                    paper_data = dict(item)
+                    authors = [
+                        str(a).strip()
+                        for a in (paper_data.pop("authors", None) or [])
+                        if str(a).strip()
+                    ]
+                    collections = paper_data.pop("collections", None) or []
+                    title = paper_data.get("title", "Unknown")
+
+                    key = self._duplicate_key(paper_data)
+                    if key and key in existing:
+                        existing_id = existing[key]
+                        if existing_id is None:
+                            reason = "Duplicate entry in import file"
+                        else:
+                            reason = (
+                                f"Paper already exists in database (ID: {existing_id})"
+                            )
+                        errors.append(f"Failed to add paper '{title}': {reason}")
+                        continue
+                    if key:
+                        # Placeholder until the chunk is flushed and ids are known
+                        existing[key] = None
+
+                    pending.append((key, paper_data, authors, collections))
+
+                if not pending:
+                    continue
+
+                try:
+                    chunk_papers = self._insert_bulk_chunk(
+                        session, index, pending, authors_by_name, collections_by_name
+                    )
+                except Exception as e:
+                    session.rollback()
+                    had_failure = True
+                    self._forget_unsaved(authors_by_name, collections_by_name)
+                    if len(pending) == 1:
+                        existing.pop(pending[0][0], None)
+                        errors.append(
+                            f"Failed to add paper '{pending[0][1].get('title', 'Unknown')}': {e}"
+                        )
+                        continue
+                    # Retry one entry at a time so only the offending ones fail
+                    chunk_papers = []
+                    for entry in pending:
+                        try:
+                            chunk_papers += self._insert_bulk_chunk(
+                                session,
+                                index,
+                                [entry],
+                                authors_by_name,
+                                collections_by_name,
+                            )
+                        except Exception as e:
+                            session.rollback()
+                            self._forget_unsaved(authors_by_name, collections_by_name)
+                            existing.pop(entry[0], None)
+                            errors.append(
+                                f"Failed to add paper '{entry[1].get('title', 'Unknown')}': {e}"
+                            )
+
+                for key, paper in chunk_papers:
+                    if key:
+                        existing[key] = paper.id
+                    added.append(paper)
+
+            if had_failure:
+                # A rollback expires everything; reload what callers will read
+                for paper in added:
+                    for paper_author in paper.paper_authors:
+                        _ = paper_author.author.full_name
+                    _ = paper.collections
+
+            for cache, resolved in (
+                (index.authors_by_name, authors_by_name),
+                (index.collections_by_name, collections_by_name),
+            ):
+                cache.update(
+                    (name, row)
+                    for name, row in resolved.items()
+                    if inspect(row).persistent
+                )
+            session.expunge_all()
+
+        if self.app and added:
+            self.app._add_log(
+                "paper_add_bulk",
+                f"Added {self._pluralizer.pluralize('paper', len(added), True)} "
+                f"in bulk (IDs {added[0].id}-{added[-1].id})",
+            )
+            # Enqueue a single auto-sync operation for the whole batch
+            if hasattr(self.app, "auto_sync_service"):
+                self.app.auto_sync_service.enqueue(
+                    {
+                        "resource": "paper",
+                        "op": "bulk_add",
+                        "ids": [paper.id for paper in added],
+                    }
+                )
+
+        return added, errors
+
+    def _insert_bulk_chunk(
+        self,
+        session,
+        index: BulkImportIndex,
+        pending: List[tuple],
+        authors_by_name: Dict[str, Author],
+        collections_by_name: Dict[str, Collection],
+    ) -> List[tuple]:
+        """Insert and commit ``pending`` entries, returning (key, paper) pairs."""
+        author_names = [a for p in pending for a in p[2]]
+        collection_names = [c for p in pending for c in p[3]]
+        self._attach_cached(
+            session, index.authors_by_name, authors_by_name, author_names
+        )
+        self._attach_cached(
+            session, index.collections_by_name, collections_by_name, collection_names
+        )
+        self._resolve_authors(session, authors_by_name, author_names)
+        self._resolve_collections(session, collections_by_name, collection_names)
+
+        chunk_papers = []
+        for key, paper_data, authors, collections in pending:
+            paper = Paper()
+            for field, value in paper_data.items():
+                if hasattr(paper, field) and value is not None:
+                    setattr(paper, field, value)
+            paper.paper_authors = [
+                PaperAuthor(author=authors_by_name[name], position=position)
+                for position, name in enumerate(authors)
+            ]
+            paper.collections = list(
+                {name: collections_by_name[name] for name in collections}.values()
+            )
+            chunk_papers.append((key, paper))
+
+        session.add_all([paper for _, paper in chunk_papers])
+        session.commit()
+        return chunk_papers
+
+    @staticmethod
+    def _forget_unsaved(*resolved: Dict[str, Any]) -> None:
+        """Drop rows created in a rolled-back transaction from the name maps."""
+        for rows in resolved:
+            for name in [n for n, row in rows.items() if not inspect(row).persistent]:
+                del rows[name]
+
+    def _load_duplicate_index(self, session) -> Dict[tuple, Optional[int]]:
+        """Map the duplicate keys of every paper in the library to its id."""
+        existing: Dict[tuple, Optional[int]] = {}
+        for paper_id, preprint_id, doi, title in session.query(
+            Paper.id, Paper.preprint_id, Paper.doi, Paper.title
+        ):
+            if preprint_id:
+                existing.setdefault(
+                    ("preprint_id", preprint_id.strip().lower()), paper_id
+                )
+            if doi:
+                existing.setdefault(("doi", doi.strip().lower()), paper_id)
+            if title:
+                existing.setdefault(("title", self._title_key(title)), paper_id)
+        return existing
+
+    @staticmethod
+    def _attach_cached(session, cache: Dict[str, Any], resolved: Dict[str, Any], names):
+        """Attach rows resolved by an earlier batch to ``session`` without a query."""
+        for name in set(names):
+            if name not in resolved and name in cache:
+                resolved[name] = session.merge(cache[name], load=False)
+
+    @staticmethod
+    def _resolve_authors(
+        session, authors_by_name: Dict[str, Author], names: List[str]
+    ) -> None:
+        """Load or create Author rows for ``names`` into ``authors_by_name``."""
+        missing = list({n for n in names if n not in authors_by_name})
+        # Stay well below SQLite's bound-parameter limit
+        for start in range(0, len(missing), 500):
+            batch = missing[start : start + 500]
+            for author in session.query(Author).filter(Author.full_name.in_(batch)):
+                authors_by_name.setdefault(author.full_name, author)
+
+        new_authors = [
+            Author(full_name=name) for name in missing if name not in authors_by_name
+        ]
+        if new_authors:
+            session.add_all(new_authors)
+            session.flush()
+            for author in new_authors:
+                authors_by_name[author.full_name] = author
+
+    @staticmethod
+    def _resolve_collections(
+        session, collections_by_name: Dict[str, Collection], names: List[str]
+    ) -> None:
+        """Load or create Collection rows for ``names`` into ``collections_by_name``."""
+        missing = list({n for n in names if n not in collections_by_name})
+        if not missing:
+            return
+        for collection in session.query(Collection).filter(
+            Collection.name.in_(missing)
+        ):
+            collections_by_name[collection.name] = collection
+
+        new_collections = [
+            Collection(name=name) for name in missing if name not in collections_by_name
+        ]
+        if new_collections:
+            session.add_all(new_collections)
+            session.flush()
+            for collection in new_collections:
+                collections_by_name[collection.name] = collection
+
     def prepare_paper_data_for_edit(self, paper) -> dict:
         """Prepare paper data dictionary for EditDialog from a Paper model instance.
 
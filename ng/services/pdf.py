@@ -9,7 +9,6 @@ import time
 import traceback
 from typing import Any, Callable, Dict, Optional, Tuple
 
-import PyPDF2
 from ng.db.database import get_pdf_directory
 from ng.services import MetadataExtractor, format_file_size, http_utils
 from pluralizer import Pluralizer
@@ -25,6 +24,8 @@ class PDFService:
 
     def get_pdf_page_count(self, pdf_path: str) -> int:
         """Get page count from PDF file."""
+        import PyPDF2
+
         try:
             with open(pdf_path, "rb") as file:
                 pdf_reader = PyPDF2.PdfReader(file)
@@ -98,6 +99,8 @@ class PDFManager:
 
     def get_pdf_info(self, relative_path: str) -> Dict[str, Any]:
         """Get PDF file information including size and page count."""
+        import PyPDF2
+
         info = {
             "exists": False,
             "size_bytes": 0,
@@ -47,6 +47,54 @@ def chat_paper_context_header() -> str:
     return "Papers for discussion:\n\n"
 
 
+def chat_excerpts_message(excerpts: str) -> str:
+    """Excerpts retrieved for the current question, sent after the history."""
+    return f"""Excerpts from the attached papers most relevant to the next question. Treat them as part of the paper information provided above.
+
+{excerpts}"""
+
+
+def chat_history_summary_message(summary: str) -> str:
+    """Carries the summary of compacted earlier chat turns."""
+    return f"""Summary of the earlier part of this conversation:
+
+{summary}"""
+
+
+def chat_history_compaction_system_message() -> str:
+    """System message for compacting older chat turns."""
+    return (
+        "You condense conversations about academic papers into faithful, compact notes."
+    )
+
+
+def chat_history_compaction_prompt(previous_summary: str, transcript: str) -> str:
+    """Prompt to fold older chat turns into a running summary."""
+    previous = (
+        f"Summary of the conversation so far:\n{previous_summary}\n\n"
+        if previous_summary
+        else ""
+    )
+    return f"""{previous}Further conversation turns:
+{transcript}
+
+Write an updated summary of the whole conversation above for continuing it later. Keep the user's questions and goals, the key facts, numbers and conclusions from the answers, and which paper (e.g., "Paper 1") each point refers to. Do not add information that is not in the conversation. Use concise bullet points."""
+
+
+def chat_digest_system_message() -> str:
+    """System message for condensing one paper for a multi-paper chat."""
+    return "You condense academic papers into short, information-dense digests for later question answering."
+
+
+def chat_digest_prompt(title: str, text: str) -> str:
+    """Prompt to condense one paper's text into a question-independent digest."""
+    return f"""Paper: {title}
+
+{text}
+
+Write a digest of this paper in at most 200 words covering: the problem, the approach, the main results (with key numbers), and the limitations. Use only information from the text above."""
+
+
 # Paper summarization prompts
 def summary_academic_summary(full_text: str) -> str:
     """Comprehensive academic paper summary prompt."""
@@ -0,0 +1,215 @@
+"""
+Local retrieval for chat context packing.
+
+Documents are split into small chunks, scored against the user's question with
+BM25, and the best chunks are packed into a token budget. Everything runs
+in-process with no network or model downloads.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import re
+from collections import Counter
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from . import constants
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+_STOPWORDS = frozenset("""
+    a about above after again against all also am an and any are as at be because
+    been before being below between both but by can could did do does doing down
+    during each few for from further had has have having he her here hers him his
+    how i if in into is it its itself just me more most my no nor not now of off on
+    once only or other our ours out over own same she should so some such than that
+    the their theirs them then there these they this those through to too under
+    until up very was we were what when where which while who whom why will with
+    would you your yours paper papers
+    """.split())
+
+
+def is_enabled() -> bool:
+    """Whether chat context uses retrieval (PAPERCLI_CHAT_RETRIEVAL, default on)."""
+    value = os.getenv("PAPERCLI_CHAT_RETRIEVAL", "true").strip().strip("'\"").lower()
+    return value not in {"0", "false", "no", "off"}
+
+
+def context_token_budget() -> int:
+    """Token budget for retrieved excerpts across all papers in a chat."""
+    try:
+        return int(
+            os.getenv(
+                "PAPERCLI_CHAT_CONTEXT_TOKENS",
+                str(constants.DEFAULT_CHAT_CONTEXT_TOKENS),
+            )
+        )
+    except ValueError:
+        return constants.DEFAULT_CHAT_CONTEXT_TOKENS
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens without stopwords or single characters."""
+    return [
+        token
+        for token in _TOKEN_PATTERN.findall(text.lower())
+        if len(token) > 1 and token not in _STOPWORDS
+    ]
+
+
+class Chunk:
+    """A contiguous piece of a document, labeled with its page when known."""
+
+    __slots__ = ("text", "position", "page")
+
+    def __init__(self, text: str, position: int, page: Optional[int] = None):
+        self.text = text
+        self.position = position  # index of the chunk within its document
+        self.page = page
+
+
+def chunk_pages(
+    pages: Iterable[Tuple[Optional[int], str]], chunk_chars: int = 1200
+) -> List[Chunk]:
+    """Split (page number, text) pairs into chunks of roughly ``chunk_chars``.
+
+    Chunks never span pages and break on line boundaries where possible.
+    """
+    chunks: List[Chunk] = []
+    for page, text in pages:
+        current: List[str] = []
+        size = 0
+        for line in text.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            # Hard-wrap pathological lines (e.g. text extracted without newlines)
+            while len(line) > chunk_chars:
+                if current:
+                    chunks.append(Chunk("\n".join(current), len(chunks), page))
+                    current, size = [], 0
+                chunks.append(Chunk(line[:chunk_chars], len(chunks), page))
+                line = line[chunk_chars:]
+            if size + len(line) > chunk_chars and current:
+                chunks.append(Chunk("\n".join(current), len(chunks), page))
+                current, size = [], 0
+            current.append(line)
+            size += len(line) + 1
+        if current:
+            chunks.append(Chunk("\n".join(current), len(chunks), page))
+    return chunks
+
+
+class BM25Index:
+    """Okapi BM25 over a fixed list of chunks."""
+
+    def __init__(self, chunks: Sequence[Chunk], k1: float = 1.5, b: float = 0.75):
+        self.chunks = list(chunks)
+        self.k1 = k1
+        self.b = b
+        self._term_counts = [Counter(tokenize(chunk.text)) for chunk in self.chunks]
+        self._lengths = [sum(counts.values()) for counts in self._term_counts]
+        self._avg_length = (
+            sum(self._lengths) / len(self._lengths) if self._lengths else 0.0
+        )
+
+        document_frequency: Counter = Counter()
+        for counts in self._term_counts:
+            document_frequency.update(counts.keys())
+        total = len(self.chunks)
+        self._idf = {
+            term: math.log(1 + (total - freq + 0.5) / (freq + 0.5))
+            for term, freq in document_frequency.items()
+        }
+
+    def scores(self, query: str) -> List[float]:
+        """BM25 score of every chunk for ``query``."""
+        terms = [term for term in set(tokenize(query)) if term in self._idf]
+        results = []
+        for counts, length in zip(self._term_counts, self._lengths):
+            score = 0.0
+            norm = self.k1 * (
+                1 - self.b + self.b * length / self._avg_length
+                if self._avg_length
+                else 1
+            )
+            for term in terms:
+                freq = counts.get(term)
+                if freq:
+                    score += self._idf[term] * freq * (self.k1 + 1) / (freq + norm)
+            results.append(score)
+        return results
+
+
+def pack_chunks(
+    chunks: Sequence[Chunk],
+    query: str,
+    token_budget: int,
+    costs: Sequence[int],
+    index: Optional[BM25Index] = None,
+) -> List[Chunk]:
+    """Pick the highest-scoring chunks that fit in ``token_budget``.
+
+    ``costs`` holds the token count of each chunk; callers compute it once
+    per document rather than on every question. If the whole document fits,
+    every chunk is kept. Chunks with equal scores (including a query with no
+    matching terms) keep document order, and the result is returned in
+    document order.
+    """
+    if not chunks:
+        return []
+
+    if sum(costs) <= token_budget:
+        return list(chunks)
+
+    index = index or BM25Index(chunks)
+    scores = index.scores(query)
+    ranked = sorted(range(len(chunks)), key=lambda i: (-scores[i], i))
+
+    selected = []
+    used = 0
+    for i in ranked:
+        if used + costs[i] > token_budget:
+            continue
+        selected.append(i)
+        used += costs[i]
+    return [chunks[i] for i in sorted(selected)]
+
+
+def spread_chunks(
+    chunks: Sequence[Chunk], token_budget: int, costs: Sequence[int]
+) -> List[Chunk]:
+    """Pick chunks evenly spaced across a document that fit in ``token_budget``.
+
+    Used when there is no question to rank by (e.g. condensing a whole paper),
+    so a long document is covered from start to end instead of only its
+    opening pages. The result is in document order.
+    """
+    if sum(costs) <= token_budget:
+        return list(chunks)
+
+    average = sum(costs) / len(costs)
+    count = max(1, min(len(chunks), int(token_budget // max(average, 1))))
+    step = len(chunks) / count
+    selected = []
+    used = 0
+    for i in sorted({int(n * step) for n in range(count)}):
+        if used + costs[i] > token_budget:
+            continue
+        selected.append(chunks[i])
+        used += costs[i]
+    return selected
+
+
+def format_chunks(chunks: Sequence[Chunk]) -> str:
+    """Render packed chunks with page labels and gap markers."""
+    parts = []
+    previous = None
+    for chunk in chunks:
+        if previous is not None and chunk.position != previous + 1:
+            parts.append("[...]")
+        label = f"[Page {chunk.page}] " if chunk.page is not None else ""
+        parts.append(f"{label}{chunk.text}")
+        previous = chunk.position
+    return "\n\n".join(parts)
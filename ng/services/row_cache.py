@@ -0,0 +1,98 @@
+"""
+Cached rows of the paper list for the first paint.
+
+Loading every paper with its authors and collections dominates startup for
+large libraries. After each full load, the display fields of every row are
+written to a compact ``marshal`` file next to the database, so the next launch
+paints the list straight from that file and reconciles with the database in a
+worker.
+"""
+
+import marshal
+import os
+import threading
+from typing import List, Optional, Sequence, Tuple
+
+CACHE_FILENAME = "paper_list.cache"
+# Bump when the row layout changes so stale files are ignored
+_FORMAT_VERSION = 1
+
+# (paper id, title, authors, year, venue, collections)
+Row = Tuple[int, str, str, str, str, str]
+
+_save_lock = threading.Lock()
+
+
+def is_enabled() -> bool:
+    """Whether the first paint uses cached rows (PAPERCLI_LIST_CACHE, default on)."""
+    value = os.getenv("PAPERCLI_LIST_CACHE", "true")
+    value = value.strip().strip("'\"").lower()
+    return value not in {"0", "false", "no", "off"}
+
+
+def cache_path(db_path: str) -> str:
+    """Return the row cache file that belongs to a database."""
+    return os.path.join(os.path.dirname(os.path.abspath(db_path)), CACHE_FILENAME)
+
+
+def row_fields(paper) -> Tuple[str, str, str, str, str]:
+    """Return the untruncated (title, authors, year, venue, collections) of a row."""
+    authors = paper.author_names or "Unknown Authors"
+    year = str(paper.year) if paper.year else "—"
+    venue = paper.venue_acronym or paper.venue_full or "—"
+
+    collections = ""
+    try:
+        if paper.collections:
+            collections = ", ".join(c.name for c in paper.collections)
+    except Exception:
+        collections = "—"
+
+    return str(paper.title), authors, year, venue, collections or "—"
+
+
+def load_rows(db_path: str) -> List[Row]:
+    """Return the cached rows for a database, or an empty list if unusable."""
+    if not is_enabled():
+        return []
+    try:
+        with open(cache_path(db_path), "rb") as f:
+            version, rows = marshal.loads(f.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        # Missing, truncated or written by an incompatible Python version
+        return []
+    if version != _FORMAT_VERSION or not isinstance(rows, tuple):
+        return []
+    return [row for row in rows if isinstance(row, tuple) and len(row) == 6]
+
+
+def save_rows(papers: Sequence, db_path: str) -> None:
+    """Write the rows of the given papers to the cache file atomically."""
+    rows = tuple((paper.id,) + row_fields(paper) for paper in papers)
+    path = cache_path(db_path)
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    with _save_lock:
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(marshal.dumps((_FORMAT_VERSION, rows)))
+            os.replace(tmp_path, path)
+        except OSError:
+            # The next launch simply loads from the database
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+def start_save(papers: Sequence, db_path: str) -> Optional[threading.Thread]:
+    """Save the rows in a daemon thread so the UI never waits on the write."""
+    if not is_enabled():
+        return None
+    thread = threading.Thread(
+        target=save_rows,
+        args=(list(papers), db_path),
+        name="papercli-row-cache",
+        daemon=True,
+    )
+    thread.start()
+    return thread
@@ -4,7 +4,7 @@ from fuzzywuzzy import fuzz
 from ng.db.database import get_db_session
 from ng.db.models import Author, Collection, Paper, PaperAuthor
 from sqlalchemy import and_, or_
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import selectinload
 
 
 class SearchService:
@@ -38,14 +38,15 @@ class SearchService:
             # Search in authors requires join
             if "authors" in fields:
                 papers_by_author = (
-                    session.query(Paper)
+                    session.query(Paper.id)
                     .join(Paper.paper_authors)
                     .join(PaperAuthor.author)
                     .filter(Author.full_name.ilike(f"%{query}%"))
+                    .distinct()
                     .all()
                 )
                 # Add author search results
-                paper_ids = [p.id for p in papers_by_author]
+                paper_ids = [paper_id for (paper_id,) in papers_by_author]
                 if paper_ids:
                     conditions.append(Paper.id.in_(paper_ids))
 
@@ -53,8 +54,10 @@ class SearchService:
                 papers = (
                     session.query(Paper)
                     .options(
-                        joinedload(Paper.paper_authors).joinedload(PaperAuthor.author),
-                        joinedload(Paper.collections),
+                        selectinload(Paper.paper_authors).selectinload(
+                            PaperAuthor.author
+                        ),
+                        selectinload(Paper.collections),
                     )
                     .filter(or_(*conditions))
                     .order_by(Paper.added_date.desc())
@@ -82,8 +85,8 @@ class SearchService:
             all_papers = (
                 session.query(Paper)
                 .options(
-                    joinedload(Paper.paper_authors).joinedload(PaperAuthor.author),
-                    joinedload(Paper.collections),
+                    selectinload(Paper.paper_authors).selectinload(PaperAuthor.author),
+                    selectinload(Paper.collections),
                 )
                 .all()
             )
@@ -144,8 +147,8 @@ class SearchService:
         """Filter papers by various criteria."""
         with get_db_session() as session:
             query = session.query(Paper).options(
-                joinedload(Paper.paper_authors).joinedload(PaperAuthor.author),
-                joinedload(Paper.collections),
+                selectinload(Paper.paper_authors).selectinload(PaperAuthor.author),
+                selectinload(Paper.collections),
             )
 
             if "all" in filters:
@@ -180,16 +183,20 @@ class SearchService:
                     )
                 )
 
+            # EXISTS rather than joins, so a paper matching several
+            # collections or authors is returned once
             if "collection" in filters:
-                query = query.join(Paper.collections).filter(
-                    Collection.name == filters["collection"]
+                query = query.filter(
+                    Paper.collections.any(Collection.name == filters["collection"])
                 )
 
             if "author" in filters:
-                query = (
-                    query.join(Paper.paper_authors)
-                    .join(PaperAuthor.author)
-                    .filter(Author.full_name.ilike(f'%{filters["author"]}%'))
+                query = query.filter(
+                    Paper.paper_authors.any(
+                        PaperAuthor.author.has(
+                            Author.full_name.ilike(f'%{filters["author"]}%')
+                        )
+                    )
                 )
 
             papers = query.order_by(Paper.added_date.desc()).all()
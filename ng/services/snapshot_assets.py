@@ -0,0 +1,316 @@
+"""
+Asset fetching for webpage snapshots.
+
+Stylesheets, images and CSS ``url()`` resources are fetched concurrently under
+a semaphore, deduplicated within a snapshot run (concurrent requests for the
+same URL share one fetch), and kept in a size-bounded on-disk cache so that
+site-wide assets are downloaded once rather than for every page.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import mimetypes
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Optional, Tuple
+
+from . import constants
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+class AssetCache:
+    """Size-bounded, LRU-evicted store of snapshot assets.
+
+    Entries are keyed by a hash of the URL; bodies are stored once per content
+    hash, so the same file served from several URLs takes space only once.
+    """
+
+    def __init__(self, cache_path: str, max_bytes: int, max_age: float):
+        self.cache_path = cache_path
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS assets ("
+                "url_key TEXT PRIMARY KEY, url TEXT NOT NULL, "
+                "content_hash TEXT NOT NULL, content_type TEXT NOT NULL, "
+                "fetched_at REAL NOT NULL, last_used REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS blobs ("
+                "content_hash TEXT PRIMARY KEY, data BLOB NOT NULL, "
+                "size INTEGER NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_assets_last_used ON assets (last_used)"
+            )
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.cache_path, timeout=5)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _url_key(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def get(self, url: str) -> Optional[Tuple[str, bytes]]:
+        """Return (content type, body) for ``url`` if cached and fresh."""
+        key = self._url_key(url)
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT a.content_type, b.data, a.fetched_at FROM assets a "
+                "JOIN blobs b ON b.content_hash = a.content_hash "
+                "WHERE a.url_key = ?",
+                (key,),
+            ).fetchone()
+            if row is None or now - row[2] > self.max_age:
+                return None
+            conn.execute(
+                "UPDATE assets SET last_used = ? WHERE url_key = ?", (now, key)
+            )
+            return row[0], bytes(row[1])
+
+    def put(self, url: str, content_type: str, data: bytes) -> None:
+        """Store an asset and evict old entries if over budget."""
+        if len(data) > self.max_bytes:
+            return
+        content_hash = hashlib.sha256(data).hexdigest()
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO blobs (content_hash, data, size) "
+                "VALUES (?, ?, ?)",
+                (content_hash, data, len(data)),
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO assets "
+                "(url_key, url, content_hash, content_type, fetched_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (self._url_key(url), url, content_hash, content_type, now, now),
+            )
+            (total,) = conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM blobs"
+            ).fetchone()
+            if total > self.max_bytes:
+                self._evict(conn, total)
+
+    def _evict(self, conn: sqlite3.Connection, total: int) -> None:
+        """Drop least-recently-used assets until the cache is at 90% of budget."""
+        target = int(self.max_bytes * 0.9)
+        rows = conn.execute(
+            "SELECT url_key FROM assets ORDER BY last_used ASC"
+        ).fetchall()
+        for (url_key,) in rows:
+            if total <= target:
+                break
+            conn.execute("DELETE FROM assets WHERE url_key = ?", (url_key,))
+            orphans = conn.execute(
+                "SELECT content_hash, size FROM blobs WHERE content_hash NOT IN "
+                "(SELECT content_hash FROM assets)"
+            ).fetchall()
+            for content_hash, size in orphans:
+                conn.execute(
+                    "DELETE FROM blobs WHERE content_hash = ?", (content_hash,)
+                )
+                total -= size
+
+    def clear(self) -> None:
+        """Remove every cached asset."""
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM assets")
+            conn.execute("DELETE FROM blobs")
+
+    def stats(self) -> Dict[str, int]:
+        """Return asset count and total stored bytes."""
+        with self._lock, self._connect() as conn:
+            (count,) = conn.execute("SELECT COUNT(1) FROM assets").fetchone()
+            (total,) = conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM blobs"
+            ).fetchone()
+            return {"entries": count, "bytes": total}
+
+
+_cache: Optional[AssetCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_asset_cache() -> Optional[AssetCache]:
+    """Return the process-wide asset cache stored next to the database, or None.
+
+    PAPERCLI_SNAPSHOT_ASSET_CACHE_MB sets its size; 0 disables it.
+    """
+    global _cache
+    max_mb = _env_int(
+        "PAPERCLI_SNAPSHOT_ASSET_CACHE_MB",
+        constants.DEFAULT_SNAPSHOT_ASSET_CACHE_MB,
+    )
+    if max_mb <= 0:
+        return None
+    if _cache is not None:
+        return _cache
+
+    with _cache_lock:
+        if _cache is None:
+            try:
+                from ng.db.database import get_db_manager
+
+                data_dir = os.path.dirname(get_db_manager().db_path)
+                _cache = AssetCache(
+                    os.path.join(data_dir, "snapshot_assets.db"),
+                    max_mb * 1024 * 1024,
+                    constants.DEFAULT_SNAPSHOT_ASSET_MAX_AGE_DAYS * 86400,
+                )
+            except Exception:
+                return None
+    return _cache
+
+
+class AssetFetcher:
+    """Fetches snapshot assets for one snapshot run (one page or a batch).
+
+    Must be used from a single event loop. Assets over PAPERCLI_SNAPSHOT_ASSET_MAX_KB
+    (or images over PAPERCLI_SNAPSHOT_IMAGE_MAX_KB; 0 skips images) are left
+    as links instead of being inlined.
+    """
+
+    def __init__(self, cache: Optional[AssetCache] = None):
+        self.cache = cache if cache is not None else get_asset_cache()
+        self.max_bytes = 1024 * _env_int(
+            "PAPERCLI_SNAPSHOT_ASSET_MAX_KB", constants.DEFAULT_SNAPSHOT_ASSET_MAX_KB
+        )
+        self.max_image_bytes = 1024 * _env_int(
+            "PAPERCLI_SNAPSHOT_IMAGE_MAX_KB", constants.DEFAULT_SNAPSHOT_IMAGE_MAX_KB
+        )
+        self._concurrency = max(
+            1,
+            _env_int(
+                "PAPERCLI_SNAPSHOT_ASSET_CONCURRENCY",
+                constants.DEFAULT_SNAPSHOT_ASSET_CONCURRENCY,
+            ),
+        )
+        self._slots: Optional[asyncio.Semaphore] = None
+        # url -> task resolving to (content type, body) or None
+        self._fetches: Dict[str, asyncio.Task] = {}
+        self.stats = {
+            "fetched": 0,
+            "run_hits": 0,
+            "disk_hits": 0,
+            "skipped": 0,
+            "failed": 0,
+        }
+
+    def _limit(self, image: bool) -> int:
+        return min(self.max_bytes, self.max_image_bytes) if image else self.max_bytes
+
+    async def fetch(
+        self, request: Any, url: str, image: bool = False
+    ) -> Optional[Tuple[str, bytes]]:
+        """Return (content type, body) for ``url``, or None if unavailable or too large.
+
+        ``request`` is a Playwright APIRequestContext (``page.context.request``).
+        """
+        if image and self.max_image_bytes <= 0:
+            self.stats["skipped"] += 1
+            return None
+
+        task = self._fetches.get(url)
+        if task is not None:
+            self.stats["run_hits"] += 1
+        else:
+            task = asyncio.ensure_future(self._fetch(request, url))
+            self._fetches[url] = task
+        result = await task
+
+        if result is not None and len(result[1]) > self._limit(image):
+            self.stats["skipped"] += 1
+            return None
+        return result
+
+    async def _fetch(self, request: Any, url: str) -> Optional[Tuple[str, bytes]]:
+        loop = asyncio.get_running_loop()
+        if self.cache:
+            try:
+                cached = await loop.run_in_executor(None, self.cache.get, url)
+            except Exception:
+                cached = None
+            if cached is not None:
+                self.stats["disk_hits"] += 1
+                return cached
+
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self._concurrency)
+        async with self._slots:
+            try:
+                resp = await request.get(url)
+                if not resp.ok:
+                    self.stats["failed"] += 1
+                    return None
+                declared = resp.headers.get("content-length")
+                if declared and declared.isdigit() and int(declared) > self.max_bytes:
+                    self.stats["skipped"] += 1
+                    return None
+                data = await resp.body()
+                content_type = (
+                    resp.headers.get("content-type")
+                    or mimetypes.guess_type(url)[0]
+                    or "application/octet-stream"
+                )
+            except Exception:
+                self.stats["failed"] += 1
+                return None
+
+        if len(data) > self.max_bytes:
+            self.stats["skipped"] += 1
+            return None
+        self.stats["fetched"] += 1
+        if self.cache:
+            try:
+                await loop.run_in_executor(
+                    None, self.cache.put, url, content_type, data
+                )
+            except Exception:
+                pass
+        return content_type, data
+
+    async def data_url(
+        self, request: Any, url: str, image: bool = False
+    ) -> Optional[str]:
+        """Return the asset as a ``data:`` URL, or None."""
+        result = await self.fetch(request, url, image=image)
+        if result is None:
+            return None
+        content_type, data = result
+        return f"data:{content_type};base64,{base64.b64encode(data).decode('ascii')}"
+
+    async def text(self, request: Any, url: str) -> Optional[str]:
+        """Return the asset decoded as text (for stylesheets), or None."""
+        result = await self.fetch(request, url)
+        if result is None:
+            return None
+        return result[1].decode("utf-8", errors="replace")
+
+    def format_stats(self) -> str:
+        return (
+            f"{self.stats['fetched']} fetched, {self.stats['run_hits']} shared, "
+            f"{self.stats['disk_hits']} from cache, {self.stats['skipped']} skipped, "
+            f"{self.stats['failed']} failed"
+        )
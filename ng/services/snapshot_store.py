@@ -0,0 +1,421 @@
+"""
+Storage of HTML snapshot files.
+
+New snapshots are written gzip-compressed (``.html.gz``); inlined images and
+stylesheets make them large but highly compressible, so this cuts disk use and
+sync traffic several-fold. Every reader goes through ``read_snapshot``, which
+handles both compressed and legacy plain ``.html`` files, and
+``migrate_snapshots`` converts existing plain snapshots in the background.
+
+The visible text of each snapshot is extracted once with a streaming parser
+and kept as a sidecar file keyed by the snapshot's content hash, so chat and
+summaries do not re-parse multi-megabyte pages.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+import threading
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from pluralizer import Pluralizer
+
+GZIP_SUFFIX = ".gz"
+_COMPRESS_LEVEL = 6  # Near-maximal ratio for HTML at a fraction of level 9's cost
+
+_READ_CHUNK = 1024 * 1024
+_DATA_URI_PATTERN = re.compile(r"data:[\w.+-]+/[\w.+-]+(?:;[\w.+=-]+)*,[\w+/=%.-]+")
+_SKIPPED_TAGS = {"script", "style", "template"}
+
+_migration_lock = threading.Lock()
+_pluralizer = Pluralizer()
+# path -> (mtime_ns, size, sha256) so unchanged snapshots are not re-hashed
+_hash_memo: Dict[str, Tuple[int, int, str]] = {}
+
+
+def is_enabled() -> bool:
+    """Whether new snapshots are compressed (PAPERCLI_SNAPSHOT_COMPRESS, default on)."""
+    value = os.getenv("PAPERCLI_SNAPSHOT_COMPRESS", "true")
+    value = value.strip().strip("'\"").lower()
+    return value not in {"0", "false", "no", "off"}
+
+
+def snapshot_extension() -> str:
+    """Return the file extension for newly written snapshots."""
+    return ".html" + GZIP_SUFFIX if is_enabled() else ".html"
+
+
+def is_compressed(path: str) -> bool:
+    return str(path).endswith(GZIP_SUFFIX)
+
+
+def snapshot_dir() -> str:
+    """Return the html_snapshots directory next to the database."""
+    from ng.db.database import get_db_manager
+
+    data_dir = os.path.dirname(get_db_manager().db_path)
+    return os.path.join(data_dir, "html_snapshots")
+
+
+def snapshot_path(relative_path: str) -> str:
+    """Return the absolute path of a stored snapshot.
+
+    A reference to a plain ``.html`` file that has since been compressed (by
+    the migration, possibly on another synced machine) resolves to the
+    ``.html.gz`` file next to it.
+    """
+    path = os.path.join(snapshot_dir(), relative_path)
+    if not os.path.exists(path) and os.path.exists(path + GZIP_SUFFIX):
+        return path + GZIP_SUFFIX
+    return path
+
+
+def snapshot_exists(relative_path: Optional[str]) -> bool:
+    return bool(relative_path) and os.path.exists(snapshot_path(relative_path))
+
+
+def snapshot_files(directory) -> List[Path]:
+    """Return the plain and compressed snapshot files in ``directory``."""
+    directory = Path(directory)
+    return list(directory.glob("*.html")) + list(directory.glob("*.html.gz"))
+
+
+def referenced_names(stored_paths: Iterable[str]) -> Set[str]:
+    """Return the snapshot file names that stored paths may refer to on disk."""
+    names = {Path(path).name for path in stored_paths if path}
+    return names | {name + GZIP_SUFFIX for name in names if not is_compressed(name)}
+
+
+def read_snapshot(path: str) -> str:
+    """Return the HTML of a snapshot file, decompressing it if needed."""
+    if not is_compressed(path) and not os.path.exists(path):
+        if os.path.exists(path + GZIP_SUFFIX):
+            path = path + GZIP_SUFFIX
+    if is_compressed(path):
+        with gzip.open(path, "rt", encoding="utf-8", errors="replace") as f:
+            return f.read()
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        return f.read()
+
+
+def write_snapshot(path: str, html: str) -> None:
+    """Write snapshot HTML, compressing it if ``path`` ends in ``.gz``."""
+    tmp_path = f"{path}.tmp"
+    try:
+        if is_compressed(path):
+            with gzip.open(
+                tmp_path, "wt", encoding="utf-8", compresslevel=_COMPRESS_LEVEL
+            ) as f:
+                f.write(html)
+        else:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(html)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def compress_snapshot(path: str) -> str:
+    """Replace a plain snapshot file with a ``.gz`` copy and return its path."""
+    if is_compressed(path):
+        return path
+    target = path + GZIP_SUFFIX
+    tmp_path = f"{target}.tmp"
+    try:
+        with open(path, "rb") as src, gzip.open(
+            tmp_path, "wb", compresslevel=_COMPRESS_LEVEL
+        ) as dst:
+            shutil.copyfileobj(src, dst, _READ_CHUNK)
+        shutil.copystat(path, tmp_path)
+        os.replace(tmp_path, target)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    os.remove(path)
+    return target
+
+
+def open_copy(path: str) -> str:
+    """Return a path that a browser can open directly.
+
+    Compressed snapshots are decompressed into a per-user temp directory; the
+    copy is reused while it is newer than the stored snapshot.
+    """
+    if not is_compressed(path):
+        return path
+    view_dir = os.path.join(tempfile.gettempdir(), "papercli-snapshots")
+    os.makedirs(view_dir, exist_ok=True)
+    target = os.path.join(view_dir, os.path.basename(path)[: -len(GZIP_SUFFIX)])
+    try:
+        if os.path.getmtime(target) >= os.path.getmtime(path):
+            return target
+    except OSError:
+        pass
+    tmp_path = f"{target}.tmp"
+    with gzip.open(path, "rb") as src, open(tmp_path, "wb") as dst:
+        shutil.copyfileobj(src, dst, _READ_CHUNK)
+    os.replace(tmp_path, target)
+    return target
+
+
+class _TextExtractor(HTMLParser):
+    """Collects a page's visible text, one stripped line per text node.
+
+    Matches ``BeautifulSoup(html).get_text(separator="\\n", strip=True)``:
+    script, style and template contents and comments are dropped. Inline
+    ``data:`` URIs are removed from the text.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self._buffer: List[str] = []
+        self._skip_depth = 0
+
+    def _flush(self):
+        if self._buffer:
+            text = _DATA_URI_PATTERN.sub("", "".join(self._buffer)).strip()
+            self._buffer = []
+            if text:
+                self.parts.append(text)
+
+    def handle_starttag(self, tag, attrs):
+        self._flush()
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth += 1
+
+    def handle_startendtag(self, tag, attrs):
+        self._flush()
+
+    def handle_endtag(self, tag):
+        self._flush()
+        if tag in _SKIPPED_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_comment(self, data):
+        self._flush()
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self._buffer.append(data)
+
+    def text(self) -> str:
+        self.close()
+        self._flush()
+        return "\n".join(self.parts)
+
+
+def extract_text(html: str) -> str:
+    """Return the visible text of an HTML document."""
+    extractor = _TextExtractor()
+    for start in range(0, len(html), _READ_CHUNK):
+        extractor.feed(html[start : start + _READ_CHUNK])
+    return extractor.text()
+
+
+def _extract_file_text(path: str) -> str:
+    """Stream a snapshot file through the text extractor."""
+    extractor = _TextExtractor()
+    if is_compressed(path):
+        f = gzip.open(path, "rt", encoding="utf-8", errors="replace")
+    else:
+        f = open(path, "r", encoding="utf-8", errors="replace")
+    with f:
+        for chunk in iter(lambda: f.read(_READ_CHUNK), ""):
+            extractor.feed(chunk)
+    return extractor.text()
+
+
+def _file_hash(path: str) -> str:
+    stat = os.stat(path)
+    memo = _hash_memo.get(path)
+    if memo and memo[0] == stat.st_mtime_ns and memo[1] == stat.st_size:
+        return memo[2]
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_READ_CHUNK), b""):
+            digest.update(chunk)
+    _hash_memo[path] = (stat.st_mtime_ns, stat.st_size, digest.hexdigest())
+    return _hash_memo[path][2]
+
+
+def text_dir() -> str:
+    """Return the snapshot_text directory of sidecar files next to the database."""
+    return os.path.join(os.path.dirname(snapshot_dir()), "snapshot_text")
+
+
+def _text_path(snapshot_hash: str) -> str:
+    """Return the sidecar text file for a snapshot with the given content hash."""
+    return os.path.join(text_dir(), f"{snapshot_hash}.txt")
+
+
+def orphaned_text_files(stored_paths: Iterable[str]) -> List[Path]:
+    """Return the sidecar text files matching no referenced snapshot's content.
+
+    Sidecars are keyed by content hash, so one goes stale whenever its
+    snapshot is deleted or replaced.
+    """
+    directory = Path(text_dir())
+    if not directory.is_dir():
+        return []
+    hashes = set()
+    for stored_path in stored_paths:
+        path = snapshot_path(stored_path) if stored_path else None
+        if path and os.path.exists(path):
+            hashes.add(_file_hash(path))
+    return [f for f in directory.glob("*.txt") if f.stem not in hashes]
+
+
+def _write_text(text_path: str, text: str) -> None:
+    os.makedirs(os.path.dirname(text_path), exist_ok=True)
+    tmp_path = f"{text_path}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, text_path)
+
+
+def save_snapshot_text(path: str, html: Optional[str] = None) -> str:
+    """Extract and store the sidecar text of a snapshot file and return it.
+
+    Pass the page ``html`` when it is already in memory (at snapshot time) to
+    avoid reading the file back.
+    """
+    path = str(path)
+    text = extract_text(html) if html is not None else _extract_file_text(path)
+    _write_text(_text_path(_file_hash(path)), text)
+    return text
+
+
+def snapshot_text(path: str) -> str:
+    """Return the visible text of a snapshot file.
+
+    Served from the sidecar when one matches the file's current content
+    hash; otherwise the text is extracted once and stored.
+    """
+    if not is_compressed(path) and not os.path.exists(path):
+        if os.path.exists(path + GZIP_SUFFIX):
+            path = path + GZIP_SUFFIX
+    text_path = _text_path(_file_hash(path))
+    try:
+        with open(text_path, "r", encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        pass
+    text = _extract_file_text(path)
+    try:
+        _write_text(text_path, text)
+    except OSError:
+        pass
+    return text
+
+
+def _write_snapshot_paths(updates: Dict[int, str]) -> int:
+    """Point papers at their compressed snapshots; returns the rows updated.
+
+    A storage-format change is not an edit: plain SQL leaves modified_date
+    (and its ORM onupdate) alone and enqueues no auto-sync operation.
+    """
+    from sqlalchemy import text
+
+    from ng.db.database import get_db_session
+
+    with get_db_session() as session:
+        result = session.execute(
+            text("UPDATE papers SET html_snapshot_path = :path WHERE id = :id"),
+            [{"id": paper_id, "path": path} for paper_id, path in updates.items()],
+        )
+        session.commit()
+        return result.rowcount
+
+
+def migrate_snapshots(app=None) -> Dict[str, Any]:
+    """Compress every plain snapshot referenced by a paper and update its path.
+
+    Safe to run repeatedly; returns counts of migrated papers, bytes saved and
+    failures. Does nothing when compression is disabled.
+    """
+    stats: Dict[str, Any] = {
+        "migrated": 0,
+        "failed": 0,
+        "bytes_before": 0,
+        "bytes_after": 0,
+    }
+    if not is_enabled() or not _migration_lock.acquire(blocking=False):
+        return stats
+
+    try:
+        from ng.db.database import get_db_session
+        from ng.db.models import Paper
+
+        with get_db_session() as session:
+            rows = (
+                session.query(Paper.id, Paper.html_snapshot_path)
+                .filter(Paper.html_snapshot_path.isnot(None))
+                .filter(Paper.html_snapshot_path != "")
+                .all()
+            )
+
+        updates: Dict[int, str] = {}
+        compressed: Dict[str, str] = {}
+        for paper_id, relative_path in rows:
+            if is_compressed(relative_path) or relative_path.startswith(
+                ("http://", "https://")
+            ):
+                continue
+            path = os.path.join(snapshot_dir(), relative_path)
+            try:
+                if path not in compressed:
+                    if os.path.exists(path):
+                        size = os.path.getsize(path)
+                        compressed[path] = compress_snapshot(path)
+                        stats["bytes_before"] += size
+                        stats["bytes_after"] += os.path.getsize(compressed[path])
+                    elif os.path.exists(path + GZIP_SUFFIX):
+                        compressed[path] = path + GZIP_SUFFIX
+                    else:
+                        continue
+                updates[paper_id] = relative_path + GZIP_SUFFIX
+            except Exception as e:
+                stats["failed"] += 1
+                if app:
+                    app._add_log(
+                        "snapshot_migrate_error",
+                        f"Failed to compress snapshot {relative_path}: {e}",
+                    )
+
+        if updates:
+            stats["migrated"] = _write_snapshot_paths(updates)
+    finally:
+        _migration_lock.release()
+
+    return stats
+
+
+def start_migration(app) -> None:
+    """Run ``migrate_snapshots`` on a daemon thread, logging the outcome."""
+
+    def run():
+        try:
+            stats = migrate_snapshots(app)
+        except Exception as e:
+            app._add_log("snapshot_migrate_error", f"Snapshot migration failed: {e}")
+            return
+        if stats["migrated"]:
+            from .formatting import format_file_size
+
+            app._add_log(
+                "snapshot_migrate",
+                f"Compressed {_pluralizer.pluralize('HTML snapshot', stats['migrated'], True)}: "
+                f"{format_file_size(stats['bytes_before'])} -> "
+                f"{format_file_size(stats['bytes_after'])}",
+            )
+
+    threading.Thread(target=run, name="snapshot-migration", daemon=True).start()
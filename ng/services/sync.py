@@ -12,12 +12,13 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 import ng
-from alembic import command
-from alembic.config import Config
-from alembic.runtime.migration import MigrationContext
-from alembic.script import ScriptDirectory
-from ng.db.database import ensure_schema_current
-from ng.services import DatabaseHealthService
+from ng.db import storage
+from ng.db.database import (
+    ensure_schema_current,
+    record_schema_fingerprint,
+    schema_is_current,
+)
+from ng.services import DatabaseHealthService, snapshot_store
 from pluralizer import Pluralizer
 from sqlalchemy import create_engine
 
@@ -194,6 +195,13 @@ class SyncService:
         )  # Maps original_title -> new_title  # Maps original_title -> new_title
         self._column_cache: Dict[Tuple[str, str, str], bool] = {}
 
+    def _is_remote(self, db_path) -> bool:
+        return Path(db_path) == self.remote_db_path
+
+    def _connect(self, db_path) -> sqlite3.Connection:
+        """Open a database with the local (WAL) or remote storage profile."""
+        return storage.connect(db_path, remote=self._is_remote(db_path))
+
     def _acquire_locks(self) -> bool:
         """Acquire sync locks on both local and remote directories."""
         try:
@@ -266,7 +274,7 @@ class SyncService:
         if cache_key in self._column_cache:
             return self._column_cache[cache_key]
 
-        conn = sqlite3.connect(db_path)
+        conn = self._connect(db_path)
         try:
             cursor = conn.cursor()
             cursor.execute(f"PRAGMA table_info({table})")
@@ -289,7 +297,7 @@ class SyncService:
         if not self._database_has_uuid_column(db_path):
             return None
 
-        conn = sqlite3.connect(db_path)
+        conn = self._connect(db_path)
         try:
             cursor = conn.cursor()
             cursor.execute("SELECT uuid FROM papers WHERE title = ?", (title,))
@@ -322,14 +330,16 @@ class SyncService:
             return
 
         if not self._database_has_html_snapshot_column(db_path):
-            ensure_schema_current(str(db_path), silent=True)
+            ensure_schema_current(
+                str(db_path), silent=True, remote=self._is_remote(db_path)
+            )
             self._column_cache.pop(
                 (str(db_path), "papers", "html_snapshot_path"), None
             )
             if not self._database_has_html_snapshot_column(db_path):
                 return
 
-        conn = sqlite3.connect(db_path)
+        conn = self._connect(db_path)
         try:
             cursor = conn.cursor()
             has_uuid = self._database_has_uuid_column(db_path)
@@ -467,7 +477,8 @@ class SyncService:
                     self.app._add_log(
                         "sync_init", "Remote database not found, copying from local"
                     )
-                shutil.copy2(self.local_db_path, self.remote_db_path)
+                # Backup API: includes changes still in the local WAL file
+                self._mirror_database(self.local_db_path, self.remote_db_path)
                 papers_count = self._count_papers(self.local_db_path)
                 result.changes_applied["papers_added"] = papers_count
                 self._sync_pdfs_to_remote(result)
@@ -490,7 +501,9 @@ class SyncService:
                         "sync_manual_upgrade_attempt",
                         "Alembic upgrade failed, attempting manual schema upgrade for remote database",
                     )
-                ensure_schema_current(str(self.remote_db_path), silent=True)
+                ensure_schema_current(
+                    str(self.remote_db_path), silent=True, remote=True
+                )
             time.sleep(0.1)
 
             # Check schema compatibility (both auto and manual sync)
@@ -809,7 +822,7 @@ class SyncService:
         names: set = set()
         conn = None
         try:
-            conn = sqlite3.connect(db_path)
+            conn = self._connect(db_path)
             cursor = conn.cursor()
             cursor.execute("SELECT pdf_path FROM papers WHERE pdf_path IS NOT NULL")
             for (pdf_path,) in cursor.fetchall():
@@ -913,7 +926,14 @@ class SyncService:
                         file_path = alt_path
                         break
                 else:
-                    continue
+                    # Plain snapshot already compressed in place (by the
+                    # migration on this side); sync the compressed file
+                    gz_path = snapshots_dir / (filename + snapshot_store.GZIP_SUFFIX)
+                    if not gz_path.exists():
+                        continue
+                    file_path = gz_path
+                    filename = gz_path.name
+                    stored_paths = [filename]
             if stored_paths:
                 relative_path = Path(stored_paths[0]).name
             else:
@@ -1685,7 +1705,7 @@ class SyncService:
     # Helper methods
     def _paper_exists_in_db(self, db_path: Path, title: str) -> bool:
         """Check if a paper with given title exists in the database."""
-        conn = sqlite3.connect(db_path)
+        conn = self._connect(db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("SELECT 1 FROM papers WHERE title = ? LIMIT 1", (title,))
@@ -1702,11 +1722,11 @@ class SyncService:
         2. First pass: Clear conflicting UUIDs using temporary values
         3. Second pass: Set all papers to their target UUIDs
         """
-        local_conn = sqlite3.connect(self.local_db_path)
+        local_conn = self._connect(self.local_db_path)
         local_conn.row_factory = sqlite3.Row
         local_cursor = local_conn.cursor()
 
-        remote_conn = sqlite3.connect(self.remote_db_path)
+        remote_conn = self._connect(self.remote_db_path)
         remote_conn.row_factory = sqlite3.Row
         remote_cursor = remote_conn.cursor()
 
@@ -1839,7 +1859,7 @@ class SyncService:
     def _get_papers_dict(self, db_path: Path) -> Dict[str, Dict]:
         """Get papers from database as a dictionary keyed by UUID."""
         papers = {}
-        conn = sqlite3.connect(db_path)
+        conn = self._connect(db_path)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         try:
@@ -1865,7 +1885,7 @@ class SyncService:
     def _get_collections_dict(self, db_path: Path) -> Dict[int, Dict]:
         """Get collections from database as a dictionary."""
         collections = {}
-        conn = sqlite3.connect(db_path)
+        conn = self._connect(db_path)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         try:
@@ -1880,7 +1900,7 @@ class SyncService:
         self, db_path: Path, collection_id: int
     ) -> Dict[str, Optional[str]]:
         """Get mapping of paper titles to UUIDs (when available) for a collection."""
-        conn = sqlite3.connect(db_path)
+        conn = self._connect(db_path)
         cursor = conn.cursor()
         try:
             has_uuid = self._database_has_uuid_column(db_path)
@@ -1966,7 +1986,7 @@ class SyncService:
 
     def _count_papers(self, db_path: Path) -> int:
         """Count papers in database."""
-        conn = sqlite3.connect(db_path)
+        conn = self._connect(db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("SELECT COUNT(*) FROM papers")
@@ -1987,7 +2007,7 @@ class SyncService:
 
     def _copy_paper_to_local(self, paper_data: Dict):
         """Copy a paper from remote to local database."""
-        conn = sqlite3.connect(self.local_db_path)
+        conn = self._connect(self.local_db_path)
         cursor = conn.cursor()
         try:
             paper_dict = dict(paper_data)
@@ -2061,7 +2081,7 @@ class SyncService:
 
     def _copy_paper_to_remote(self, paper_data: Dict):
         """Copy a paper from local to remote database."""
-        conn = sqlite3.connect(self.remote_db_path)
+        conn = self._connect(self.remote_db_path)
         cursor = conn.cursor()
         try:
             paper_dict = dict(paper_data)
@@ -2136,12 +2156,16 @@ class SyncService:
     def _mirror_database(self, source_path: Path, destination_path: Path) -> None:
         """Mirror the entire SQLite database from source to destination using backup API."""
         destination_path.parent.mkdir(parents=True, exist_ok=True)
-        source_conn = sqlite3.connect(source_path)
+        source_conn = self._connect(source_path)
         try:
-            dest_conn = sqlite3.connect(destination_path)
+            dest_conn = self._connect(destination_path)
             try:
                 source_conn.backup(dest_conn)
                 dest_conn.commit()
+                # The backup copies the source's journal mode along with its pages
+                storage.apply_profile(
+                    dest_conn, remote=self._is_remote(destination_path)
+                )
             finally:
                 dest_conn.close()
         finally:
@@ -2151,7 +2175,7 @@ class SyncService:
         self, db_path: Path, title: str, paper_data: Optional[Dict] = None
     ) -> bool:
         """Delete a paper from database by title, preferring UUID when available."""
-        conn = sqlite3.connect(db_path)
+        conn = self._connect(db_path)
         cursor = conn.cursor()
         try:
             candidates: List[Tuple[str, str]] = []
@@ -2199,7 +2223,7 @@ class SyncService:
 
     def _delete_collection_by_name(self, db_path: Path, name: str):
         """Delete a collection by name, including relationships."""
-        conn = sqlite3.connect(db_path)
+        conn = self._connect(db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("SELECT id FROM collections WHERE name = ?", (name,))
@@ -2219,7 +2243,7 @@ class SyncService:
         self, collection_data: Dict, remote_collection_id: int
     ):
         """Copy a collection from remote to local database."""
-        conn = sqlite3.connect(self.local_db_path)
+        conn = self._connect(self.local_db_path)
         cursor = conn.cursor()
         try:
             created_at = collection_data.get("created_at") or datetime.now().isoformat()
@@ -2261,7 +2285,7 @@ class SyncService:
         self, collection_data: Dict, local_collection_id: int
     ):
         """Copy a collection from local to remote database."""
-        conn = sqlite3.connect(self.remote_db_path)
+        conn = self._connect(self.remote_db_path)
         cursor = conn.cursor()
         try:
             created_at = collection_data.get("created_at") or datetime.now().isoformat()
@@ -2326,7 +2350,7 @@ class SyncService:
     def _replace_collection_in_remote(self, local_collection_data, local_papers):
         """Replace remote collection with local version."""
         collection_name = local_collection_data["name"]
-        conn = sqlite3.connect(self.remote_db_path)
+        conn = self._connect(self.remote_db_path)
         cursor = conn.cursor()
         try:
             # Get the collection ID to delete paper relationships first
@@ -2372,7 +2396,7 @@ class SyncService:
     def _replace_collection_in_local(self, remote_collection_data, remote_papers):
         """Replace local collection with remote version."""
         collection_name = remote_collection_data["name"]
-        conn = sqlite3.connect(self.local_db_path)
+        conn = self._connect(self.local_db_path)
         cursor = conn.cursor()
         try:
             # Get the collection ID to delete paper relationships first
@@ -2418,7 +2442,7 @@ class SyncService:
     # ---- Generic DB lookup helpers ----
     def _collection_id_by_name(self, db_path: Path, name: str) -> Optional[int]:
         try:
-            conn = sqlite3.connect(db_path)
+            conn = self._connect(db_path)
             cur = conn.cursor()
             cur.execute("SELECT id FROM collections WHERE name = ?", (name,))
             row = cur.fetchone()
@@ -2431,7 +2455,7 @@ class SyncService:
 
     def _paper_id_by_title(self, db_path: Path, title: str) -> Optional[int]:
         try:
-            conn = sqlite3.connect(db_path)
+            conn = self._connect(db_path)
             cur = conn.cursor()
             cur.execute("SELECT id FROM papers WHERE title = ?", (title,))
             row = cur.fetchone()
@@ -2444,7 +2468,7 @@ class SyncService:
 
     def _paper_title_by_id(self, db_path: Path, paper_id: int) -> Optional[str]:
         try:
-            conn = sqlite3.connect(db_path)
+            conn = self._connect(db_path)
             cur = conn.cursor()
             cur.execute("SELECT title FROM papers WHERE id = ?", (paper_id,))
             row = cur.fetchone()
@@ -2459,7 +2483,7 @@ class SyncService:
         self, db_path: Path, collection_id: int
     ) -> Optional[str]:
         try:
-            conn = sqlite3.connect(db_path)
+            conn = self._connect(db_path)
             cur = conn.cursor()
             cur.execute("SELECT name FROM collections WHERE id = ?", (collection_id,))
             row = cur.fetchone()
@@ -2475,7 +2499,7 @@ class SyncService:
         col_id = self._collection_id_by_name(self.remote_db_path, name)
         if col_id is None:
             return
-        conn = sqlite3.connect(self.remote_db_path)
+        conn = self._connect(self.remote_db_path)
         try:
             cur = conn.cursor()
             for title in titles:
@@ -2493,7 +2517,7 @@ class SyncService:
         col_id = self._collection_id_by_name(self.remote_db_path, name)
         if col_id is None:
             return
-        conn = sqlite3.connect(self.remote_db_path)
+        conn = self._connect(self.remote_db_path)
         try:
             cur = conn.cursor()
             for title in titles:
@@ -2526,6 +2550,17 @@ class SyncService:
 
     def _upgrade_database_schema(self, db_path: Path) -> bool:
         """Upgrade database schema using Alembic migrations. Returns True if successful."""
+        # One query answers the common case without loading Alembic at all
+        remote = self._is_remote(db_path)
+        if schema_is_current(str(db_path), remote=remote):
+            return True
+
+        # Alembic is slow to import; load it only when a sync migrates
+        from alembic import command
+        from alembic.config import Config
+        from alembic.runtime.migration import MigrationContext
+        from alembic.script import ScriptDirectory
+
         try:
             # Try to find alembic.ini
             alembic_ini_path = "alembic.ini"
@@ -2546,10 +2581,15 @@ class SyncService:
             alembic_cfg.set_main_option("script_location", str(alembic_dir))
 
             # Check current database revision
-            engine = create_engine(f"sqlite:///{db_path}")
-            with engine.connect() as connection:
-                context = MigrationContext.configure(connection)
-                current_rev = context.get_current_revision()
+            engine = create_engine(
+                f"sqlite:///{db_path}", creator=lambda: self._connect(db_path)
+            )
+            try:
+                with engine.connect() as connection:
+                    context = MigrationContext.configure(connection)
+                    current_rev = context.get_current_revision()
+            finally:
+                engine.dispose()
 
             # Get the head revision from scripts
             script = ScriptDirectory.from_config(alembic_cfg)
@@ -2557,20 +2597,22 @@ class SyncService:
 
             # Only upgrade if versions differ
             if current_rev == head_rev:
-                # Already at latest version, skip
+                # Already at latest version; remember it for the fast check
+                record_schema_fingerprint(str(db_path), remote=remote)
                 return True
 
             # Check if schema is already correct but alembic version is wrong
             # (This can happen if migration was run manually or interrupted)
             if self._database_has_uuid_column(db_path) and head_rev == "10f8534b9062":
                 # UUID column exists, just update alembic version
-                conn = sqlite3.connect(db_path)
+                conn = self._connect(db_path)
                 cursor = conn.cursor()
                 try:
                     cursor.execute(
                         "UPDATE alembic_version SET version_num = ?", (head_rev,)
                     )
                     conn.commit()
+                    record_schema_fingerprint(str(db_path), remote=remote)
                     if self.app:
                         self.app._add_log(
                             "sync_db_fix",
@@ -2588,6 +2630,7 @@ class SyncService:
 
             # Run upgrade to head
             command.upgrade(alembic_cfg, "head")
+            record_schema_fingerprint(str(db_path), remote=remote)
 
             if self.app:
                 self.app._add_log(
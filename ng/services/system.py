@@ -7,7 +7,7 @@ import subprocess
 import traceback
 from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
-import pyperclip
+from ng.services import snapshot_store
 
 if TYPE_CHECKING:
     from ng.services import PDFManager
@@ -69,6 +69,9 @@ class SystemService:
             if not os.path.exists(file_path):
                 return False, f"{file_type} file not found: {file_path}"
 
+            # Compressed snapshots are opened from a decompressed temp copy
+            file_path = snapshot_store.open_copy(file_path)
+
             # Cross-platform file opening
             if platform.system() == "Windows":  # Windows
                 os.startfile(file_path)
@@ -108,6 +111,8 @@ class SystemService:
 
     def copy_to_clipboard(self, text: str) -> bool:
         """Copy text to system clipboard."""
+        import pyperclip
+
         pyperclip.copy(text)
         return True
 
@@ -0,0 +1,112 @@
+"""
+Venue normalization dictionary.
+
+Maps the many spellings of a venue ("ICML 2023", "Proceedings of the 40th
+International Conference on Machine Learning", ...) to the full name and
+acronym already used in the library, so that only never-seen venues need to
+be resolved by the LLM.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections import Counter
+from typing import Dict, Optional, Tuple
+
+_NUMBER_PATTERN = re.compile(r"\b\d+(?:st|nd|rd|th)?\b")
+_FILLER_PATTERN = re.compile(
+    r"\b(?:proceedings of the|proceedings of|proceedings|in)\b"
+)
+
+
+def venue_key(venue: str) -> str:
+    """Normalize a venue for lookup (case, years, volumes, ordinals, punctuation)."""
+    if not venue:
+        return ""
+    key = venue.lower()
+    key = _NUMBER_PATTERN.sub(" ", key)
+    key = _FILLER_PATTERN.sub(" ", key)
+    key = re.sub(r"[^a-z0-9]+", " ", key)
+    return " ".join(key.split())
+
+
+class VenueDictionary:
+    """Venue table seeded from the library and extended as venues are confirmed."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_full: Dict[str, Tuple[str, str]] = {}
+        self._by_acronym: Dict[str, Tuple[str, str]] = {}
+        self._seeded = False
+
+    def _seed(self):
+        """Load the most common (venue_full, venue_acronym) pair per library venue."""
+        from ng.db.database import get_db_session
+        from ng.db.models import Paper
+
+        with get_db_session() as session:
+            rows = (
+                session.query(Paper.venue_full, Paper.venue_acronym)
+                .filter(Paper.venue_full.isnot(None), Paper.venue_full != "")
+                .filter(Paper.venue_acronym.isnot(None), Paper.venue_acronym != "")
+                .all()
+            )
+
+        for (full, acronym), _count in Counter(rows).most_common():
+            # most_common() order means the first pair seen for a key wins
+            self._by_full.setdefault(venue_key(full), (full, acronym))
+            self._by_acronym.setdefault(venue_key(acronym), (full, acronym))
+
+    def _ensure_seeded(self):
+        if self._seeded:
+            return
+        try:
+            self._seed()
+            self._seeded = True
+        except Exception:
+            # Database not initialized yet; try again on the next lookup
+            pass
+
+    def lookup(self, venue_field: str) -> Optional[Dict[str, str]]:
+        """Return {"venue_full", "venue_acronym"} for a known venue, or None."""
+        key = venue_key(venue_field)
+        if not key:
+            return None
+
+        with self._lock:
+            self._ensure_seeded()
+            match = self._by_full.get(key) or self._by_acronym.get(key)
+
+        if not match:
+            return None
+        return {"venue_full": match[0], "venue_acronym": match[1]}
+
+    def learn(self, venue_field: str, venue_full: str, venue_acronym: str):
+        """Record a confirmed venue under its raw spelling, full name and acronym."""
+        if not venue_full or not venue_acronym:
+            return
+
+        pair = (venue_full, venue_acronym)
+        with self._lock:
+            self._ensure_seeded()
+            for key in (venue_key(venue_field), venue_key(venue_full)):
+                if key:
+                    self._by_full[key] = pair
+            acronym_key = venue_key(venue_acronym)
+            if acronym_key:
+                self._by_acronym.setdefault(acronym_key, pair)
+
+
+_venue_dictionary: Optional[VenueDictionary] = None
+_venue_dictionary_lock = threading.Lock()
+
+
+def get_venue_dictionary() -> VenueDictionary:
+    """Return the process-wide venue dictionary."""
+    global _venue_dictionary
+    if _venue_dictionary is None:
+        with _venue_dictionary_lock:
+            if _venue_dictionary is None:
+                _venue_dictionary = VenueDictionary()
+    return _venue_dictionary
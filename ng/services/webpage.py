@@ -1,18 +1,19 @@
 from __future__ import annotations
 
 import asyncio
-import base64
+import atexit
 import mimetypes
+import os
 import re
+import threading
 import traceback
-from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Tuple
-from urllib.parse import urljoin
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse
 
-from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright
+from . import constants, snapshot_assets, snapshot_store
 
 if TYPE_CHECKING:
     pass
@@ -37,17 +38,330 @@ def sanitize_filename(title: str, max_length: int = 100) -> str:
     return sanitized or "webpage"
 
 
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+class BrowserPool:
+    """Long-lived headless browser shared by all webpage snapshots.
+
+    Playwright runs on a dedicated event-loop thread, so snapshots can be
+    requested from any thread. The browser is launched on first use, at most
+    ``max_pages`` pages are open at once, and the browser is replaced after it
+    has served ``recycle_after`` pages or when it disconnects (crash). Each
+    snapshot gets its own browser context, so cookies and storage do not leak
+    between sites.
+    """
+
+    def __init__(
+        self,
+        max_pages: int = constants.DEFAULT_SNAPSHOT_CONCURRENCY,
+        recycle_after: int = constants.DEFAULT_SNAPSHOT_RECYCLE_PAGES,
+    ):
+        self.max_pages = max(1, max_pages)
+        self.recycle_after = max(1, recycle_after)
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+
+        # Only touched on the pool's event loop
+        self._playwright = None
+        self._browser = None
+        self._pages_served = 0
+        self._active: Dict[Any, int] = {}  # browser -> open pages
+        self._browser_lock: Optional[asyncio.Lock] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+        self.launches = 0
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._thread_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def run_loop():
+                    asyncio.set_event_loop(loop)
+                    self._browser_lock = asyncio.Lock()
+                    self._slots = asyncio.Semaphore(self.max_pages)
+                    ready.set()
+                    loop.run_forever()
+
+                self._thread = threading.Thread(
+                    target=run_loop, name="snapshot-browser", daemon=True
+                )
+                self._thread.start()
+                ready.wait()
+                self._loop = loop
+            return self._loop
+
+    def run(self, coroutine, timeout: Optional[float] = None):
+        """Run a coroutine on the pool's event loop and wait for its result."""
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(coroutine, loop).result(timeout)
+
+    async def _acquire_browser(self):
+        """Return a connected browser, launching or recycling it as needed."""
+        async with self._browser_lock:
+            browser = self._browser
+            if browser is not None and (
+                not browser.is_connected() or self._pages_served >= self.recycle_after
+            ):
+                self._browser = None
+                if not self._active.get(browser):
+                    await self._close_browser(browser)
+
+            if self._browser is None:
+                if self._playwright is None:
+                    from playwright.async_api import async_playwright
+
+                    self._playwright = await async_playwright().start()
+                # Use WebKit (lighter); PDFs rendered via xhtml2pdf
+                self._browser = await self._playwright.webkit.launch(headless=True)
+                self._pages_served = 0
+                self.launches += 1
+
+            self._pages_served += 1
+            browser = self._browser
+            self._active[browser] = self._active.get(browser, 0) + 1
+            return browser
+
+    async def _release_browser(self, browser):
+        async with self._browser_lock:
+            self._active[browser] -= 1
+            # Close retired browsers once their last page is done
+            if browser is not self._browser and not self._active[browser]:
+                await self._close_browser(browser)
+
+    async def _close_browser(self, browser):
+        self._active.pop(browser, None)
+        try:
+            await browser.close()
+        except Exception:
+            pass
+
+    @asynccontextmanager
+    async def page(self):
+        """Open a page in a fresh context, waiting for a free slot."""
+        async with self._slots:
+            browser = await self._acquire_browser()
+            context = None
+            try:
+                context = await browser.new_context()
+                page = await context.new_page()
+                yield page
+            finally:
+                if context is not None:
+                    try:
+                        await context.close()
+                    except Exception:
+                        pass
+                await self._release_browser(browser)
+
+    async def _shutdown(self):
+        browsers = set(self._active)
+        if self._browser is not None:
+            browsers.add(self._browser)
+        self._browser = None
+        for browser in browsers:
+            await self._close_browser(browser)
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    def close(self, timeout: float = 10):
+        """Close the browser and stop the event-loop thread."""
+        with self._thread_lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(timeout)
+        except Exception:
+            pass
+        loop.call_soon_threadsafe(loop.stop)
+
+
+_pool: Optional[BrowserPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """Return the process-wide browser pool, configured from the environment."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = BrowserPool(
+                    max_pages=_env_int(
+                        "PAPERCLI_SNAPSHOT_CONCURRENCY",
+                        constants.DEFAULT_SNAPSHOT_CONCURRENCY,
+                    ),
+                    recycle_after=_env_int(
+                        "PAPERCLI_SNAPSHOT_RECYCLE_PAGES",
+                        constants.DEFAULT_SNAPSHOT_RECYCLE_PAGES,
+                    ),
+                )
+                atexit.register(_pool.close)
+    return _pool
+
+
+def _reserve_snapshot_path(html_output_dir: Path, title: str) -> Path:
+    """Create an empty, uniquely named snapshot file and return its path."""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    base_name = f"{sanitize_filename(title)}_{timestamp}"
+    extension = snapshot_store.snapshot_extension()
+    suffix = 0
+    while True:
+        stem = base_name if not suffix else f"{base_name}_{suffix}"
+        path = html_output_dir / f"{stem}{extension}"
+        try:
+            with open(path, "x", encoding="utf-8"):
+                return path
+        except FileExistsError:
+            suffix += 1
+
+
+_CSS_URL_PATTERN = re.compile(r"url\(([^)]+)\)", re.IGNORECASE)
+
+
+def _strip_quotes(s: str) -> str:
+    return s.strip().strip('"').strip("'")
+
+
+def _css_urls(css_text: str) -> set:
+    """url(...) references in a CSS block, excluding data URLs."""
+    urls = set()
+    for m in _CSS_URL_PATTERN.finditer(css_text or ""):
+        u = _strip_quotes(m.group(1))
+        if u and not u.startswith("data:"):
+            urls.add(u)
+    return urls
+
+
+def _absolutize_css_urls(css_text: str, base_url: str) -> str:
+    """Rewrite relative url(...) references in CSS against ``base_url``."""
+
+    def replacer(m: re.Match) -> str:
+        inner = _strip_quotes(m.group(1))
+        if not inner or inner.startswith("data:"):
+            return m.group(0)
+        return f'url("{urljoin(base_url, inner)}")'
+
+    try:
+        return _CSS_URL_PATTERN.sub(replacer, css_text)
+    except Exception:
+        return css_text
+
+
+def _style_text(style_tag) -> str:
+    return style_tag.string if style_tag.string is not None else style_tag.get_text()
+
+
+def _parse_css_refs(html: str) -> tuple:
+    """Parse a page and collect the url(...) references of its inline CSS."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+    style_tags = soup.find_all("style")
+    styled_elements = soup.find_all(style=True)
+
+    refs = set()
+    for style_tag in style_tags:
+        refs |= _css_urls(_style_text(style_tag))
+    for el in styled_elements:
+        refs |= _css_urls(el.get("style", ""))
+    return soup, style_tags, styled_elements, list(refs)
+
+
+def _replace_css_refs(soup, style_tags, styled_elements, mapping: dict) -> str:
+    """Point url(...) references at their data URLs and serialize the page."""
+    if not mapping:
+        return str(soup)
+
+    def inline_css_block(css_text: str) -> str:
+        def replacer(m: re.Match) -> str:
+            repl = mapping.get(_strip_quotes(m.group(1)))
+            if repl:
+                return f'url("{repl}")'
+            return m.group(0)
+
+        try:
+            return _CSS_URL_PATTERN.sub(replacer, css_text)
+        except Exception:
+            return css_text
+
+    # Inline <style> tag contents
+    for style_tag in style_tags:
+        try:
+            new_css = inline_css_block(_style_text(style_tag))
+            if style_tag.string is not None:
+                style_tag.string.replace_with(new_css)
+            else:
+                style_tag.clear()
+                style_tag.append(new_css)
+        except Exception:
+            continue
+
+    # Inline style attributes
+    for el in styled_elements:
+        try:
+            el["style"] = inline_css_block(el.get("style", ""))
+        except Exception:
+            continue
+
+    return str(soup)
+
+
+async def _inline_css_urls_on_html(
+    html: str, base_url: str, request, fetcher: snapshot_assets.AssetFetcher
+) -> str:
+    """Inline url(...) resources of <style> tags and style attributes.
+
+    All referenced resources are collected first and fetched concurrently.
+    Parsing and serializing the page run in a worker thread, so the shared
+    browser loop keeps serving other snapshots meanwhile.
+    """
+    loop = asyncio.get_running_loop()
+    soup, style_tags, styled_elements, refs = await loop.run_in_executor(
+        None, _parse_css_refs, html
+    )
+
+    data_urls = await asyncio.gather(
+        *(
+            fetcher.data_url(
+                request,
+                urljoin(base_url, ref),
+                image=(mimetypes.guess_type(ref.split("?")[0])[0] or "").startswith(
+                    "image/"
+                ),
+            )
+            for ref in refs
+        )
+    )
+    mapping = {ref: data_url for ref, data_url in zip(refs, data_urls) if data_url}
+    return await loop.run_in_executor(
+        None, _replace_css_refs, soup, style_tags, styled_elements, mapping
+    )
+
+
 class WebpageSnapshotService:
     """Service for snapshotting webpages using Playwright."""
 
     def __init__(self, app=None):
         self.app = app
+        self.pool = get_browser_pool()
 
     async def _snapshot_webpage_async(
         self,
         url: str,
         title: str,
         html_output_dir: Path,
+        fetcher: Optional[snapshot_assets.AssetFetcher] = None,
     ) -> Tuple[str, str]:
         """
         Snapshot a webpage to HTML format using Playwright's async API.
@@ -56,30 +370,24 @@ class WebpageSnapshotService:
             url: The URL to snapshot
             title: The page title for filename generation
             html_output_dir: Directory for HTML snapshots
+            fetcher: Asset fetcher shared by the snapshot run (created if omitted)
 
         Returns:
             Tuple of (html_path, page_content)
         """
         html_output_dir = Path(html_output_dir)
+        fetcher = fetcher or snapshot_assets.AssetFetcher()
 
         html_output_dir.mkdir(parents=True, exist_ok=True)
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        sanitized_title = sanitize_filename(title)
-
-        html_filename = f"{sanitized_title}_{timestamp}.html"
-
-        html_path = html_output_dir / html_filename
+        html_path = _reserve_snapshot_path(html_output_dir, title)
+        html_filename = html_path.name
 
         if self.app:
             self.app._add_log("webpage_snapshot_start", f"Snapshotting webpage: {url}")
 
         try:
-            async with async_playwright() as p:
-                # Use WebKit (lighter); PDFs rendered via xhtml2pdf
-                browser = await p.webkit.launch(headless=True)
-                page = await browser.new_page()
-
+            async with self.pool.page() as page:
                 if self.app:
                     self.app._add_log(
                         "webpage_snapshot_loading", f"Loading page: {url}"
@@ -96,19 +404,26 @@ class WebpageSnapshotService:
                 except Exception:
                     pass
 
+                request = page.context.request
+
                 # Inline external stylesheets for better offline fidelity
                 try:
                     stylesheet_urls = await page.eval_on_selector_all(
                         'link[rel="stylesheet"]', "els => els.map(e => e.href)"
                     )
-                    for href in stylesheet_urls:
+                    css_texts = await asyncio.gather(
+                        *(fetcher.text(request, href) for href in stylesheet_urls)
+                    )
+                    for href, css_text in zip(stylesheet_urls, css_texts):
+                        if css_text is None:
+                            # Skip broken styles, keep going
+                            continue
                         try:
-                            resp = await page.context.request.get(href)
-                            if resp.ok:
-                                css_text = await resp.text()
-                                await page.add_style_tag(content=css_text)
+                            # Relative url(...) references are relative to the stylesheet
+                            await page.add_style_tag(
+                                content=_absolutize_css_urls(css_text, href)
+                            )
                         except Exception:
-                            # Skip broken styles, keep going
                             continue
                     # Remove original link tags to avoid external fetches when offline
                     await page.evaluate(
@@ -124,20 +439,18 @@ class WebpageSnapshotService:
                         "img[src]",
                         'els => els.map(e => new URL(e.getAttribute("src"), document.baseURI).href)',
                     )
-                    mapping = {}
-                    for img_url in img_urls:
-                        try:
-                            resp = await page.context.request.get(img_url)
-                            if not resp.ok:
-                                continue
-                            content_type = resp.headers.get(
-                                "content-type", "application/octet-stream"
-                            )
-                            data = await resp.body()
-                            b64 = base64.b64encode(data).decode("ascii")
-                            mapping[img_url] = f"data:{content_type};base64,{b64}"
-                        except Exception:
-                            continue
+                    img_urls = list(dict.fromkeys(img_urls))
+                    data_urls = await asyncio.gather(
+                        *(
+                            fetcher.data_url(request, img_url, image=True)
+                            for img_url in img_urls
+                        )
+                    )
+                    mapping = {
+                        img_url: data_url
+                        for img_url, data_url in zip(img_urls, data_urls)
+                        if data_url
+                    }
                     if mapping:
                         await page.evaluate(
                             '(map) => { Array.from(document.querySelectorAll("img[src]")).forEach(img => { const abs = new URL(img.getAttribute("src"), document.baseURI).href; if (map[abs]) img.setAttribute("src", map[abs]); }); }',
@@ -149,94 +462,39 @@ class WebpageSnapshotService:
 
                 # Get HTML and further inline CSS url(...) from <style> tags and style="..."
                 raw_html = await page.content()
+                page_content = await _inline_css_urls_on_html(
+                    raw_html, url, request, fetcher
+                )
 
-                def _strip_quotes(s: str) -> str:
-                    s = s.strip().strip('"').strip("'")
-                    return s
-
-                async def _inline_css_urls_on_html(html: str) -> str:
-                    soup = BeautifulSoup(html, "html.parser")
-                    css_regex = re.compile(r"url\(([^)]+)\)", re.IGNORECASE)
-
-                    async def inline_css_block(css_text: str) -> str:
-                        if not css_text:
-                            return css_text
-                        urls = set()
-                        for m in css_regex.finditer(css_text):
-                            u = _strip_quotes(m.group(1))
-                            if not u or u.startswith("data:"):
-                                continue
-                            urls.add(u)
-
-                        mapping = {}
-                        for u in urls:
-                            try:
-                                abs_url = urljoin(url, u)
-                                resp = await page.context.request.get(abs_url)
-                                if not resp.ok:
-                                    continue
-                                content_type = (
-                                    resp.headers.get("content-type")
-                                    or mimetypes.guess_type(abs_url)[0]
-                                    or "application/octet-stream"
-                                )
-                                data = await resp.body()
-                                b64 = base64.b64encode(data).decode("ascii")
-                                mapping[u] = f"data:{content_type};base64,{b64}"
-                            except Exception:
-                                continue
-
-                        def replacer(m: re.Match) -> str:
-                            inner = _strip_quotes(m.group(1))
-                            repl = mapping.get(inner)
-                            if repl:
-                                return f'url("{repl}")'
-                            return m.group(0)
-
-                        try:
-                            return css_regex.sub(replacer, css_text)
-                        except Exception:
-                            return css_text
-
-                    # Inline <style> tag contents
-                    for style_tag in soup.find_all("style"):
-                        try:
-                            css_text = (
-                                style_tag.string
-                                if style_tag.string is not None
-                                else style_tag.get_text()
-                            )
-                            new_css = await inline_css_block(css_text)
-                            if style_tag.string is not None:
-                                style_tag.string.replace_with(new_css)
-                            else:
-                                style_tag.clear()
-                                style_tag.append(new_css)
-                        except Exception:
-                            continue
-
-                    # Inline style attributes
-                    for el in soup.find_all(style=True):
-                        try:
-                            css_text = el.get("style", "")
-                            new_css = await inline_css_block(css_text)
-                            el["style"] = new_css
-                        except Exception:
-                            continue
-
-                    return str(soup)
-
-                page_content = await _inline_css_urls_on_html(raw_html)
-
-                with open(html_path, "w", encoding="utf-8") as f:
-                    f.write(page_content)
+                # Compressing a page with inlined assets takes a while; keep the
+                # browser loop free for the other pages in the run
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(
+                    None, snapshot_store.write_snapshot, str(html_path), page_content
+                )
+                try:
+                    await loop.run_in_executor(
+                        None,
+                        snapshot_store.save_snapshot_text,
+                        str(html_path),
+                        page_content,
+                    )
+                except Exception as e:
+                    # Readers extract the text themselves if the sidecar is missing
+                    if self.app:
+                        self.app._add_log(
+                            "webpage_snapshot_text_error",
+                            f"Failed to store snapshot text: {e}",
+                        )
 
                 if self.app:
                     self.app._add_log(
                         "webpage_snapshot_html", f"HTML snapshot saved: {html_filename}"
                     )
-
-                await browser.close()
+                    self.app._add_log(
+                        "webpage_snapshot_assets",
+                        f"Asset fetches so far in this run: {fetcher.format_stats()}",
+                    )
 
                 if self.app:
                     self.app._add_log(
@@ -246,6 +504,11 @@ class WebpageSnapshotService:
                 return str(html_path), page_content
 
         except Exception as e:
+            try:
+                if not html_path.stat().st_size:
+                    html_path.unlink()
+            except OSError:
+                pass
             if self.app:
                 self.app._add_log(
                     "webpage_snapshot_error",
@@ -263,33 +526,84 @@ class WebpageSnapshotService:
         html_output_dir: Path,
     ) -> Tuple[str, str]:
         """
-        Synchronous wrapper that safely runs the async snapshot in or out of an event loop.
+        Synchronous wrapper that runs the snapshot on the shared browser pool.
+
+        Safe to call from any thread, including one with a running event loop.
 
         Returns:
             Tuple of (html_path, page_content)
         """
-        try:
-            # If there is a running loop, run the async task in a separate thread
-            loop = asyncio.get_running_loop()
+        return self.pool.run(
+            self._snapshot_webpage_async(
+                url=url,
+                title=title,
+                html_output_dir=html_output_dir,
+            )
+        )
+
+    def snapshot_many(
+        self,
+        urls: List[str],
+        html_output_dir: Path,
+        titles: Optional[Dict[str, str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Snapshot several webpages in parallel on the shared browser pool.
 
-            def runner() -> Tuple[str, str]:
-                return asyncio.run(
+        At most PAPERCLI_SNAPSHOT_CONCURRENCY pages load at once. A failed page
+        does not stop the others.
+
+        Args:
+            urls: The URLs to snapshot
+            html_output_dir: Directory for HTML snapshots
+            titles: Optional URL -> title mapping for filenames (defaults to
+                the URL's host and path)
+
+        Returns:
+            One dict per URL, in order, with url, html_path, content and error
+            (None on success)
+        """
+        titles = titles or {}
+        # One fetcher for the batch, so shared assets are fetched once
+        fetcher = snapshot_assets.AssetFetcher()
+
+        def default_title(url: str) -> str:
+            parsed = urlparse(url)
+            return f"{parsed.netloc}{parsed.path}".replace("/", " ") or "webpage"
+
+        async def snapshot_all():
+            return await asyncio.gather(
+                *(
                     self._snapshot_webpage_async(
                         url=url,
-                        title=title,
+                        title=titles.get(url) or default_title(url),
                         html_output_dir=html_output_dir,
+                        fetcher=fetcher,
                     )
-                )
+                    for url in urls
+                ),
+                return_exceptions=True,
+            )
 
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(runner)
-                return future.result()
-        except RuntimeError:
-            # No running loop; safe to run directly
-            return asyncio.run(
-                self._snapshot_webpage_async(
-                    url=url,
-                    title=title,
-                    html_output_dir=html_output_dir,
+        results = []
+        for url, outcome in zip(urls, self.pool.run(snapshot_all())):
+            if isinstance(outcome, BaseException):
+                results.append(
+                    {
+                        "url": url,
+                        "html_path": None,
+                        "content": None,
+                        "error": str(outcome),
+                    }
                 )
-            )
+            else:
+                html_path, content = outcome
+                results.append(
+                    {
+                        "url": url,
+                        "html_path": html_path,
+                        "content": content,
+                        "error": None,
+                    }
+                )
+        return results
@@ -11,7 +11,6 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
-import requests
 from packaging import version
 
 
@@ -44,6 +43,8 @@ class VersionManager:
 
     def get_latest_version(self) -> Optional[str]:
         """Get the latest version from GitHub releases."""
+        import requests
+
         try:
             url = f"https://api.github.com/repos/{self.github_repo}/releases/latest"
             response = requests.get(url, timeout=10)
@@ -16,6 +16,7 @@ class CustomHeader(Static):
     total_papers = reactive(0)
     current_position = reactive(1)
     selected_count = reactive(0)
+    refreshing = reactive(False)
 
     DEFAULT_CSS = """
     CustomHeader {
@@ -78,14 +79,23 @@ class CustomHeader(Static):
         """Update display when selected count changes."""
         self._update_status_display()
 
+    def watch_refreshing(self, refreshing: bool) -> None:
+        """Update display when the list starts or stops refreshing."""
+        self._update_status_display()
+
     def _update_status_display(self) -> None:
         """Update the status display text."""
         status_display = self.query_one("#status-display")
         status_text = f"Total: {self.total_papers}  Current: {self.current_position}  Selected: {self.selected_count}"
+        if self.refreshing:
+            status_text = f"↻ Refreshing…  {status_text}"
         status_display.update(status_text)
 
-    def update_stats(self, total: int, current: int, selected: int) -> None:
+    def update_stats(
+        self, total: int, current: int, selected: int, refreshing: bool = False
+    ) -> None:
         """Update all statistics at once."""
         self.total_papers = total
         self.current_position = current
         self.selected_count = selected
+        self.refreshing = refreshing
@@ -1,4 +1,4 @@
-from typing import List, Optional, Set
+from typing import List, Optional, Sequence, Set
 
 from rich.text import Text
 from textual import events
@@ -6,7 +6,7 @@ from textual.message import Message
 from textual.widgets import DataTable
 
 from ng.db.models import Paper
-from ng.services import theme
+from ng.services import row_cache, theme
 
 
 class PaperList(DataTable):
@@ -34,7 +34,13 @@ class PaperList(DataTable):
     }
     """
 
-    def __init__(self, papers: List[Paper], *args, **kwargs):
+    def __init__(
+        self,
+        papers: List[Paper],
+        *args,
+        cached_rows: Optional[List[row_cache.Row]] = None,
+        **kwargs,
+    ):
         super().__init__(
             show_header=True,
             zebra_stripes=True,
@@ -44,6 +50,8 @@ class PaperList(DataTable):
             **kwargs,
         )
         self.papers = papers or []
+        # Rows from the last session, shown until the live papers arrive
+        self.cached_rows = [] if self.papers else list(cached_rows or [])
         self.selected_paper_ids: Set[int] = set()  # For select mode
         self.in_select_mode: bool = False
         self.current_paper_id: Optional[int] = (
@@ -261,7 +269,12 @@ class PaperList(DataTable):
 
     def _prepare_row_data(self, paper: "Paper") -> tuple:
         """Prepare formatted row data for a paper."""
-        is_selected = paper.id in self.selected_paper_ids
+        return self._format_row(paper.id, row_cache.row_fields(paper))
+
+    def _format_row(self, paper_id: int, fields: Sequence[str]) -> tuple:
+        """Truncate and style the display fields of a row."""
+        title_text, authors_text, year_text, venue_text, collections = fields
+        is_selected = paper_id in self.selected_paper_ids
         should_highlight = self.in_select_mode and is_selected
 
         # Selection indicator - use theme-appropriate colors
@@ -286,7 +299,6 @@ class PaperList(DataTable):
             collections_width = 20
 
         # Title
-        title_text = paper.title
         if len(title_text) > title_width:
             title_text = title_text[: title_width - 3] + "..."
         title = (
@@ -296,7 +308,6 @@ class PaperList(DataTable):
         )
 
         # Authors
-        authors_text = paper.author_names or "Unknown Authors"
         if len(authors_text) > authors_width:
             authors_text = authors_text[: authors_width - 3] + "..."
         authors = (
@@ -306,7 +317,6 @@ class PaperList(DataTable):
         )
 
         # Year
-        year_text = str(paper.year) if paper.year else "—"
         year = (
             Text(str(year_text), style=self._get_selection_style())
             if should_highlight
@@ -314,7 +324,6 @@ class PaperList(DataTable):
         )
 
         # Venue
-        venue_text = paper.venue_acronym or paper.venue_full or "—"
         if len(venue_text) > venue_width:
             venue_text = venue_text[: venue_width - 3] + "..."
         venue = (
@@ -324,19 +333,8 @@ class PaperList(DataTable):
         )
 
         # Collections
-        collections = ""
-        try:
-            if hasattr(paper, "collections") and paper.collections:
-                collection_names = [c.name for c in paper.collections]
-                collections = ", ".join(collection_names)
-                if len(collections) > collections_width:
-                    collections = collections[: collections_width - 3] + "..."
-        except Exception:
-            collections = "—"
-
-        if not collections:
-            collections = "—"
-
+        if len(collections) > collections_width:
+            collections = collections[: collections_width - 3] + "..."
         collections = (
             Text(str(collections), style=self._get_selection_style())
             if should_highlight
@@ -389,22 +387,18 @@ class PaperList(DataTable):
         saved_cursor = self.cursor_row
         self.clear(columns=False)
 
-        for paper in self.papers:
-            selection_indicator, title, authors, year, venue, collections = (
-                self._prepare_row_data(paper)
-            )
-            self.add_row(
-                selection_indicator,
-                title,
-                authors,
-                year,
-                venue,
-                collections,
-                key=str(paper.id),
-            )
+        if self.cached_rows:
+            rows = (self._format_row(row[0], row[1:]) for row in self.cached_rows)
+            keys = (str(row[0]) for row in self.cached_rows)
+        else:
+            rows = (self._prepare_row_data(paper) for paper in self.papers)
+            keys = (str(paper.id) for paper in self.papers)
+
+        for row, key in zip(rows, keys):
+            self.add_row(*row, key=key)
 
         # Restore cursor position after rebuild
-        if 0 <= saved_cursor < len(self.papers):
+        if 0 <= saved_cursor < self.row_count:
             self.move_cursor(row=saved_cursor)
 
     def update_table(self) -> None:
@@ -448,15 +442,29 @@ class PaperList(DataTable):
                 return current_papers
             return []
 
+    @property
+    def is_refreshing(self) -> bool:
+        """Whether the table still shows cached rows from the last session."""
+        return bool(self.cached_rows)
+
     def set_papers(self, papers: List[Paper]) -> None:
         """Sets the papers for the table and updates the display."""
+        # Keep the cursor on the same paper when live papers replace cached rows
+        cursor_paper_id = None
+        if 0 <= self.cursor_row < len(self.cached_rows):
+            cursor_paper_id = self.cached_rows[self.cursor_row][0]
+        self.cached_rows = []
+
         self.papers = papers or []
         self.selected_paper_ids.clear()
         self.current_paper_id = None
         self.in_select_mode = False
         self.populate_table()
         if self.papers:
-            self.move_cursor(row=0)
+            row = next(
+                (i for i, p in enumerate(self.papers) if p.id == cursor_paper_id), 0
+            )
+            self.move_cursor(row=row)
 
     def on_resize(self) -> None:
         """Handle resize events to adjust column widths."""
@@ -553,11 +561,11 @@ class PaperList(DataTable):
 
     def move_down(self) -> None:
         """Move cursor down."""
-        if self.cursor_row < len(self.papers) - 1:
+        if self.cursor_row < self.row_count - 1:
             self.move_cursor(row=self.cursor_row + 1)
             self._update_current_paper()
             self.post_message(self.StatsChanged())
-        elif self.papers and self.cursor_row == -1:
+        elif self.row_count and self.cursor_row == -1:
             self.move_cursor(row=0)
             self._update_current_paper()
             self.post_message(self.StatsChanged())
@@ -573,22 +581,22 @@ class PaperList(DataTable):
     def move_page_down(self) -> None:
         """Move cursor down by a page (approximately 10 items)."""
         page_size = 10
-        new_row = min(len(self.papers) - 1, self.cursor_row + page_size)
+        new_row = min(self.row_count - 1, self.cursor_row + page_size)
         self.move_cursor(row=new_row)
         self._update_current_paper()
         self.post_message(self.StatsChanged())
 
     def move_to_top(self) -> None:
         """Move cursor to the first item."""
-        if self.papers:
+        if self.row_count:
             self.move_cursor(row=0)
             self._update_current_paper()
             self.post_message(self.StatsChanged())
 
     def move_to_bottom(self) -> None:
         """Move cursor to the last item."""
-        if self.papers:
-            self.move_cursor(row=len(self.papers) - 1)
+        if self.row_count:
+            self.move_cursor(row=self.row_count - 1)
             self._update_current_paper()
             self.post_message(self.StatsChanged())
 